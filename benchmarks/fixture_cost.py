@@ -0,0 +1,208 @@
+"""
+Fixture cost benchmarks for the driver layer and login.
+
+Runs `ChromeBrowser.launch_browser`, `FirefoxBrowser.launch_browser`, `EdgeBrowser.launch_browser`,
+`create_context` (desktop and the mobile `DEVICE_NAME` emulation path) and `LoginPage.login`
+repeatedly against the local Swag Labs stand-in, reports their distributions and compares them
+with a stored JSON baseline:
+
+    python -m benchmarks.fixture_cost --iterations 20
+    python -m benchmarks.fixture_cost --update-baseline
+    python -m benchmarks.fixture_cost --threshold 0.25
+
+The command exits with status 1 when a benchmark's p50 regresses past the threshold.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from playwright.async_api import Error
+from drivers.browser_factory import BrowserFactory
+from drivers.playwright_runtime import PlaywrightRuntime
+from pages.login_page import LoginPage
+from config import config
+from stand_in.server import StandInServer
+from utilities import utils
+from utilities.logger import Logger
+from utilities.step_retry import FlakyStepError
+
+logger = Logger(__name__)
+BENCHMARKS = ("launch_chrome", "launch_firefox", "launch_edge",
+              "create_context", "create_context_mobile", "login")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "baselines", "fixture_cost.json")
+
+
+async def measure(action, iterations: int, warmup: int) -> list[float]:
+    """
+    Runs an async benchmark action repeatedly and collects its measurements.
+
+    Args:
+        action: An async callable that times the operation under test itself and returns
+                the duration in milliseconds and an async cleanup callable, which runs
+                outside the measured time.
+        iterations (int): The number of measured runs.
+        warmup (int): The number of unmeasured runs before them.
+
+    Returns:
+        list[float]: The duration of each measured run in milliseconds.
+    """
+    durations = []
+    for run in range(warmup + iterations):
+        elapsed, cleanup = await action()
+        await cleanup()
+        if run >= warmup:
+            durations.append(elapsed)
+    return durations
+
+
+async def run_benchmarks(names: list[str], iterations: int, warmup: int) -> dict:
+    """
+    Runs the selected benchmarks against a freshly started stand-in server.
+
+    Args:
+        names (list[str]): The benchmarks to run.
+        iterations (int): The number of measured runs per benchmark.
+        warmup (int): The number of unmeasured runs per benchmark.
+
+    Returns:
+        dict: The distribution summary per benchmark, or the error for benchmarks that
+              could not run (e.g. a browser that is not installed).
+    """
+    server = StandInServer()
+    url = server.start()
+    runtime = PlaywrightRuntime.get_instance()
+    await runtime.start()
+    results = {}
+    try:
+        for name in names:
+            try:
+                durations = await measure(
+                    await _benchmark(name, url), iterations, warmup)
+            except (Error, FlakyStepError) as e:
+                logger.warning(f"Benchmark {name} could not run: {str(e)}")
+                results[name] = {"error": str(e).splitlines()[0]}
+                continue
+            results[name] = {**utils.summarize(durations), "min": min(durations)}
+            logger.info(f"Benchmark {name}: {results[name]}")
+    finally:
+        await runtime.stop()
+        server.stop()
+    return results
+
+
+async def _benchmark(name: str, url: str):
+    if name.startswith("launch_"):
+        driver = BrowserFactory.get_browser(name.removeprefix("launch_"), headless=True)
+
+        async def launch():
+            start = time.perf_counter()
+            browser = await driver.launch_browser()
+            return (time.perf_counter() - start) * 1000, browser.close
+        return launch
+
+    driver = BrowserFactory.get_browser(
+        "chrome", headless=True, mobile=name == "create_context_mobile")
+    browser = await driver.launch_browser()
+
+    async def create_context():
+        start = time.perf_counter()
+        context = await driver.create_context(browser)
+        return (time.perf_counter() - start) * 1000, context.close
+
+    async def login():
+        context = await driver.create_context(browser)
+        login_page = LoginPage(await context.new_page())
+        await login_page.navigate(url)
+        start = time.perf_counter()
+        await login_page.login(config.USER_USERNAME, config.USER_PASSWORD)
+        logged_in = await login_page.is_logged_in()
+        elapsed = (time.perf_counter() - start) * 1000
+        if not logged_in:
+            await context.close()
+            raise Error(f"Login failed for user {config.USER_USERNAME}")
+        return elapsed, context.close
+
+    return login if name == "login" else create_context
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compares the p50 of every benchmark with its baseline.
+
+    Args:
+        results (dict): The current results per benchmark.
+        baseline (dict): The baseline results per benchmark.
+        threshold (float): The allowed relative slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        list[str]: A description of every benchmark that regressed past the threshold.
+    """
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name, {}).get("p50")
+        if "p50" not in result or not expected:
+            continue
+        if result["p50"] > expected * (1 + threshold):
+            regressions.append(
+                f"{name}: p50 {result['p50']:.1f} ms vs baseline {expected:.1f} ms "
+                f"(+{(result['p50'] / expected - 1) * 100:.0f}%, allowed +{threshold * 100:.0f}%)")
+    return regressions
+
+
+def main() -> int:
+    """
+    Parses the command line, runs the benchmarks, stores the results and checks them
+    against the baseline.
+
+    Returns:
+        int: The process exit status, 1 when a regression was found.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark driver and login fixture costs.")
+    parser.add_argument("--iterations", type=int, default=10, help="Measured runs per benchmark.")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured runs per benchmark.")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS),
+                        help="Benchmarks to run.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file.")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store these results as the new baseline instead of comparing.")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative p50 slowdown before failing.")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmarks(args.only, args.iterations, args.warmup))
+    report = {"iterations": args.iterations, "warmup": args.warmup, "benchmarks": results}
+
+    output = utils.get_worker_file_path(config.METRICS_DIR, "fixture-cost.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    for name, result in results.items():
+        print(f"{name:24} " + ("  ".join(f"{key}={value:.1f}" for key, value in result.items()
+                                        if key != "count") if "error" not in result
+                               else f"skipped: {result['error']}"))
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --update-baseline to create one")
+        return 0
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)["benchmarks"]
+    regressions = find_regressions(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Startup and first-navigation benchmark of the launch profiles.
+
+For every profile, Chrome is launched repeatedly and a fresh context navigates to the site
+once, as a pooled browser does for its first test. Profiles with a warm profile directory are
+also launched on it persistently after a priming navigation, so their first navigation is
+served from the primed HTTP cache. Startup lasts until the browser has a page to navigate
+with, i.e. the launch plus the new context and page, or the persistent launch and its first
+page, and the first navigation is the `goto` alone, so cold and warm measure the same spans.
+Without `--url` the navigation goes to a freshly started local stand-in server:
+
+    python -m benchmarks.launch_profiles --iterations 5
+    python -m benchmarks.launch_profiles --profiles ci-fast faithful \
+        --url https://www.saucedemo.com/
+
+The report holds the p50/p95/max of every measurement per profile and the fastest faithful
+profile, and is written to `metrics/launch-profiles.json`. Profiles that cannot launch here,
+e.g. `debug` without a display, are reported as skipped.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from playwright.async_api import Error
+from drivers.chrome_browser import ChromeBrowser
+from drivers.launch_profiles import PROFILES, LaunchProfile
+from drivers.playwright_runtime import PlaywrightRuntime
+from config import config
+from stand_in.server import StandInServer
+from utilities import utils
+from utilities.logger import Logger
+
+logger = Logger(__name__)
+
+
+async def measure_profile(profile: LaunchProfile, url: str, iterations: int) -> dict:
+    """
+    Measures the launch and the first navigation of a profile, cold and, for profiles with
+    a warm profile directory, from the primed persistent profile.
+
+    Args:
+        profile (LaunchProfile): The profile to measure.
+        url (str): The page navigated to.
+        iterations (int): The number of measured launches.
+
+    Returns:
+        dict: The distribution in milliseconds of every measurement.
+    """
+    driver = ChromeBrowser(headless=True, profile=profile)
+    timings = {"startup": [], "first_navigation": []}
+    for _ in range(iterations):
+        start = time.perf_counter()
+        browser = await driver.launch_browser()
+        context = await driver.create_context(browser)
+        page = await context.new_page()
+        launched = time.perf_counter()
+        await page.goto(url)
+        timings["startup"].append((launched - start) * 1000)
+        timings["first_navigation"].append((time.perf_counter() - launched) * 1000)
+        await browser.close()
+
+    if profile.warm_profile:
+        context = await driver.launch_persistent_context()
+        await (context.pages[0] if context.pages else await context.new_page()).goto(url)
+        await context.close()
+        timings.update({"warm_startup": [], "warm_first_navigation": []})
+        for _ in range(iterations):
+            start = time.perf_counter()
+            context = await driver.launch_persistent_context()
+            page = context.pages[0] if context.pages else await context.new_page()
+            launched = time.perf_counter()
+            await page.goto(url)
+            timings["warm_startup"].append((launched - start) * 1000)
+            timings["warm_first_navigation"].append((time.perf_counter() - launched) * 1000)
+            await context.close()
+
+    return {name: utils.summarize(values) for name, values in timings.items()}
+
+
+async def run_profiles(names: list[str], url: str | None, iterations: int) -> dict:
+    """
+    Measures every profile in turn.
+
+    Args:
+        names (list[str]): The profiles to measure.
+        url (str | None): The page navigated to, or None for a local stand-in server.
+        iterations (int): The number of measured launches per profile.
+
+    Returns:
+        dict: The measurements per profile, or the error for profiles that could not launch.
+    """
+    runtime = PlaywrightRuntime.get_instance()
+    await runtime.start()
+    server = None
+    if url is None:
+        server = StandInServer()
+        url = server.start()
+    try:
+        return {name: await _measure_or_skip(name, url, iterations) for name in names}
+    finally:
+        await runtime.stop()
+        if server is not None:
+            server.stop()
+
+
+async def _measure_or_skip(name: str, url: str, iterations: int) -> dict:
+    try:
+        result = await measure_profile(LaunchProfile.get(name), url, iterations)
+    except Error as e:
+        logger.warning(f"Launch profile {name} could not run: {str(e)}")
+        return {"error": str(e).splitlines()[0]}
+    logger.info(f"Launch profile {name}: {result}")
+    return result
+
+
+def fastest_faithful(results: dict) -> str | None:
+    """
+    Picks the faithful profile with the lowest p50 startup plus first navigation, counting
+    the warm launch of profiles that have one.
+
+    Args:
+        results (dict): The measurements per profile.
+
+    Returns:
+        str | None: The profile name, or None when no faithful profile could run.
+    """
+    def cost(result: dict) -> float:
+        prefix = "warm_" if "warm_startup" in result else ""
+        return result[f"{prefix}startup"]["p50"] + result[f"{prefix}first_navigation"]["p50"]
+
+    faithful = {name: cost(result) for name, result in results.items()
+                if "error" not in result and PROFILES[name].faithful}
+    return min(faithful, key=faithful.get) if faithful else None
+
+
+def main() -> int:
+    """
+    Parses the command line, measures the profiles and writes the report.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the browser launch profiles.")
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES),
+                        default=list(PROFILES), help="Profiles to measure.")
+    parser.add_argument("--url", help="Page navigated to. Defaults to a local stand-in.")
+    parser.add_argument("--iterations", type=int, default=5,
+                        help="Measured launches per profile.")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_profiles(args.profiles, args.url, args.iterations))
+    report = {"iterations": args.iterations, "profiles": results,
+              "fastest_faithful": fastest_faithful(results)}
+    output = utils.get_worker_file_path(config.METRICS_DIR, "launch-profiles.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:10} skipped: {result['error']}")
+            continue
+        print(f"{name:10} " + "  ".join(f"{measurement}={summary['p50']:.1f}"
+                                        for measurement, summary in result.items()))
+    print(f"Fastest faithful profile: {report['fastest_faithful'] or 'none could run'}")
+    print(f"Report written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""
+Synthetic load generator driving the page objects with many concurrent sessions.
+
+Each session owns a browser context and runs the login → add items → checkout journey with
+`LoginPage`, `InventoryPage` and `CartPage` in a loop, for a duration or a number of iterations.
+At most `--concurrency` contexts are open at once, sessions start over a ramp-up period, and
+every context blocks images, fonts, media and trackers and is recycled after a few journeys to
+keep the memory per session low. Without `--url` the load goes to a freshly started local
+stand-in server:
+
+    python -m benchmarks.load_generator --sessions 200 --concurrency 100 --duration 120
+    python -m benchmarks.load_generator --url https://staging.example.com/ --iterations 5
+
+The report holds the throughput, the per-step latency percentiles and the error rates, and is
+written to `metrics/load-report.json`. Step retries are turned off for the run, so every failed
+attempt counts as an error and no retry hides in a step's latency.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import NamedTuple
+
+from playwright.async_api import BrowserContext, Error
+from drivers.browser_pool import BrowserPool
+from drivers.playwright_runtime import PlaywrightRuntime
+from drivers.resource_policy import ResourcePolicy
+from pages.cart_page import CartPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from config import config
+from stand_in.server import StandInServer
+from utilities import utils
+from utilities.logger import Logger
+
+logger = Logger(__name__)
+DEFAULT_ITEMS = ("sauce-labs-backpack", "sauce-labs-bike-light")
+JOURNEY_STEPS = ("reset", "login", "add_items", "open_cart", "checkout_info", "finish")
+
+
+class LoadStats:
+    """
+    Collects the step latencies, journey outcomes and errors of every session.
+    """
+
+    def __init__(self):
+        self.steps: dict[str, list[float]] = defaultdict(list)
+        self.journeys = 0
+        self.failures = 0
+        self.step_failures: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.peak_sessions = 0
+        self.active_sessions = 0
+
+    def record_failure(self, step: str, error: Exception) -> None:
+        """
+        Records a journey that failed at the given step.
+
+        Args:
+            step (str): The step that raised.
+            error (Exception): The error raised.
+        """
+        self.failures += 1
+        self.step_failures[step] += 1
+        message = str(error).strip().splitlines()[0] if str(error).strip() else ""
+        self.errors[f"{step}: {type(error).__name__}: {message[:120]}"] += 1
+
+    def report(self, elapsed: float) -> dict:
+        """
+        Summarizes the run.
+
+        Args:
+            elapsed (float): The wall time of the run in seconds.
+
+        Returns:
+            dict: The throughput, the error rates, the latency distribution of every step in
+                  milliseconds and the most frequent errors.
+        """
+        attempts = self.journeys + self.failures
+        return {
+            "elapsed_s": elapsed,
+            "journeys": self.journeys,
+            "failures": self.failures,
+            "peak_sessions": self.peak_sessions,
+            "throughput_per_s": self.journeys / elapsed if elapsed else 0.0,
+            "error_rate": self.failures / attempts if attempts else 0.0,
+            "steps": {step: self._step_report(step) for step in JOURNEY_STEPS
+                      if self.steps[step] or self.step_failures[step]},
+            "errors": dict(self.errors.most_common(10)),
+        }
+
+    def _step_report(self, step: str) -> dict:
+        durations = self.steps[step]
+        failures = self.step_failures[step]
+        result = {"count": 0} if not durations else {
+            **utils.summarize(durations), "p99": utils.percentile(durations, 99)}
+        result["error_rate"] = failures / (len(durations) + failures)
+        return result
+
+
+class LoadRun(NamedTuple):
+    """
+    The settings and shared state of a load run that every session works with: the parsed
+    command line, the base URL under load, the browser pool and resource policy the contexts
+    come from, the bound on open contexts, the `time.monotonic` deadline and the statistics.
+    """
+    args: argparse.Namespace
+    url: str
+    pool: BrowserPool
+    policy: ResourcePolicy
+    semaphore: asyncio.Semaphore
+    deadline: float
+    stats: LoadStats
+
+
+async def run_journey(context: BrowserContext, run: LoadRun) -> bool:
+    """
+    Runs one login → add items → checkout journey in a clean state of the context and records
+    the latency of every step, or the step that failed.
+
+    Args:
+        context (BrowserContext): The session's context.
+        run (LoadRun): The load run, with the URL, the items to buy and the statistics.
+
+    Returns:
+        bool: True if the journey completed, False if a step failed.
+    """
+    page = context.pages[0] if context.pages else await context.new_page()
+    login_page = LoginPage(page)
+    inventory_page = InventoryPage(page)
+    cart_page = CartPage(page)
+
+    async def login():
+        await login_page.login(config.USER_USERNAME, config.USER_PASSWORD)
+        if not await login_page.is_logged_in():
+            raise RuntimeError(f"Login failed for user {config.USER_USERNAME}")
+
+    async def checkout_info():
+        await cart_page.go_to_checkout()
+        await cart_page.fill_checkout_info("Load", "Generator", "12345")
+        await page.wait_for_url("**/checkout-step-two.html")
+
+    async def finish():
+        await cart_page.finish_checkout()
+        await page.wait_for_url("**/checkout-complete.html")
+
+    async def reset():
+        await context.clear_cookies()
+        await login_page.navigate(run.url)
+        await page.evaluate("localStorage.clear()")
+
+    journey = {
+        "reset": reset,
+        "login": login,
+        "add_items": lambda: inventory_page.add_items_to_cart(run.args.items),
+        "open_cart": inventory_page.click_on_shopping_cart,
+        "checkout_info": checkout_info,
+        "finish": finish,
+    }
+    for step in JOURNEY_STEPS:
+        start = time.perf_counter()
+        try:
+            await journey[step]()
+        except (Error, RuntimeError) as e:
+            run.stats.record_failure(step, e)
+            return False
+        run.stats.steps[step].append((time.perf_counter() - start) * 1000)
+    return True
+
+
+async def run_session(index: int, run: LoadRun) -> None:
+    """
+    Runs journeys in a loop until the iteration count or the deadline is reached, holding
+    one of the bounded context slots while running.
+
+    Args:
+        index (int): The session number, used to stagger the start.
+        run (LoadRun): The load run the session belongs to.
+    """
+    args, stats = run.args, run.stats
+    await asyncio.sleep(args.ramp_up * index / args.sessions)
+    iteration = 0
+    while (not args.iterations or iteration < args.iterations) and time.monotonic() < run.deadline:
+        async with run.semaphore:
+            stats.active_sessions += 1
+            stats.peak_sessions = max(stats.peak_sessions, stats.active_sessions)
+            context = None
+            try:
+                context = await run.pool.new_context(
+                    args.browser, device="desktop", service_workers="block",
+                    viewport={"width": 1024, "height": 768})
+                context.set_default_timeout(args.timeout)
+                await run.policy.apply(context)
+                for _ in range(args.recycle_every):
+                    if (args.iterations and iteration >= args.iterations) \
+                            or time.monotonic() >= run.deadline:
+                        break
+                    iteration += 1
+                    if not await run_journey(context, run):
+                        logger.warning(f"Session {index} journey {iteration} failed, "
+                                       "replacing its context")
+                        break
+                    stats.journeys += 1
+            finally:
+                stats.active_sessions -= 1
+                if context is not None:
+                    await run.pool.release_context(context)
+        if args.think_time:
+            await asyncio.sleep(args.think_time / 1000)
+
+
+async def run_load(args: argparse.Namespace) -> dict:
+    """
+    Starts the sessions against the target, or a local stand-in server, and waits for all
+    of them to finish.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+
+    Returns:
+        dict: The load report.
+    """
+    server = None
+    url = args.url
+    if url is None:
+        server = StandInServer()
+        url = server.start()
+    runtime = PlaywrightRuntime.get_instance()
+    run = LoadRun(
+        args=args, url=url,
+        pool=BrowserPool(headless=True, mobile=False, max_contexts=args.max_contexts),
+        policy=ResourcePolicy.from_name("functional"),
+        semaphore=asyncio.Semaphore(args.concurrency),
+        deadline=time.monotonic() + (args.duration or float("inf")),
+        stats=LoadStats())
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(run_session(index, run) for index in range(args.sessions)))
+    finally:
+        elapsed = time.perf_counter() - start
+        await run.pool.close()
+        await runtime.stop()
+        if server is not None:
+            server.stop()
+
+    report = run.stats.report(elapsed)
+    report.update({"url": url, "sessions": args.sessions, "concurrency": args.concurrency})
+    logger.info(f"Load run finished: {report['journeys']} journeys in {elapsed:.1f} s, "
+                f"error rate {report['error_rate']:.2%}")
+    return report
+
+
+def main() -> int:
+    """
+    Parses the command line, runs the load and writes the report.
+
+    Returns:
+        int: The process exit status, 1 when the error rate exceeds `--max-error-rate`.
+    """
+    parser = argparse.ArgumentParser(description="Drive Swag Labs with concurrent sessions.")
+    parser.add_argument("--url", help="Base URL under load. Defaults to a local stand-in.")
+    parser.add_argument("--sessions", type=int, default=10, help="Number of sessions.")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Maximum open contexts. Defaults to the number of sessions.")
+    parser.add_argument("--duration", type=float, default=0,
+                        help="Seconds to run for. 0 runs until --iterations are done.")
+    parser.add_argument("--iterations", type=int, default=0,
+                        help="Journeys per session. 0 runs until --duration is over.")
+    parser.add_argument("--items", nargs="+", default=list(DEFAULT_ITEMS),
+                        help="Ids of the products added to the cart.")
+    parser.add_argument("--browser", default="chrome", choices=("chrome", "firefox", "edge"))
+    parser.add_argument("--ramp-up", type=float, default=5.0,
+                        help="Seconds over which the sessions start.")
+    parser.add_argument("--think-time", type=float, default=0,
+                        help="Milliseconds a session pauses between contexts.")
+    parser.add_argument("--recycle-every", type=int, default=5,
+                        help="Journeys a context runs before it is replaced.")
+    parser.add_argument("--max-contexts", type=int, default=500,
+                        help="Contexts a browser serves before it is relaunched.")
+    parser.add_argument("--timeout", type=float, default=15000,
+                        help="Playwright action timeout in milliseconds.")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="Error rate above which the command fails.")
+    args = parser.parse_args()
+    if not args.duration and not args.iterations:
+        parser.error("one of --duration or --iterations is required")
+    args.concurrency = args.concurrency or args.sessions
+    # Retried steps would turn errors under load into slower successes.
+    config.STEP_RETRIES = 0
+
+    report = asyncio.run(run_load(args))
+    output = utils.get_worker_file_path(config.METRICS_DIR, "load-report.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    print(f"{report['journeys']} journeys, {report['failures']} failed, "
+          f"{report['throughput_per_s']:.2f} journeys/s, "
+          f"error rate {report['error_rate']:.2%}, peak {report['peak_sessions']} sessions")
+    for step, result in report["steps"].items():
+        print(f"{step:16} " + "  ".join(f"{key}={result[key]:.1f}" for key in
+                                        ("p50", "p95", "p99", "max") if key in result)
+              + f"  errors={result['error_rate']:.2%}")
+    for error, count in report["errors"].items():
+        print(f"{count:6}  {error}")
+    print(f"Report written to {output}")
+    return 1 if report["error_rate"] > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,30 +1,123 @@
 
 """
 BROWSER (str): The browser to be used for running tests. Default is "chrome".
-URL (str): The base URL of the application under test. Default is the SauceDemo site.
+URL (str): The base URL of the application under test. Default is the SauceDemo site, or the
+           local stand-in server when LOCAL_SERVER is enabled.
+LOCAL_SERVER (bool): Whether to run the suite against the bundled Swag Labs stand-in server
+                     instead of the internet. Default is False.
+LOCAL_SERVER_PORT (int): The loopback port of the stand-in server. Default is 8765.
 HEADLESS (bool): Whether to run the browser in headless mode. Default is False.
 MOBILE (bool): Whether to simulate a mobile device. If True, DEVICE_NAME must be specified. 
                Default is True.
 DEVICE_NAME (str): The device name to be used when simulating a mobile device (e.g., 'iPhone X', 
                    'Pixel 4'). Default is 'iPhone X'.
+MATRIX (list[str]): Browser × device matrix cells written as 'browser:device' (or 'browser' for
+                    the desktop), comma-separated, e.g. 'chrome:iPhone X,chrome:desktop,
+                    firefox,edge'. Every test runs once per cell. Only Chrome emulates devices.
+                    Default is empty, which runs the single BROWSER/MOBILE/DEVICE_NAME cell.
+LAUNCH_PROFILE (str): The launch profile of the browsers: 'default', 'ci-fast', 'debug' or
+                      'faithful'. Default is 'default', which only applies HEADLESS.
+PROFILE_DIR (str): The directory, relative to the project root, holding the warm persistent
+                   browser profiles. Only `benchmarks/launch_profiles.py` uses them; test
+                   runs never do. Default is 'profiles'.
 LOG_LEVEL (str): The logging level for the test execution (e.g., DEBUG, INFO, WARNING, ERROR).
                  Default is "DEBUG".
 LOG_NAME (str): The name of the log file to store logs. Default is "log_file.log".
+LOG_MAX_BYTES (int): The size at which the log file is rotated and the old one gzipped.
+                     Default is 10 MB.
+LOG_BACKUP_COUNT (int): The number of rotated, gzipped log files to keep. Default is 5.
 USER_USERNAME (str): The username for login during tests. Default is 'standard_user'.
 USER_PASSWORD (str): The password for login during tests. Default is 'secret_sauce'.
+POOL_MAX_CONTEXTS (int): The number of contexts a pooled browser serves before it is recycled.
+                         Default is 50.
+AUTH_STATE_TTL (int): Seconds a cached authenticated storage state stays valid. Default is 540,
+                      just under the 10 minute session cookie lifetime of the site.
+HAR_MODE (str): HAR network caching per flow: 'off', 'record' or 'replay'. Default is 'off'.
+HAR_DIR (str): The directory, relative to the project root, holding the recorded HAR files.
+               Default is 'hars'.
+HAR_NOT_FOUND (str): What replay does with requests missing from the HAR: 'fallback' to the
+                     network or 'abort'. Default is 'fallback'.
+FAILURE_CAPTURE (str): What every test context records and keeps only when the test fails:
+                       'off', 'trace', 'video' or 'all'. Default is 'off'.
+CAPTURE_DIR (str): The directory, relative to the project root, for the traces and videos of
+                   failed tests. Default is 'captures'.
+RESOURCE_POLICY (str): The default resource blocking policy for test contexts: 'none',
+                       'functional' or 'trackers'. Visual tests always use 'none'.
+                       Default is 'functional'.
+STEP_TIMING (bool): Whether to record the duration of every page-object action and write a
+                    p50/p95/max summary per selector and page object. Default is False.
+STEP_RETRIES (int): How often page-object actions called with `idempotent=True` are retried in
+                    the same context before they raise FlakyStepError. 0 disables the retries.
+                    Default is 2.
+STEP_ATTEMPT_TIMEOUT (int): The timeout, in milliseconds, of every attempt of a retried action.
+                            Default is 10000.
+STEP_RETRY_BACKOFF (int): The pause, in milliseconds, before the first retry; it doubles with
+                          every further retry. Default is 250.
+STEP_RETRY_MAX_BACKOFF (int): The longest pause between retries in milliseconds. Default is 2000.
+METRICS_DIR (str): The directory, relative to the project root, for run metrics such as step
+                   timings. Default is 'metrics'.
+VISUAL_DIFF_PROCESSES (int): The size of the process pool running snapshot comparisons.
+                             Default is 2.
+VISUAL_DIFF_HASH_DISTANCE (int): The difference-hash distance (out of 64 bits) above which a
+                                 fail-fast comparison reports a mismatch without diffing
+                                 pixels. Default is 10.
+VISUAL_DIFF_TILE_SIZE (int): The side, in pixels, of the regions mismatches are reported for.
+                             Default is 32.
+VALIDATE_SELECTORS (bool): Whether fixtures check every selector a page object declares for the
+                          screen they open, in one DOM pass, before the test starts.
+                          Default is False.
+ARTIFACT_WRITERS (int): The number of threads writing Allure attachments. Default is 4.
+ARTIFACT_COMPRESS_BYTES (int): The size from which text attachments of types the Allure report
+                               cannot show inline are stored gzip-compressed. Default is 64 KB.
+ARTIFACT_MAX_MB (int): The total size of new attachment files a run may write, shared evenly
+                       by the xdist workers. 0 disables the cap. Default is 1024.
+SCHEDULE_BY_HISTORY (bool): Whether tests are ordered by the durations and setup
+                            states recorded in the pytest cache by previous runs. Default is True.
+WORKERS (int): The number of xdist worker processes used by `-n auto`. Default is 0, which lets
+               xdist use one worker per CPU core.
 """
 import os
 
 
-BROWSER = "chrome"
-URL = "https://www.saucedemo.com/"
+BROWSER = os.environ.get('BROWSER', 'chrome').lower()
+LOCAL_SERVER = os.environ.get('LOCAL_SERVER', 'False').lower() == 'true'
+LOCAL_SERVER_PORT = int(os.environ.get('LOCAL_SERVER_PORT', '8765'))
+URL = f"http://127.0.0.1:{LOCAL_SERVER_PORT}/" if LOCAL_SERVER else "https://www.saucedemo.com/"
 HEADLESS = os.environ.get('HEADLESS', 'False').lower() == 'true'
-MOBILE = True
-DEVICE_NAME = "iPhone X"
+MOBILE = os.environ.get('MOBILE', 'True').lower() == 'true'
+DEVICE_NAME = os.environ.get('DEVICE_NAME', 'iPhone X')
+MATRIX = [cell.strip() for cell in os.environ.get('MATRIX', '').split(',') if cell.strip()]
+LAUNCH_PROFILE = os.environ.get('LAUNCH_PROFILE', 'default').lower()
+PROFILE_DIR = "profiles"
 LOG_LEVEL = "DEBUG"
 LOG_NAME = "log_file.log"
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
 USER_USERNAME = os.getenv("USER_USERNAME")
 USER_PASSWORD = os.getenv("USER_PASSWORD")
+POOL_MAX_CONTEXTS = int(os.environ.get('POOL_MAX_CONTEXTS', '50'))
+AUTH_STATE_TTL = int(os.environ.get('AUTH_STATE_TTL', '540'))
+HAR_MODE = os.environ.get('HAR_MODE', 'off').lower()
+HAR_DIR = "hars"
+HAR_NOT_FOUND = os.environ.get('HAR_NOT_FOUND', 'fallback').lower()
+FAILURE_CAPTURE = os.environ.get('FAILURE_CAPTURE', 'off').lower()
+CAPTURE_DIR = "captures"
+RESOURCE_POLICY = os.environ.get('RESOURCE_POLICY', 'functional').lower()
+STEP_TIMING = os.environ.get('STEP_TIMING', 'False').lower() == 'true'
+STEP_RETRIES = int(os.environ.get('STEP_RETRIES', '2'))
+STEP_ATTEMPT_TIMEOUT = int(os.environ.get('STEP_ATTEMPT_TIMEOUT', '10000'))
+STEP_RETRY_BACKOFF = int(os.environ.get('STEP_RETRY_BACKOFF', '250'))
+STEP_RETRY_MAX_BACKOFF = 2000
+METRICS_DIR = "metrics"
+VISUAL_DIFF_PROCESSES = int(os.environ.get('VISUAL_DIFF_PROCESSES', '2'))
+VISUAL_DIFF_HASH_DISTANCE = 10
+VISUAL_DIFF_TILE_SIZE = 32
+VALIDATE_SELECTORS = os.environ.get('VALIDATE_SELECTORS', 'False').lower() == 'true'
+ARTIFACT_WRITERS = int(os.environ.get('ARTIFACT_WRITERS', '4'))
+ARTIFACT_COMPRESS_BYTES = int(os.environ.get('ARTIFACT_COMPRESS_BYTES', str(64 * 1024)))
+ARTIFACT_MAX_MB = int(os.environ.get('ARTIFACT_MAX_MB', '1024'))
+SCHEDULE_BY_HISTORY = os.environ.get('SCHEDULE_BY_HISTORY', 'True').lower() == 'true'
+WORKERS = int(os.environ.get('WORKERS', '0'))
 
 if not USER_USERNAME or not USER_PASSWORD:
     raise EnvironmentError("Environment variables USER_USERNAME and USER_PASSWORD must be set")
@@ -26,7 +26,7 @@ class BrowserBase(ABC):
         """
 
     @abstractmethod
-    async def create_context(self, browser: Browser) -> BrowserContext:
+    async def create_context(self, browser: Browser, **options) -> BrowserContext:
         """
         This method must be implemented by subclasses to provide logic 
         for creating a context within the browser,
@@ -34,6 +34,8 @@ class BrowserBase(ABC):
 
         Args:
             browser (Browser): The browser instance from which to create the context.
+            **options: Extra keyword arguments forwarded to `Browser.new_context`, 
+                       e.g. `storage_state`.
 
         Returns:
             BrowserContext: A browser context object that encapsulates isolated environments 
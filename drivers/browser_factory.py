@@ -1,13 +1,15 @@
 """
 This module provides a factory class `BrowserFactory` to instantiate browser drivers 
 based on the specified browser type. The factory supports Chrome, Firefox, and Edge browsers, 
-and allows configurations for headless mode and mobile emulation (for Chrome).
+and allows configurations for headless mode, mobile emulation (for Chrome) and the launch profile.
 """
 
 from drivers.browser_base import BrowserBase
 from drivers.chrome_browser import ChromeBrowser
 from drivers.firefox_browser import FirefoxBrowser
 from drivers.edge_browser import EdgeBrowser
+from drivers.launch_profiles import LaunchProfile
+from config import config
 from utilities.logger import Logger
 
 
@@ -18,7 +20,9 @@ class BrowserFactory:
     logger = Logger(__name__)
 
     @staticmethod
-    def get_browser(browser_type: str, headless: bool = False, mobile: bool = False) -> BrowserBase:
+    def get_browser(browser_type: str, headless: bool = False, mobile: bool = False,
+                    device_name: str = config.DEVICE_NAME,
+                    profile: LaunchProfile | None = None) -> BrowserBase:
         """
         Returns an instance of a browser driver based on the specified type.
 
@@ -28,6 +32,10 @@ class BrowserFactory:
                                        Defaults to False.
             mobile (bool, optional): Whether to enable mobile emulation in Chrome. 
                                      Defaults to False.
+            device_name (str, optional): The device Chrome emulates when mobile.
+                                         Defaults to `DEVICE_NAME`.
+            profile (LaunchProfile, optional): The launch profile. Defaults to the
+                                               `LAUNCH_PROFILE` profile.
 
         Raises:
             ValueError: If an unsupported or unknown browser type is provided.
@@ -52,9 +60,10 @@ class BrowserFactory:
             f"Successfully initialized {browser_type} browser.")
 
         if browser_type.lower() == "chrome":
-            return browsers[browser_type.lower()](headless=headless, mobile=mobile)
+            return browsers[browser_type.lower()](
+                headless=headless, mobile=mobile, device_name=device_name, profile=profile)
 
-        return browsers[browser_type.lower()](headless=headless)
+        return browsers[browser_type.lower()](headless=headless, profile=profile)
 
     @staticmethod
     def is_valid_browser(browser_name: str) -> bool:
@@ -0,0 +1,95 @@
+"""
+This module provides the browser × device matrix. A matrix is a list of cells written as
+`browser:device`, e.g. `chrome:iPhone X,chrome:desktop,firefox:desktop,edge:desktop`; a cell
+without a device runs on the desktop. Every test that uses the `page` fixture runs once per cell.
+"""
+
+import re
+from typing import NamedTuple
+
+from config import config
+
+DESKTOP = "desktop"
+DEVICE_BROWSERS = ("chrome",)
+BROWSERS = ("chrome", "firefox", "edge")
+
+
+class MatrixCell(NamedTuple):
+    """
+    A browser and the device it emulates, or `desktop` for no emulation.
+    """
+    browser: str
+    device: str = DESKTOP
+
+    @property
+    def mobile(self) -> bool:
+        """
+        Whether the cell emulates a mobile device.
+        """
+        return self.device != DESKTOP
+
+    @property
+    def id(self) -> str:
+        """
+        The cell id used in test ids and Allure tags, e.g. `chrome-iPhone_X`.
+        """
+        return f"{self.browser}-{re.sub(r'[^A-Za-z0-9]+', '_', self.device)}"
+
+
+class BrowserMatrix:
+    """
+    Parses and validates the configured matrix cells.
+    """
+
+    @staticmethod
+    def parse(spec: list[str]) -> list[MatrixCell]:
+        """
+        Parses matrix cells written as `browser:device` or `browser`.
+
+        Args:
+            spec (list[str]): The cells to parse.
+
+        Raises:
+            ValueError: If a browser is unknown, a device is given for a browser that cannot
+                        emulate devices, or a cell is listed twice.
+
+        Returns:
+            list[MatrixCell]: The cells, in the given order.
+        """
+        cells = []
+        for entry in spec:
+            browser, _, device = entry.partition(":")
+            cell = MatrixCell(browser.strip().lower(), device.strip() or DESKTOP)
+            if cell.browser not in BROWSERS:
+                raise ValueError(f"Invalid browser name in matrix: {cell.browser}")
+            if cell.mobile and cell.browser not in DEVICE_BROWSERS:
+                raise ValueError(f"Device emulation is not supported by {cell.browser}: {entry}")
+            if cell in cells:
+                raise ValueError(f"Duplicate matrix cell: {entry}")
+            cells.append(cell)
+        return cells
+
+    @staticmethod
+    def default_cell() -> MatrixCell:
+        """
+        Returns the single cell used outside matrix mode, from `BROWSER`, `MOBILE` and
+        `DEVICE_NAME`. Browsers that cannot emulate devices run on the desktop.
+
+        Returns:
+            MatrixCell: The configured browser and device.
+        """
+        browser = config.BROWSER.lower()
+        if config.MOBILE and browser in DEVICE_BROWSERS:
+            return MatrixCell(browser, config.DEVICE_NAME)
+        return MatrixCell(browser)
+
+    @classmethod
+    def cells(cls) -> list[MatrixCell]:
+        """
+        Returns the cells of the run: the `MATRIX` cells, or the default cell when `MATRIX`
+        is empty.
+
+        Returns:
+            list[MatrixCell]: The cells every test runs in.
+        """
+        return cls.parse(config.MATRIX) if config.MATRIX else [cls.default_cell()]
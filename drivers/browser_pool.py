@@ -0,0 +1,171 @@
+"""
+This module provides the BrowserPool class, which keeps one running browser per browser type
+for the whole test session (or xdist worker) and hands out fresh, isolated browser contexts.
+Launching a browser process is expensive, creating a context is cheap, so tests only pay for
+the latter. Browsers are recycled after a configurable number of contexts or when they crash.
+Each browser and emulated device pair of a browser matrix gets its own pooled browser, and the
+pool can launch them all concurrently before the first test.
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+from playwright.async_api import Browser, BrowserContext, Error
+from drivers.browser_base import BrowserBase
+from drivers.browser_factory import BrowserFactory
+from drivers.browser_matrix import DESKTOP, MatrixCell
+from config import config
+from utilities.logger import Logger
+
+
+@dataclass(eq=False)
+class PooledBrowser:
+    """
+    Bookkeeping for a browser owned by the pool: the driver that launched it, the browser
+    itself, how many contexts it has served and how many of them are still open.
+    """
+    driver: BrowserBase
+    browser: Browser
+    served: int = 0
+    active: int = 0
+    retired: bool = False
+
+    async def close(self) -> None:
+        """
+        Closes the underlying browser, ignoring errors from browsers that already went away.
+        """
+        try:
+            await self.browser.close()
+        except Error:
+            pass
+
+
+class BrowserPool:
+    """
+    A pool that launches each browser type once and creates a new context per request.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, headless: bool = False, mobile: bool = False,
+                 max_contexts: int = config.POOL_MAX_CONTEXTS):
+        self.headless = headless
+        self.mobile = mobile
+        self.max_contexts = max_contexts
+        self._browsers: dict[str, PooledBrowser] = {}
+        self._owners: dict[BrowserContext, PooledBrowser] = {}
+        self._lock = asyncio.Lock()
+
+    async def new_context(self, browser_type: str, device: str | None = None,
+                          **options) -> BrowserContext:
+        """
+        Creates a fresh context in the pooled browser of the given type, launching or
+        relaunching the browser first when needed.
+
+        Args:
+            browser_type (str): The type of browser the context should belong to.
+            device (str, optional): The device to emulate, or `desktop` for none. Defaults to
+                                    the pool's own mobile setting and `DEVICE_NAME`.
+            **options: Extra keyword arguments forwarded to the driver's `create_context`.
+
+        Returns:
+            BrowserContext: A new, isolated browser context.
+        """
+        cell = self._cell(browser_type, device)
+        async with self._lock:
+            pooled = await self._get_browser(cell)
+            pooled.served += 1
+            pooled.active += 1
+
+        try:
+            context = await pooled.driver.create_context(pooled.browser, **options)
+        except Exception:
+            pooled.active -= 1
+            raise
+
+        self._owners[context] = pooled
+        self.logger.info(
+            f"Context {pooled.served}/{self.max_contexts} created from pooled {cell.id}")
+        return context
+
+    async def warm_up(self, cells: list[MatrixCell]) -> None:
+        """
+        Launches the browsers of every matrix cell concurrently. A browser that fails to
+        launch is only logged; tests of its cell report the error when they ask for a context.
+
+        Args:
+            cells (list[MatrixCell]): The cells to launch browsers for.
+        """
+        async with self._lock:
+            results = await asyncio.gather(*(self._get_browser(cell) for cell in cells),
+                                           return_exceptions=True)
+        for cell, result in zip(cells, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"Failed to warm up {cell.id}: {str(result)}")
+        self.logger.info(f"Browser pool warmed up {len(cells)} matrix cell(s)")
+
+    async def release_context(self, context: BrowserContext) -> None:
+        """
+        Closes a context handed out by the pool and closes its browser if it has been
+        retired and this was its last open context.
+
+        Args:
+            context (BrowserContext): The context to release.
+        """
+        pooled = self._owners.pop(context, None)
+        try:
+            await context.close()
+        except Error as e:
+            self.logger.warning(f"Failed to close context cleanly: {str(e)}")
+
+        if pooled is None:
+            return
+        pooled.active -= 1
+        if pooled.retired and pooled.active == 0:
+            self.logger.info("Closing retired browser after its last context was released")
+            await pooled.close()
+
+    async def close(self) -> None:
+        """
+        Closes every browser owned by the pool, including retired browsers that still
+        have contexts open.
+        """
+        pooled_browsers = set(self._browsers.values()) | set(self._owners.values())
+        self._browsers.clear()
+        self._owners.clear()
+        for pooled in pooled_browsers:
+            await pooled.close()
+        self.logger.info(f"Browser pool closed {len(pooled_browsers)} browser(s)")
+
+    def _cell(self, browser_type: str, device: str | None) -> MatrixCell:
+        if device is None:
+            device = config.DEVICE_NAME if self.mobile else DESKTOP
+        if device != DESKTOP and browser_type.lower() != "chrome":
+            device = DESKTOP
+        return MatrixCell(browser_type.lower(), device)
+
+    async def _get_browser(self, cell: MatrixCell) -> PooledBrowser:
+        key = cell.id
+        pooled = self._browsers.get(key)
+
+        if pooled is not None and not pooled.browser.is_connected():
+            self.logger.warning(f"Pooled {key} browser is disconnected, relaunching")
+            self._retire(key, pooled)
+            pooled = None
+        elif pooled is not None and pooled.served >= self.max_contexts:
+            self.logger.info(f"Pooled {key} browser served {pooled.served} contexts, recycling")
+            self._retire(key, pooled)
+            if pooled.active == 0:
+                await pooled.close()
+            pooled = None
+
+        if pooled is None:
+            driver = BrowserFactory.get_browser(
+                browser_type=cell.browser, headless=self.headless, mobile=cell.mobile,
+                device_name=cell.device)
+            pooled = PooledBrowser(driver, await driver.launch_browser())
+            self._browsers[key] = pooled
+        return pooled
+
+    def _retire(self, key: str, pooled: PooledBrowser) -> None:
+        pooled.retired = True
+        self._browsers.pop(key, None)
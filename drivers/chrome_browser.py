@@ -2,11 +2,14 @@
 This module provides the ChromeBrowser class for managing the lifecycle 
 of a Chromium-based browser instance using the Playwright library. 
 The class allows launching a browser and creating browser contexts, 
-with optional mobile emulation and headless mode support.
+with optional mobile emulation and headless mode support. The launch follows a named launch
+profile, and profiles with a warm profile directory can also launch on it persistently.
 """
 
-from playwright.async_api import Browser, BrowserContext, async_playwright
+from playwright.async_api import Browser, BrowserContext
 from drivers.browser_base import BrowserBase
+from drivers.launch_profiles import LaunchProfile
+from drivers.playwright_runtime import PlaywrightRuntime
 from config import config
 from utilities.logger import Logger
 
@@ -18,41 +21,71 @@ class ChromeBrowser(BrowserBase):
     """
     logger = Logger(__name__)
 
-    def __init__(self, headless: bool = True, mobile: bool = False):
+    def __init__(self, headless: bool = True, mobile: bool = False,
+                 device_name: str = config.DEVICE_NAME, profile: LaunchProfile | None = None):
         self.headless = headless
         self.mobile = mobile
-        self.playwright = None
+        self.device_name = device_name
+        self.profile = profile or LaunchProfile.get()
+        self.runtime = PlaywrightRuntime.get_instance()
 
     async def launch_browser(self) -> Browser:
         """
-        Launches a Chromium browser instance using Playwright.
+        Launches a Chromium browser instance using Playwright, with the options of the
+        driver's launch profile.
 
         Returns:
             Browser: An instance of the Playwright Chromium browser.
         """
-        self.logger.info(f"Launching browser with headless={self.headless}")
-        self.playwright = await async_playwright().start()
-        browser = await self.playwright.chromium.launch(headless=self.headless)
+        options = self.profile.launch_options(self.headless)
+        self.logger.info(f"Launching browser with profile {self.profile.name}: {options}")
+        browser = await self.runtime.launch("chromium", **options)
         self.logger.info("Browser launched successfully")
         return browser
 
-    async def create_context(self, browser: Browser) -> BrowserContext:
+    async def launch_persistent_context(self, **options) -> BrowserContext:
+        """
+        Launches Chromium on the warm profile directory of the driver's launch profile, whose
+        HTTP cache survives from one launch to the next. Unlike the contexts of
+        `create_context`, which never touch the disk cache, the returned context is not
+        isolated from earlier launches.
+
+        Args:
+            **options: Extra keyword arguments forwarded to `launch_persistent_context`.
+
+        Raises:
+            ValueError: If the launch profile has no warm profile directory.
+
+        Returns:
+            BrowserContext: The context of the persistent profile.
+        """
+        if not self.profile.warm_profile:
+            raise ValueError(f"Launch profile {self.profile.name} has no warm profile")
+        if self.mobile:
+            options = {**self.runtime.devices[self.device_name], **options}
+        user_data_dir = self.profile.profile_dir("chrome")
+        self.logger.info(f"Launching persistent browser on {user_data_dir}")
+        return await self.runtime.launch_persistent(
+            "chromium", user_data_dir, **self.profile.launch_options(self.headless), **options)
+
+    async def create_context(self, browser: Browser, **options) -> BrowserContext:
         """
         Creates a new browser context, with optional mobile emulation.
 
         Args:
             browser (Browser): The Chromium browser instance from which to create the context.
+            **options: Extra keyword arguments forwarded to `Browser.new_context`.
 
         Returns:
             BrowserContext: A new browser context instance, optionally emulating a mobile device.
         """
         if self.mobile:
             self.logger.info("Creating mobile context")
-            device = self.playwright.devices[config.DEVICE_NAME]
-            context = await browser.new_context(**device)
-            self.logger.info(f"Mobile context created with device: {config.DEVICE_NAME}")
+            device = self.runtime.devices[self.device_name]
+            context = await browser.new_context(**{**device, **options})
+            self.logger.info(f"Mobile context created with device: {self.device_name}")
         else:
             self.logger.info("Creating regular context")
-            context = await browser.new_context()
+            context = await browser.new_context(**options)
             self.logger.info("Regular context created successfully")
         return context
@@ -1,11 +1,14 @@
 """
 This module provides the implementation for launching and managing a Microsoft Edge browser instance
 using Playwright's asynchronous API. The EdgeBrowser class extends the BrowserBase class, allowing
-for the launching of the browser and creation of browser contexts.
+for the launching of the browser and creation of browser contexts. The launch follows a named
+launch profile.
 """
 
-from playwright.async_api import Browser, BrowserContext, async_playwright
+from playwright.async_api import Browser, BrowserContext
 from drivers.browser_base import BrowserBase
+from drivers.launch_profiles import LaunchProfile
+from drivers.playwright_runtime import PlaywrightRuntime
 from utilities.logger import Logger
 
 
@@ -15,33 +18,37 @@ class EdgeBrowser(BrowserBase):
     """
     logger = Logger(__name__)
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, profile: LaunchProfile | None = None):
         self.headless = headless
+        self.profile = profile or LaunchProfile.get()
+        self.runtime = PlaywrightRuntime.get_instance()
 
     async def launch_browser(self) -> Browser:
         """
-        Launches the Microsoft Edge browser using Playwright.
+        Launches the Microsoft Edge browser using Playwright, with the options of the driver's
+        launch profile. Edge's headless mode is always the new one.
 
         Returns:
             Browser: An instance of the launched Edge browser.
         """
-        self.logger.info(f"Launching browser with headless={self.headless}")
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=self.headless, channel="msedge")
+        options = {**self.profile.launch_options(self.headless), "channel": "msedge"}
+        self.logger.info(f"Launching browser with profile {self.profile.name}: {options}")
+        browser = await self.runtime.launch("chromium", **options)
         self.logger.info("Browser launched successfully")
         return browser
 
-    async def create_context(self, browser: Browser) -> BrowserContext:
+    async def create_context(self, browser: Browser, **options) -> BrowserContext:
         """
         Creates a new browser context in the launched Edge browser.
 
         Args:
             browser (Browser): The launched Edge browser instance.
+            **options: Extra keyword arguments forwarded to `Browser.new_context`.
 
         Returns:
             BrowserContext: A new browser context for the Edge browser.
         """
         self.logger.info("Creating regular context for Firefox")
-        context = await browser.new_context()
+        context = await browser.new_context(**options)
         self.logger.info("Regular context for Firefox created successfully")
         return context
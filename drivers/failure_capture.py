@@ -0,0 +1,204 @@
+"""
+This module provides failure-only tracing and video capture for browser contexts. Every context
+records a Playwright trace chunk, a video, or both, while its test runs. When the test passes
+the chunk is stopped without a path, which drops it inside the browser without writing
+anything, and the video is deleted. Only failing tests write their trace and video to disk.
+The time the capture adds to every test is recorded so its overhead can be budgeted.
+"""
+
+import os
+import re
+import time
+from contextlib import contextmanager
+
+from playwright.async_api import BrowserContext, Error, Video
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+MODES = ("off", "trace", "video", "all")
+
+
+class CaptureSession:
+    """
+    The trace chunk and videos of a single context, and the overhead record of the time
+    spent capturing them.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, context: BrowserContext, flow: str, trace: bool, capture_dir: str):
+        self.context = context
+        self.flow = flow
+        self.trace = trace
+        self.capture_dir = capture_dir
+        self.videos: list[Video] = []
+        self.saved: list[str] = []
+        self.overhead = {"flow": flow, "failed": False, "overhead_ms": 0.0}
+
+    @contextmanager
+    def _timed(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.overhead["overhead_ms"] += (time.perf_counter() - start) * 1000
+
+    async def start(self) -> None:
+        """
+        Starts tracing the context in a new chunk, if tracing is captured.
+        """
+        if not self.trace:
+            return
+        with self._timed():
+            await self.context.tracing.start(screenshots=True, snapshots=True)
+            await self.context.tracing.start_chunk(title=self.flow)
+
+    async def stop(self, failed: bool) -> None:
+        """
+        Stops the trace chunk before the context closes, writing it only for failed tests,
+        and closes the recorded pages so their videos are complete.
+
+        Args:
+            failed (bool): Whether the test failed in setup or call.
+        """
+        self.overhead["failed"] = failed
+        with self._timed():
+            self.videos = [page.video for page in self.context.pages if page.video]
+            if self.trace:
+                path = self._path("trace.zip") if failed else None
+                try:
+                    await self.context.tracing.stop_chunk(path=path)
+                    await self.context.tracing.stop()
+                    if path is not None:
+                        self.saved.append(path)
+                except Error as e:
+                    self.logger.warning(f"Failed to stop tracing of {self.flow}: {str(e)}")
+            if self.videos:
+                for page in self.context.pages:
+                    await page.close()
+
+    async def flush(self) -> None:
+        """
+        Keeps the videos of failed tests and deletes the others, once `stop` has closed their
+        pages and the videos are complete.
+        """
+        with self._timed():
+            for index, video in enumerate(self.videos):
+                try:
+                    if self.overhead["failed"]:
+                        path = self._path(f"{index}.webm" if index else "webm")
+                        await video.save_as(path)
+                        self.saved.append(path)
+                    await video.delete()
+                except Error as e:
+                    self.logger.warning(f"Failed to process video of {self.flow}: {str(e)}")
+        if self.saved:
+            self.logger.info(f"Captured {self.flow} failure to {', '.join(self.saved)}")
+
+    def _path(self, suffix: str) -> str:
+        os.makedirs(self.capture_dir, exist_ok=True)
+        return os.path.join(self.capture_dir,
+                            f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', self.flow)}.{suffix}")
+
+
+class FailureCapture:
+    """
+    Records traces and videos of every context and keeps them for failed tests only.
+    """
+    logger = Logger(__name__)
+    metrics_file = "failure-capture.json"
+    metrics_title = "Failure capture overhead"
+
+    def __init__(self, mode: str = config.FAILURE_CAPTURE,
+                 capture_dir: str = config.CAPTURE_DIR):
+        if mode not in MODES:
+            raise ValueError(f"Invalid failure capture mode: {mode}")
+        self.mode = mode
+        self.capture_dir = os.path.join(utils.get_root_path(), capture_dir)
+        self.overheads: list[dict] = []
+
+    @property
+    def trace(self) -> bool:
+        """
+        Whether traces are captured.
+        """
+        return self.mode in ("trace", "all")
+
+    @property
+    def video(self) -> bool:
+        """
+        Whether videos are captured.
+        """
+        return self.mode in ("video", "all")
+
+    def context_options(self) -> dict:
+        """
+        Returns the `new_context` options needed to record videos.
+
+        Returns:
+            dict: The extra context options, empty when videos are not captured.
+        """
+        if not self.video:
+            return {}
+        return {"record_video_dir": os.path.join(self.capture_dir, ".recording",
+                                                 utils.get_worker_id())}
+
+    async def attach(self, context: BrowserContext, flow: str) -> CaptureSession | None:
+        """
+        Starts capturing the context of a flow.
+
+        Args:
+            context (BrowserContext): The context to capture.
+            flow (str): The flow name, usually the test node id.
+
+        Returns:
+            CaptureSession | None: The session to stop when the flow ends, or None when
+                                   capture is off.
+        """
+        if self.mode == "off":
+            return None
+        session = CaptureSession(context, flow, self.trace, self.capture_dir)
+        await session.start()
+        return session
+
+    def record(self, session: CaptureSession) -> None:
+        """
+        Records the overhead of a finished capture session.
+
+        Args:
+            session (CaptureSession): The stopped and flushed session.
+        """
+        self.overheads.append(session.overhead)
+        self.logger.info(f"Failure capture of {session.flow} cost "
+                         f"{session.overhead['overhead_ms']:.1f} ms")
+
+    @staticmethod
+    def summarize(overheads: list[dict], mode: str = config.FAILURE_CAPTURE) -> dict:
+        """
+        Summarizes the capture overhead of the tests that passed and of those that failed.
+
+        Args:
+            overheads (list[dict]): The overhead records of the tests.
+            mode (str, optional): The capture mode. Defaults to `FAILURE_CAPTURE`.
+
+        Returns:
+            dict: The mode, the test count and the overhead distributions in milliseconds.
+        """
+        summary = {"mode": mode, "tests": len(overheads)}
+        for outcome, failed in (("passed", False), ("failed", True)):
+            durations = [entry["overhead_ms"] for entry in overheads
+                         if entry["failed"] is failed]
+            if durations:
+                summary[outcome] = utils.summarize(durations)
+        return summary
+
+    def write_summary(self) -> str:
+        """
+        Writes the summary of this process as JSON to the metrics directory.
+
+        Returns:
+            str: The summary as a JSON string.
+        """
+        return utils.write_metrics(config.METRICS_DIR, self.metrics_file,
+                                   self.summarize(self.overheads, self.mode),
+                                   overheads=self.overheads)
@@ -1,11 +1,14 @@
 """
 This module contains the FirefoxBrowser class, which is responsible for launching and managing 
 a Firefox browser instance using Playwright. It provides methods to launch a browser and create 
-a browser context.
+a browser context. The launch follows a named launch profile, of which only the headless
+variant and the slow-down apply to Firefox.
 """
 
-from playwright.async_api import Browser, BrowserContext, async_playwright
+from playwright.async_api import Browser, BrowserContext
 from drivers.browser_base import BrowserBase
+from drivers.launch_profiles import LaunchProfile
+from drivers.playwright_runtime import PlaywrightRuntime
 from utilities.logger import Logger
 
 
@@ -15,33 +18,37 @@ class FirefoxBrowser(BrowserBase):
     """
     logger = Logger(__name__)
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, profile: LaunchProfile | None = None):
         self.headless = headless
+        self.profile = profile or LaunchProfile.get()
+        self.runtime = PlaywrightRuntime.get_instance()
 
     async def launch_browser(self) -> Browser:
         """
-        Launches a Firefox browser instance using Playwright.
+        Launches a Firefox browser instance using Playwright, with the options of the driver's
+        launch profile.
 
         Returns:
             Browser: An instance of Playwright's Firefox browser.
         """
-        self.logger.info(f"Launching browser with headless={self.headless}")
-        playwright = await async_playwright().start()
-        browser = await playwright.firefox.launch(headless=self.headless)
+        options = self.profile.launch_options(self.headless, chromium=False)
+        self.logger.info(f"Launching browser with profile {self.profile.name}: {options}")
+        browser = await self.runtime.launch("firefox", **options)
         self.logger.info("Browser launched successfully")
         return browser
 
-    async def create_context(self, browser: Browser) -> BrowserContext:
+    async def create_context(self, browser: Browser, **options) -> BrowserContext:
         """
         Creates a new browser context for the given browser instance.
 
         Args:
             browser (Browser): The Firefox browser instance for which to create the context.
+            **options: Extra keyword arguments forwarded to `Browser.new_context`.
 
         Returns:
             BrowserContext: A new browser context instance.
         """
         self.logger.info("Creating regular context")
-        context = await browser.new_context()
+        context = await browser.new_context(**options)
         self.logger.info("Regular context created successfully")
         return context
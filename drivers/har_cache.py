@@ -0,0 +1,162 @@
+"""
+This module provides HAR based network caching for browser contexts. In record mode every
+flow (test) writes the traffic of its context to a HAR file. In replay mode the context serves
+matching requests from that file through routing, and either lets unmatched requests go to the
+network or aborts them. Hits, misses and bytes served from the cache are counted per context.
+"""
+
+import base64
+import json
+import os
+import re
+
+from playwright.async_api import BrowserContext, Route
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+
+class HarReplay:
+    """
+    Serves the requests of a single context from recorded HAR entries and counts the
+    cache hits and misses.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, flow: str, entries: dict[tuple, dict], not_found: str):
+        self.flow = flow
+        self.entries = entries
+        self.not_found = not_found
+        self.hits = 0
+        self.misses = 0
+        self.bytes_served = 0
+
+    async def handle(self, route: Route) -> None:
+        """
+        Fulfills the request from the recorded response if there is one, otherwise falls
+        back to the network or aborts it, depending on the configured policy.
+
+        Args:
+            route (Route): The intercepted request.
+        """
+        request = route.request
+        entry = self.entries.get((request.method, request.url, request.post_data))
+        if entry is None:
+            self.misses += 1
+            if self.not_found == "abort":
+                await route.abort()
+            else:
+                await route.fallback()
+            return
+
+        self.hits += 1
+        self.bytes_served += len(entry["body"])
+        await route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+
+    def log_summary(self) -> None:
+        """
+        Logs the hit and miss counts and the bytes served from the cache for the flow.
+        """
+        self.logger.info(
+            f"HAR cache for {self.flow}: {self.hits} hits, {self.misses} misses, "
+            f"{self.bytes_served} bytes served from cache")
+
+
+class HarCache:
+    """
+    Records HAR files per flow or replays them into new browser contexts.
+    """
+    logger = Logger(__name__)
+    _loaded: dict[str, dict[tuple, dict]] = {}
+
+    def __init__(self, mode: str = config.HAR_MODE, har_dir: str = config.HAR_DIR,
+                 not_found: str = config.HAR_NOT_FOUND):
+        if mode not in ("off", "record", "replay"):
+            raise ValueError(f"Invalid HAR mode: {mode}")
+        if not_found not in ("fallback", "abort"):
+            raise ValueError(f"Invalid HAR not found policy: {not_found}")
+        self.mode = mode
+        self.har_dir = os.path.join(utils.get_root_path(), har_dir)
+        self.not_found = not_found
+
+    def har_path(self, flow: str) -> str:
+        """
+        Returns the HAR file used for a flow.
+
+        Args:
+            flow (str): The flow name, usually the test node id.
+
+        Returns:
+            str: The absolute path of the flow's HAR file.
+        """
+        return os.path.join(self.har_dir, f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', flow)}.har")
+
+    def context_options(self, flow: str) -> dict:
+        """
+        Returns the `new_context` options needed for the flow in the current mode.
+
+        Args:
+            flow (str): The flow name, usually the test node id.
+
+        Returns:
+            dict: The extra context options, empty when HAR caching is off.
+        """
+        if self.mode == "record":
+            os.makedirs(self.har_dir, exist_ok=True)
+            return {"record_har_path": self.har_path(flow), "record_har_content": "embed"}
+        if self.mode == "replay":
+            return {"service_workers": "block"}
+        return {}
+
+    async def attach(self, context: BrowserContext, flow: str) -> HarReplay | None:
+        """
+        Routes the context through the recorded HAR of the flow when replaying.
+
+        Args:
+            context (BrowserContext): The context to serve from the cache.
+            flow (str): The flow name, usually the test node id.
+
+        Returns:
+            HarReplay | None: The replay handler holding the flow's counters, or None when
+                              not replaying.
+        """
+        if self.mode != "replay":
+            return None
+
+        replay = HarReplay(flow, self._load(self.har_path(flow)), self.not_found)
+        await context.route("**/*", replay.handle)
+        return replay
+
+    def _load(self, path: str) -> dict[tuple, dict]:
+        if path in self._loaded:
+            return self._loaded[path]
+
+        entries = {}
+        if not os.path.exists(path):
+            self.logger.warning(f"No recorded HAR at {path}, every request is a miss")
+        else:
+            with open(path, encoding="utf-8") as file:
+                har = json.load(file)
+            for entry in har["log"]["entries"]:
+                request, response = entry["request"], entry["response"]
+                if response["status"] <= 0:
+                    continue
+                post_data = request.get("postData", {}).get("text")
+                entries[(request["method"], request["url"], post_data)] = {
+                    "status": response["status"],
+                    "headers": {header["name"]: header["value"] for header in response["headers"]
+                                if header["name"].lower() not in ("content-encoding",
+                                                                  "content-length")},
+                    "body": self._decode_body(response["content"]),
+                }
+            self.logger.info(f"Loaded {len(entries)} HAR entries from {path}")
+
+        self._loaded[path] = entries
+        return entries
+
+    @staticmethod
+    def _decode_body(content: dict) -> bytes:
+        text = content.get("text", "")
+        if content.get("encoding") == "base64":
+            return base64.b64decode(text)
+        return text.encode("utf-8")
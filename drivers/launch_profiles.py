@@ -0,0 +1,115 @@
+"""
+This module provides the named launch profiles of the browser drivers. A profile bundles the
+Chromium command-line switches, the headless variant (Playwright's headless shell, Chrome's
+new headless mode or a headed window) and whether the launch benchmark also measures it on a
+warm persistent profile directory whose HTTP cache has been primed; test runs always launch
+without one. `LAUNCH_PROFILE` selects the profile of a run:
+
+    default   today's launch: the HEADLESS setting, no extra switches
+    ci-fast   the headless shell with background work, GPU and extensions switched off
+    debug     a headed window with slowed-down actions
+    faithful  Chrome's new headless mode, which renders like a headed Chrome
+
+`benchmarks/launch_profiles.py` measures the startup and first navigation of every profile.
+"""
+
+import os
+from typing import NamedTuple
+
+from config import config
+from utilities import utils
+
+HEADLESS_VARIANTS = ("config", "shell", "new", "headed")
+
+CI_FAST_ARGS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+)
+
+
+class LaunchProfile(NamedTuple):
+    """
+    How a browser is launched. `headless` is one of `config` (the driver's headless flag),
+    `shell` (Playwright's headless shell), `new` (Chrome's new headless mode) or `headed`.
+    `warm_profile` only affects `benchmarks/launch_profiles.py`, which then also launches the
+    profile persistently on its profile directory. `faithful` marks profiles that render like
+    a headed browser.
+    """
+    name: str
+    args: tuple[str, ...] = ()
+    headless: str = "config"
+    slow_mo: float = 0
+    warm_profile: bool = False
+    faithful: bool = True
+
+    @staticmethod
+    def get(name: str = config.LAUNCH_PROFILE) -> "LaunchProfile":
+        """
+        Returns a launch profile by name.
+
+        Args:
+            name (str, optional): The profile name. Defaults to `LAUNCH_PROFILE`.
+
+        Raises:
+            ValueError: If there is no profile with that name.
+
+        Returns:
+            LaunchProfile: The profile.
+        """
+        if name not in PROFILES:
+            raise ValueError(f"Invalid launch profile: {name}")
+        return PROFILES[name]
+
+    def launch_options(self, headless: bool, chromium: bool = True) -> dict:
+        """
+        Returns the `BrowserType.launch` options of the profile. Switches and the new headless
+        mode only apply to Chromium-based browsers.
+
+        Args:
+            headless (bool): The driver's headless flag, used by `config` profiles.
+            chromium (bool, optional): Whether the browser is Chromium-based. Defaults to True.
+
+        Returns:
+            dict: The launch options.
+        """
+        options = {"headless": headless if self.headless == "config" else self.headless != "headed"}
+        if chromium and self.args:
+            options["args"] = list(self.args)
+        if chromium and self.headless == "new":
+            options["channel"] = "chromium"
+        if self.slow_mo:
+            options["slow_mo"] = self.slow_mo
+        return options
+
+    def profile_dir(self, browser: str) -> str:
+        """
+        Returns the persistent profile directory of the profile for a browser. Chromium locks
+        its profile directories, so every xdist worker gets its own.
+
+        Args:
+            browser (str): The browser type, e.g. `chrome`.
+
+        Returns:
+            str: The absolute path of the profile directory.
+        """
+        return os.path.join(utils.get_root_path(), config.PROFILE_DIR, f"{self.name}-{browser}",
+                            utils.get_worker_id())
+
+
+PROFILES = {profile.name: profile for profile in (
+    LaunchProfile("default", faithful=not config.HEADLESS),
+    LaunchProfile("ci-fast", args=CI_FAST_ARGS, headless="shell", warm_profile=True,
+                  faithful=False),
+    LaunchProfile("debug", headless="headed", slow_mo=250),
+    LaunchProfile("faithful", headless="new", warm_profile=True),
+)}
@@ -0,0 +1,142 @@
+"""
+This module provides the PlaywrightRuntime class, the single owner of the Playwright driver
+connection for a test session. All browser drivers launch through it, so only one Playwright
+driver process is started and it is stopped deterministically when the session ends.
+"""
+
+import asyncio
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+from utilities.logger import Logger
+
+
+class PlaywrightRuntime:
+    """
+    A shared runtime that starts the Playwright driver once, launches browsers through it
+    and keeps track of the browsers and contexts that are alive.
+    """
+    logger = Logger(__name__)
+    _instance = None
+
+    def __init__(self):
+        self._playwright: Playwright | None = None
+        self._browsers: list[Browser] = []
+        self._persistent: list[BrowserContext] = []
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "PlaywrightRuntime":
+        """
+        Returns the runtime shared by all browser drivers, creating it on first use.
+
+        Returns:
+            PlaywrightRuntime: The shared runtime instance.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def devices(self) -> dict:
+        """
+        The device descriptors used for mobile emulation.
+
+        Raises:
+            RuntimeError: If the runtime has not been started yet.
+
+        Returns:
+            dict: The Playwright device descriptors keyed by device name.
+        """
+        if self._playwright is None:
+            raise RuntimeError("Playwright runtime is not started")
+        return self._playwright.devices
+
+    async def start(self) -> Playwright:
+        """
+        Starts the Playwright driver if it is not running yet.
+
+        Returns:
+            Playwright: The running Playwright instance.
+        """
+        async with self._lock:
+            if self._playwright is None:
+                self.logger.info("Starting Playwright driver")
+                self._playwright = await async_playwright().start()
+        return self._playwright
+
+    async def launch(self, engine: str, **launch_options) -> Browser:
+        """
+        Launches a browser through the shared driver and tracks it until it disconnects.
+
+        Args:
+            engine (str): The Playwright browser engine: `chromium`, `firefox` or `webkit`.
+            **launch_options: Keyword arguments forwarded to `BrowserType.launch`.
+
+        Returns:
+            Browser: The launched browser.
+        """
+        playwright = await self.start()
+        browser = await getattr(playwright, engine).launch(**launch_options)
+        self._browsers.append(browser)
+        browser.on("disconnected", self._forget)
+        return browser
+
+    async def launch_persistent(self, engine: str, user_data_dir: str,
+                                **options) -> BrowserContext:
+        """
+        Launches a browser on a persistent profile directory through the shared driver and
+        tracks its context until it closes.
+
+        Args:
+            engine (str): The Playwright browser engine: `chromium`, `firefox` or `webkit`.
+            user_data_dir (str): The profile directory, created when missing.
+            **options: Keyword arguments forwarded to `BrowserType.launch_persistent_context`.
+
+        Returns:
+            BrowserContext: The context of the persistent profile.
+        """
+        playwright = await self.start()
+        context = await getattr(playwright, engine).launch_persistent_context(
+            user_data_dir, **options)
+        self._persistent.append(context)
+        context.on("close", self._forget_context)
+        return context
+
+    async def stop(self) -> None:
+        """
+        Closes every browser and persistent context still alive and stops the Playwright
+        driver.
+        """
+        async with self._lock:
+            for context in list(self._persistent):
+                await context.close()
+            self._persistent.clear()
+            for browser in list(self._browsers):
+                await browser.close()
+            self._browsers.clear()
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+                self.logger.info("Playwright driver stopped")
+
+    def stats(self) -> dict:
+        """
+        Reports how many driver processes, browsers and contexts are alive.
+
+        Returns:
+            dict: The counts keyed by `driver_processes`, `browsers` and `contexts`.
+        """
+        browsers = [browser for browser in self._browsers if browser.is_connected()]
+        return {
+            "driver_processes": 0 if self._playwright is None else 1,
+            "browsers": len(browsers),
+            "contexts": sum(len(browser.contexts) for browser in browsers),
+        }
+
+    def _forget(self, browser: Browser) -> None:
+        if browser in self._browsers:
+            self._browsers.remove(browser)
+
+    def _forget_context(self, context: BrowserContext) -> None:
+        if context in self._persistent:
+            self._persistent.remove(context)
@@ -0,0 +1,149 @@
+"""
+This module provides declarative resource blocking for browser contexts. A ResourcePolicy names
+the resource types (images, fonts, media, ...) and URL patterns (third-party trackers, ...) a
+test does not need; applying it to a context aborts matching requests through routing and counts
+how many requests, and roughly how many bytes, were saved.
+"""
+
+from fnmatch import fnmatch
+
+from playwright.async_api import BrowserContext, Response, Route
+from utilities.logger import Logger
+
+TRACKER_PATTERNS = (
+    "*://*.backtrace.io/*",
+    "*://*.google-analytics.com/*",
+    "*://*.googletagmanager.com/*",
+    "*://*.doubleclick.net/*",
+    "*://*.hotjar.com/*",
+    "*://*.optimizely.com/*",
+    "*://*.segment.io/*",
+)
+
+
+class ResourceBlocker:
+    """
+    Aborts the requests of a single context that match a policy and keeps the counters.
+    Response sizes seen in contexts that block nothing are remembered, so bytes saved can be
+    estimated for later blocked requests to the same URLs.
+    """
+    logger = Logger(__name__)
+    known_sizes: dict[str, int] = {}
+
+    def __init__(self, policy: "ResourcePolicy"):
+        self.policy = policy
+        self.blocked = 0
+        self.bytes_saved = 0
+        self.unknown_sizes = 0
+
+    async def handle(self, route: Route) -> None:
+        """
+        Aborts the request if the policy blocks it, otherwise passes it on to the next
+        route handler or the network.
+
+        Args:
+            route (Route): The intercepted request.
+        """
+        if not self.policy.blocks(route.request.resource_type, route.request.url):
+            await route.fallback()
+            return
+
+        self.blocked += 1
+        size = self.known_sizes.get(route.request.url)
+        if size is None:
+            self.unknown_sizes += 1
+        else:
+            self.bytes_saved += size
+        await route.abort("blockedbyclient")
+
+    @classmethod
+    def remember_size(cls, response: Response) -> None:
+        """
+        Records the size of a response from its Content-Length header.
+
+        Args:
+            response (Response): A response received by an unblocked context.
+        """
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            cls.known_sizes[response.url] = int(length)
+
+    def log_summary(self, test_name: str) -> None:
+        """
+        Logs how many requests the policy blocked and the estimated bytes saved.
+
+        Args:
+            test_name (str): The test the context belonged to.
+        """
+        self.logger.info(
+            f"Resource policy '{self.policy.name}' for {test_name}: blocked {self.blocked} "
+            f"requests, saved ~{self.bytes_saved} bytes ({self.unknown_sizes} of unknown size)")
+
+
+class ResourcePolicy:
+    """
+    A named set of resource types and URL patterns to block in a context.
+    """
+    presets = {
+        "none": ((), ()),
+        "functional": (("image", "font", "media"), TRACKER_PATTERNS),
+        "trackers": ((), TRACKER_PATTERNS),
+    }
+
+    def __init__(self, name: str, block_types=(), block_urls=()):
+        self.name = name
+        self.block_types = frozenset(block_types)
+        self.block_urls = tuple(block_urls)
+
+    @classmethod
+    def from_name(cls, name: str) -> "ResourcePolicy":
+        """
+        Builds one of the preset policies.
+
+        Args:
+            name (str): The preset name: `none`, `functional` or `trackers`.
+
+        Raises:
+            ValueError: If the preset does not exist.
+
+        Returns:
+            ResourcePolicy: The preset policy.
+        """
+        if name not in cls.presets:
+            raise ValueError(f"Invalid resource policy: {name}")
+        block_types, block_urls = cls.presets[name]
+        return cls(name, block_types, block_urls)
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        """
+        Checks whether a request is blocked by the policy.
+
+        Args:
+            resource_type (str): The Playwright resource type of the request.
+            url (str): The request URL.
+
+        Returns:
+            bool: True if the request should be aborted.
+        """
+        return resource_type in self.block_types or any(
+            fnmatch(url, pattern) for pattern in self.block_urls)
+
+    async def apply(self, context: BrowserContext) -> ResourceBlocker | None:
+        """
+        Routes the context through the policy. Contexts under a policy that blocks nothing
+        are not routed and only feed the response size estimates.
+
+        Args:
+            context (BrowserContext): The context to apply the policy to.
+
+        Returns:
+            ResourceBlocker | None: The blocker holding the context's counters, or None when
+                                    the policy blocks nothing.
+        """
+        if not self.block_types and not self.block_urls:
+            context.on("response", ResourceBlocker.remember_size)
+            return None
+
+        blocker = ResourceBlocker(self)
+        await context.route("**/*", blocker.handle)
+        return blocker
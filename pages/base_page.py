@@ -1,32 +1,159 @@
 """
 This module provides a BasePage class for interaction with web pages using Playwright.
 It abstracts common operations like navigation, text retrieval, filling inputs, 
-and clicking elements.
+clicking elements, running batches of those actions as one step, and capturing
+screenshots of named page regions. Page objects declare what "ready" means for their page,
+and navigation waits for that instead of the full `load` event. Actions go through the cached
+locators of the page's locator registry, and calls marked `idempotent=True` are retried in
+the same context when they fail.
 """
 
-from playwright.async_api import Page
+import asyncio
+import weakref
+from typing import NamedTuple
+
+from playwright.async_api import Error, Locator, Page
+from pages.locator_registry import LocatorRegistry, Selector
 from utilities.logger import Logger
+from utilities.step_retry import attempt_timeout, retried_step
+from utilities.step_timer import StepTimer, timed_step
+
+LOAD_TIMING_SCRIPT = """
+() => {
+    const [navigation] = performance.getEntriesByType("navigation");
+    return navigation ? navigation.loadEventEnd : null;
+}
+"""
+
+FINGERPRINT_SCRIPT = """
+(element) => {
+    const rect = element.getBoundingClientRect();
+    const images = [...element.querySelectorAll("img")].map((image) => image.complete).join();
+    const source = [element.outerHTML, rect.width, rect.height, window.devicePixelRatio,
+        document.fonts.status, images].join("|");
+    let hash = 0x811c9dc5;
+    for (let index = 0; index < source.length; index++) {
+        hash ^= source.charCodeAt(index);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return `${(hash >>> 0).toString(16)}:${source.length}`;
+}
+"""
+
+
+class BatchStep(NamedTuple):
+    """
+    A single action of a batch: `fill` and `select` take a value, `click` does not.
+    """
+    action: str
+    selector: str
+    value: str | None = None
+
+
+class Readiness(NamedTuple):
+    """
+    What a page needs before it is ready: a Playwright load state to wait for (`commit`,
+    `domcontentloaded`, `load` or `networkidle`) and, optionally, a sentinel selector that must
+    then be visible.
+    """
+    wait_until: str = "load"
+    selector: str | None = None
+
+    def __str__(self) -> str:
+        return f"{self.wait_until}+{self.selector}" if self.selector else self.wait_until
 
 
 class BasePage:
     """
     A base page class that provides common methods for interacting with web pages.
+    Page objects declare their selectors, readiness and screenshot regions as class
+    attributes.
     """
     logger = Logger(__name__)
+    readiness = Readiness()
+    screenshot_regions: dict[str, str] = {}
+    dynamic_areas: tuple[str, ...] = ()
+    _load_timers_by_page: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     def __init__(self, page: Page):
         self.page = page
+        self.locators = LocatorRegistry.for_page(page)
+        self._captures: dict[tuple, tuple[str, bytes]] = {}
+        self._load_timers: set[asyncio.Task] = self._load_timers_by_page.setdefault(page, set())
+
+    @classmethod
+    async def cancel_load_timers(cls, page: Page) -> None:
+        """
+        Cancels the pending `load` timers that navigations of any page object started on a
+        page, and waits for them to finish. Call it before the page's context is closed.
+
+        Args:
+            page (Page): The Playwright page.
+        """
+        timers = cls._load_timers_by_page.pop(page, set())
+        for timer in timers:
+            timer.cancel()
+        await asyncio.gather(*timers, return_exceptions=True)
+
+    def locator(self, selector: str) -> Locator:
+        """
+        Returns the cached locator of a selector on this page.
+
+        Args:
+            selector (str): The selector for the target element.
+
+        Returns:
+            Locator: The locator, built once per page.
+        """
+        return self.locators.get(selector)
 
-    async def navigate(self, url: str) -> None:
+    def selectors(self) -> dict[str, Selector]:
         """
-        Navigates to the specified URL.
+        Returns the selectors the page object and its base classes declare.
+
+        Returns:
+            dict[str, Selector]: The declared selectors by attribute name.
+        """
+        declared = {}
+        for owner in reversed(type(self).__mro__):
+            declared.update(vars(owner))
+        return {name: value for name, value in declared.items() if isinstance(value, Selector)}
+
+    async def validate_selectors(self) -> None:
+        """
+        Checks every selector declared for the current screen in a single DOM pass, once
+        per page object and screen.
+
+        Raises:
+            RuntimeError: If any selector is invalid or matches nothing.
+        """
+        await self.locators.validate(type(self).__name__, self.selectors())
+
+    @timed_step
+    @retried_step
+    async def navigate(self, url: str, readiness: Readiness | None = None) -> None:
+        """
+        Navigates to the specified URL and waits until the page is ready, as declared by the
+        page object's `readiness`. With step timing enabled, the time saved against waiting
+        for the full `load` event is recorded once that event fires, without waiting for it.
 
         Args:
             url (str): The URL to navigate to.
+            readiness (Readiness, optional): Overrides the page object's readiness strategy.
         """
-        self.logger.info(f"Navigating to {url}")
-        await self.page.goto(url)
+        readiness = readiness or self.readiness
+        self.logger.info(f"Navigating to {url} (ready on {readiness})")
+        await self.page.goto(url, wait_until=readiness.wait_until, timeout=attempt_timeout())
+        if readiness.selector:
+            await self.page.wait_for_selector(readiness.selector, timeout=attempt_timeout())
+        if StepTimer.enabled and readiness != Readiness():
+            ready = await self.page.evaluate("performance.now()")
+            task = asyncio.create_task(self._record_load_saving(url, str(readiness), ready))
+            self._load_timers.add(task)
+            task.add_done_callback(self._load_timers.discard)
 
+    @timed_step
+    @retried_step
     async def get_text(self, selector: str) -> str:
         """
         Retrieves the inner text of an element specified by the selector.
@@ -37,10 +164,12 @@ class BasePage:
         Returns:
             str: The inner text of the element.
         """
-        text = await self.page.inner_text(selector)
+        text = await self.locator(selector).inner_text(timeout=attempt_timeout())
         self.logger.info(f"Retrieved text: '{text}' from selector: {selector}")
         return text
 
+    @timed_step
+    @retried_step
     async def fill(self, selector: str, text: str) -> None:
         """
         Fills an input field specified by the selector with the given text.
@@ -50,8 +179,10 @@ class BasePage:
             text (str): The text to fill into the input field.
         """
         self.logger.info(f"Filling input with selector: {selector} with text: '{text}'")
-        await self.page.fill(selector, text)
+        await self.locator(selector).fill(text, timeout=attempt_timeout())
 
+    @timed_step
+    @retried_step
     async def click(self, selector: str) -> None:
         """
         Clicks on an element specified by the selector.
@@ -60,8 +191,10 @@ class BasePage:
             selector (str): The selector for the target element.
         """
         self.logger.info(f"Clicking on element with selector: {selector}")
-        await self.page.click(selector)
+        await self.locator(selector).click(timeout=attempt_timeout())
 
+    @timed_step
+    @retried_step
     async def select_option(self, selector: str, option_value: str) -> None:
         """
         Selects an option from a dropdown element specified by the selector.
@@ -72,4 +205,84 @@ class BasePage:
         """
         self.logger.info(
             f"Selecting option '{option_value}' from dropdown with selector: {selector}")
-        await self.page.select_option(selector, option_value)
+        await self.locator(selector).select_option(option_value, timeout=attempt_timeout())
+
+    @timed_step
+    async def run_batch(self, steps: list[BatchStep]) -> None:
+        """
+        Runs a list of fill, click and select steps in order as a single logged and timed
+        step. Every step is a regular Playwright action, so it waits for its target to be
+        actionable; the steps are not run concurrently, since fills type through the page's
+        keyboard focus and clicks through its mouse. A step that navigates away must be the
+        last one of the batch.
+
+        Args:
+            steps (list[BatchStep]): The steps to run, in order.
+
+        Raises:
+            ValueError: If a step has an unknown action.
+        """
+        for step in steps:
+            if step.action not in ("fill", "click", "select"):
+                raise ValueError(f"Invalid batch action: {step.action}")
+
+        self.logger.info(f"Running batch of {len(steps)} steps: "
+                         f"{[(step.action, step.selector) for step in steps]}")
+        for step in steps:
+            if step.action == "fill":
+                await self.fill(step.selector, step.value)
+            elif step.action == "select":
+                await self.select_option(step.selector, step.value)
+            else:
+                await self.click(step.selector)
+
+    @timed_step
+    async def screenshot_region(self, name: str, scale: str = "css",
+                                mask: list[str] | None = None) -> bytes:
+        """
+        Captures a PNG screenshot of a named region of the page instead of the whole viewport.
+        Dynamic areas are covered by a mask, animations are stopped and the caret is hidden.
+        The region's DOM is fingerprinted first, and the previous capture is returned as long
+        as the fingerprint (markup, size, device pixel ratio, font and image loading) has not
+        changed.
+
+        Args:
+            name (str): The region name, a key of `screenshot_regions`.
+            scale (str, optional): `css` for one pixel per CSS pixel, or `device` for the
+                                   device pixel ratio. Defaults to `css`.
+            mask (list[str], optional): Selectors of the areas to mask. Defaults to the page
+                                        object's `dynamic_areas`.
+
+        Raises:
+            ValueError: If the page object has no region with that name.
+
+        Returns:
+            bytes: The PNG screenshot of the region.
+        """
+        if name not in self.screenshot_regions:
+            raise ValueError(f"Invalid screenshot region: {name}")
+
+        mask = self.dynamic_areas if mask is None else mask
+        region = self.locator(self.screenshot_regions[name])
+        key = (name, scale, tuple(mask))
+        fingerprint = await region.evaluate(FINGERPRINT_SCRIPT)
+        cached = self._captures.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            self.logger.info(f"Reusing screenshot of region '{name}', DOM unchanged")
+            return cached[1]
+
+        self.logger.info(f"Capturing screenshot of region '{name}' at {scale} scale")
+        image = await region.screenshot(
+            scale=scale, animations="disabled", caret="hide",
+            mask=[self.locator(selector) for selector in mask])
+        self._captures[key] = (fingerprint, image)
+        return image
+
+    async def _record_load_saving(self, url: str, strategy: str, ready: float) -> None:
+        try:
+            await self.page.wait_for_load_state("load")
+            load = await self.page.evaluate(LOAD_TIMING_SCRIPT)
+        except Error:
+            return
+        if load:
+            StepTimer.record_navigation(type(self).__name__, url, strategy, ready, load)
@@ -4,8 +4,13 @@ in an e-commerce application.
 It extends the BasePage class and provides methods to interact with the checkout process.
 """
 
-from playwright.async_api import Page
-from pages.base_page import BasePage
+from urllib.parse import urljoin
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from pages.base_page import BasePage, BatchStep, Readiness
+from pages.inventory_page import InventoryPage
+from pages.locator_registry import Selector
+from config import config
 from utilities.logger import Logger
 
 
@@ -15,23 +20,55 @@ class CartPage(BasePage):
     such as cart items, checkout button, and checkout information fields.
     """
     logger = Logger(__name__)
+    url = urljoin(config.URL, "cart.html")
+    cart_items = Selector(".cart_item", on="*/cart.html", optional=True)
+    checkout_button = Selector("#checkout", on="*/cart.html")
+    first_name_input = Selector("#first-name", on="*/checkout-step-one.html")
+    last_name_input = Selector("#last-name", on="*/checkout-step-one.html")
+    zip_code_input = Selector("#postal-code", on="*/checkout-step-one.html")
+    continue_button = Selector("#continue", on="*/checkout-step-one.html")
+    finish_button = Selector("#finish", on="*/checkout-step-two.html")
+    cart_list = Selector(".cart_list", on="*/cart.html")
+    screenshot_regions = {"cart_list": cart_list}
+    # The cart redirects to the login page for anonymous users, so there is no
+    # sentinel: `is_displayed` checks the list and fails fast.
+    readiness = Readiness("domcontentloaded")
+
+    async def open(self, items: list[str] | None = None) -> None:
+        """
+        Deep-links to the cart page, first seeding the cart with the given items so no
+        inventory clicks are needed. The user must already be logged in, e.g. through the
+        cached storage state of the `page` fixture.
+
+        Args:
+            items (list[str], optional): The ids of the products to put in the cart, e.g.
+                                         `sauce-labs-backpack`. Defaults to an empty cart.
+        """
+        await InventoryPage(self.page).seed_cart(items or [])
+        await self.navigate(self.url, idempotent=True)
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.cart_items = ".cart_item"
-        self.checkout_button = "#checkout"
-        self.first_name_input = "#first-name"
-        self.last_name_input = "#last-name"
-        self.zip_code_input = "#postal-code"
-        self.continue_button = "#continue"
-        self.finish_button = "#finish"
+    async def is_displayed(self, timeout: float = 5000) -> bool:
+        """
+        Checks whether the cart list is shown, which only happens for a logged-in user.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in milliseconds. Defaults to 5000.
+
+        Returns:
+            bool: True if the cart list is visible, False otherwise.
+        """
+        try:
+            await self.locator(self.cart_list).wait_for(timeout=timeout)
+        except PlaywrightTimeoutError:
+            return False
+        return True
 
     async def go_to_checkout(self):
         """
         Navigates to the checkout page by clicking the checkout button.
         """
         self.logger.info("Attempting to navigate to the checkout page.")
-        await self.click(self.checkout_button)
+        await self.click(self.checkout_button, idempotent=True)
         self.logger.info("Navigated to the checkout page.")
 
     async def fill_checkout_info(self, first_name: str, last_name: str, zip_code: str):
@@ -45,14 +82,14 @@ class CartPage(BasePage):
             zip_code (str): The zip code of the user.
         """
         self.logger.info("Filling checkout information.")
-        await self.fill(self.first_name_input, first_name)
-        self.logger.debug(f"Filled first name: {first_name}")
-        await self.fill(self.last_name_input, last_name)
-        self.logger.debug(f"Filled last name: {last_name}")
-        await self.fill(self.zip_code_input, zip_code)
-        self.logger.debug(f"Filled zip code: {zip_code}")
-
-        await self.click(self.continue_button)
+        await self.run_batch([
+            BatchStep("fill", self.first_name_input, first_name),
+            BatchStep("fill", self.last_name_input, last_name),
+            BatchStep("fill", self.zip_code_input, zip_code),
+            BatchStep("click", self.continue_button),
+        ])
+        self.logger.debug(f"Filled first name: {first_name}, last name: {last_name}, "
+                          f"zip code: {zip_code}")
         self.logger.info("Clicked continue button to proceed with checkout.")
 
     async def finish_checkout(self):
@@ -60,5 +97,5 @@ class CartPage(BasePage):
         Completes the checkout process by clicking the finish button.
         """
         self.logger.info("Completing the checkout process.")
-        await self.click(self.finish_button)
+        await self.click(self.finish_button, idempotent=True)
         self.logger.info("Checkout process completed.")
@@ -1,11 +1,89 @@
 """
-This module defines the InventoryPage class, which inherits from BasePage.
+This module defines the InventoryPage class, which inherits from BasePage,
+and the InventoryItem tuple returned by its inventory snapshot. It also knows how Swag Labs
+keeps the cart on the client, so tests can seed a cart instead of clicking items into it.
 """
 
-from playwright.async_api import Page
-from pages.base_page import BasePage
+import json
+import time
+from typing import NamedTuple
+from urllib.parse import urljoin, urlsplit
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from pages.base_page import BasePage, BatchStep, Readiness
+from pages.locator_registry import Selector
+from pages.login_page import LoginPage
+from config import config
 from utilities.logger import Logger
 
+SNAPSHOT_SCRIPT = """
+(items, selectors) => items.map((item) => {
+    const text = (selector) => {
+        const element = item.querySelector(selector);
+        return element ? element.innerText.trim() : "";
+    };
+    const button = item.querySelector(selectors.button);
+    return {
+        name: text(selectors.name),
+        description: text(selectors.description),
+        price: text(selectors.price),
+        buttonId: button ? button.id : "",
+    };
+})
+"""
+
+INVENTORY_SCREEN = "*/inventory.html"
+CART_STORAGE_KEY = "cart-contents"
+PRODUCT_IDS = {
+    "sauce-labs-backpack": 4,
+    "sauce-labs-bike-light": 0,
+    "sauce-labs-bolt-t-shirt": 1,
+    "sauce-labs-fleece-jacket": 5,
+    "sauce-labs-onesie": 2,
+    "test.allthethings()-t-shirt-(red)": 3,
+}
+
+CART_SEED_SCRIPT = """
+(({ origin, key, ids, token }) => {
+    if (location.origin !== origin) {
+        return;
+    }
+    try {
+        if (Number(sessionStorage.getItem("cart-seeded")) >= token) {
+            return;
+        }
+        sessionStorage.setItem("cart-seeded", String(token));
+        if (ids.length) {
+            localStorage.setItem(key, JSON.stringify(ids));
+        } else {
+            localStorage.removeItem(key);
+        }
+    } catch (error) {
+        // Storage is not available in this document.
+    }
+})(%s)
+"""
+
+
+class InventoryItem(NamedTuple):
+    """
+    A single product as shown on the inventory page.
+    """
+    name: str
+    description: str
+    price: float
+    button_id: str
+
+    @property
+    def in_cart(self) -> bool:
+        """
+        Whether the item is in the cart, i.e. its button offers to remove it.
+
+        Returns:
+            bool: True if the item is in the cart.
+        """
+        return self.button_id.startswith("remove-")
+
 
 class InventoryPage(BasePage):
     """
@@ -15,14 +93,67 @@ class InventoryPage(BasePage):
     adding items to the shopping cart, and navigating to the shopping cart.
     """
     logger = Logger(__name__)
+    url = urljoin(config.URL, "inventory.html")
+    inventory_list = Selector(".inventory_list", on=INVENTORY_SCREEN)
+    inventory_items = Selector(".inventory_item", on=INVENTORY_SCREEN)
+    item_descriptions = Selector(".inventory_item_desc", on=INVENTORY_SCREEN)
+    item_buttons = Selector("button.btn_inventory", on=INVENTORY_SCREEN)
+    sort_dropdown = Selector(".product_sort_container", on=INVENTORY_SCREEN)
+    item_names = Selector(".inventory_item_name", on=INVENTORY_SCREEN)
+    item_prices = Selector(".inventory_item_price", on=INVENTORY_SCREEN)
+    add_to_cart_buttons = Selector("#add-to-cart-", on=INVENTORY_SCREEN, optional=True,
+                                   probe="[id^='add-to-cart-']")
+    shopping_cart_button = Selector("#shopping_cart_container")
+    screenshot_regions = {"inventory_list": inventory_list}
+    # Anonymous users are redirected to the login page, so its button also ends the wait
+    # and `is_displayed` tells the two apart without waiting for a timeout.
+    readiness = Readiness("domcontentloaded", f"{inventory_list}, {LoginPage.login_button}")
+
+    async def open(self) -> None:
+        """
+        Navigates directly to the inventory page.
+        """
+        await self.navigate(self.url, idempotent=True)
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.sort_dropdown = ".product_sort_container"
-        self.item_names = ".inventory_item_name"
-        self.item_prices = ".inventory_item_price"
-        self.add_to_cart_buttons = "#add-to-cart-"
-        self.shopping_cart_button = "#shopping_cart_container"
+    async def seed_cart(self, names: list[str]) -> None:
+        """
+        Makes the next navigation start with exactly these items in the cart, without any
+        clicks. An init script writes the cart to local storage in the first document of the
+        site's origin; a guard in session storage keeps later navigations of the same page
+        from overwriting the cart the test changes. Every call gets a newer token than the
+        last, so seeding again, e.g. after logging in again, still applies once.
+
+        Args:
+            names (list[str]): The ids of the products, e.g. `sauce-labs-backpack`.
+
+        Raises:
+            ValueError: If a product is unknown.
+        """
+        unknown = [name for name in names if name not in PRODUCT_IDS]
+        if unknown:
+            raise ValueError(f"Invalid product names: {unknown}")
+
+        url = urlsplit(self.url)
+        seed = {"origin": f"{url.scheme}://{url.netloc}", "key": CART_STORAGE_KEY,
+                "ids": [PRODUCT_IDS[name] for name in names], "token": time.time_ns() // 1000}
+        self.logger.info(f"Seeding cart with {names}")
+        await self.page.context.add_init_script(CART_SEED_SCRIPT % json.dumps(seed))
+
+    async def is_displayed(self, timeout: float = 5000) -> bool:
+        """
+        Checks whether the inventory list is shown, which only happens for a logged-in user.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in milliseconds. Defaults to 5000.
+
+        Returns:
+            bool: True if the inventory list is visible, False otherwise.
+        """
+        try:
+            await self.locator(self.inventory_list).wait_for(timeout=timeout)
+        except PlaywrightTimeoutError:
+            return False
+        return True
 
     async def sort_by(self, sort_option: str) -> None:
         """
@@ -32,9 +163,31 @@ class InventoryPage(BasePage):
             sort_option (str): The sorting option (e.g., "Name (A to Z)", "Price (low to high)").
         """
         self.logger.info(f"Sorting items by: {sort_option}")
-        await self.select_option(self.sort_dropdown, sort_option)
+        await self.select_option(self.sort_dropdown, sort_option, idempotent=True)
         self.logger.info("Items sorted successfully.")
 
+    async def get_inventory_snapshot(self) -> list[InventoryItem]:
+        """
+        Reads the name, description, price and cart button of every item listed on the
+        inventory page in a single in-page evaluation, instead of one round-trip per element.
+
+        Returns:
+            list[InventoryItem]: The items in the order they are displayed.
+        """
+        selectors = {
+            "name": self.item_names,
+            "description": self.item_descriptions,
+            "price": self.item_prices,
+            "button": self.item_buttons,
+        }
+        rows = await self.locator(self.inventory_items).evaluate_all(
+            SNAPSHOT_SCRIPT, selectors)
+        items = [InventoryItem(row["name"], row["description"],
+                               float(row["price"].replace('$', '')), row["buttonId"])
+                 for row in rows]
+        self.logger.debug(f"Inventory snapshot with {len(items)} items")
+        return items
+
     async def get_item_names(self) -> list[str]:
         """
         Retrieves the names of all items listed on the inventory page.
@@ -43,8 +196,7 @@ class InventoryPage(BasePage):
             list[str]: A list of item names as strings.
         """
         self.logger.info("Retrieving item names from the inventory page.")
-        elements = await self.page.query_selector_all(self.item_names)
-        item_names = [await element.inner_text() for element in elements]
+        item_names = [item.name for item in await self.get_inventory_snapshot()]
         self.logger.info(f"Retrieved item names: {item_names}")
         return item_names
 
@@ -56,8 +208,7 @@ class InventoryPage(BasePage):
             list[float]: A list of item prices as floats.
         """
         self.logger.info("Retrieving item prices from the inventory page.")
-        elements = await self.page.query_selector_all(self.item_prices)
-        item_prices = [float((await element.inner_text()).replace('$', '')) for element in elements]
+        item_prices = [item.price for item in await self.get_inventory_snapshot()]
         self.logger.info(f"Retrieved item prices: {item_prices}")
         return item_prices
 
@@ -69,14 +220,14 @@ class InventoryPage(BasePage):
             names (list[str]): A list of item names to be added to the shopping cart.
         """
         self.logger.info(f"Adding items to cart: {names}")
-        for name in names:
-            await self.click(f"{self.add_to_cart_buttons}{name}")
-            self.logger.info(f"Added {name} to the cart.")
+        await self.run_batch(
+            [BatchStep("click", f"{self.add_to_cart_buttons}{name}") for name in names])
+        self.logger.info(f"Added {names} to the cart.")
 
     async def click_on_shopping_cart(self) -> None:
         """
         Navigates to the shopping cart by clicking the shopping cart button.
         """
         self.logger.info("Navigating to the shopping cart.")
-        await self.click(self.shopping_cart_button)
+        await self.click(self.shopping_cart_button, idempotent=True)
         self.logger.info("Navigated to the shopping cart successfully.")
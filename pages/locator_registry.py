@@ -0,0 +1,135 @@
+"""
+This module provides the locator registry of the page objects. Page objects declare their
+selectors as `Selector` strings, which say on which screen the element lives and whether it
+must always be there. The registry builds each `Locator` once per page and reuses it, and can
+check every declared selector of a page object in a single in-page pass, so a broken selector
+fails in milliseconds instead of as a timeout in the middle of a test.
+"""
+
+import weakref
+from fnmatch import fnmatch
+from urllib.parse import urlsplit
+
+from playwright.async_api import Locator, Page
+from utilities.logger import Logger
+
+VALIDATE_SCRIPT = """
+(selectors) => selectors.map((selector) => {
+    try {
+        return { count: document.querySelectorAll(selector).length };
+    } catch (error) {
+        return { error: error.message };
+    }
+})
+"""
+
+
+class Selector(str):
+    """
+    A CSS selector declared by a page object.
+
+    Args:
+        value (str): The selector, or the prefix of a family of selectors.
+        on (str, optional): A glob matched against the URL path of the screen the element
+                            lives on. Defaults to any screen the page object validates on.
+        optional (bool, optional): Whether the element may be absent, e.g. because it depends
+                                   on the cart contents. Optional selectors are only checked
+                                   for syntax. Defaults to False.
+        probe (str, optional): The selector validated instead of the value, for prefixes
+                               like `#add-to-cart-` that are completed at run time.
+    """
+    on: str | None
+    optional: bool
+    probe: str | None
+
+    def __new__(cls, value: str, on: str | None = None, optional: bool = False,
+                probe: str | None = None):
+        selector = super().__new__(cls, value)
+        selector.on = on
+        selector.optional = optional
+        selector.probe = probe
+        return selector
+
+    @property
+    def checked(self) -> str:
+        """
+        The selector the validation runs, the probe for prefixes.
+        """
+        return self.probe or str(self)
+
+
+class LocatorRegistry:
+    """
+    The cached locators of a single page and the selector validation.
+    """
+    logger = Logger(__name__)
+    _registries: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    _validated: set[tuple[str, str]] = set()
+
+    def __init__(self, page: Page):
+        self.page = page
+        self._locators: dict[str, Locator] = {}
+
+    @classmethod
+    def for_page(cls, page: Page) -> "LocatorRegistry":
+        """
+        Returns the registry of a page, shared by every page object built on it.
+
+        Args:
+            page (Page): The Playwright page.
+
+        Returns:
+            LocatorRegistry: The page's registry.
+        """
+        registry = cls._registries.get(page)
+        if registry is None:
+            registry = cls._registries[page] = cls(page)
+        return registry
+
+    def get(self, selector: str) -> Locator:
+        """
+        Returns the locator of a selector, building it on first use.
+
+        Args:
+            selector (str): The selector.
+
+        Returns:
+            Locator: The cached locator.
+        """
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
+
+    async def validate(self, owner: str, selectors: dict[str, Selector]) -> None:
+        """
+        Checks in a single in-page evaluation that the selectors declared for the current
+        screen are valid CSS and, unless optional, match at least one element. Each page
+        object is validated once per screen and process.
+
+        Args:
+            owner (str): The page-object class declaring the selectors.
+            selectors (dict[str, Selector]): The selectors by attribute name.
+
+        Raises:
+            RuntimeError: If any selector is invalid or matches nothing.
+        """
+        path = urlsplit(self.page.url).path
+        if (owner, path) in self._validated:
+            return
+
+        current = {name: selector for name, selector in selectors.items()
+                   if selector.on is None or fnmatch(path, selector.on)}
+        results = await self.page.evaluate(
+            VALIDATE_SCRIPT, [selector.checked for selector in current.values()])
+        problems = []
+        for (name, selector), result in zip(current.items(), results):
+            if "error" in result:
+                problems.append(f"{name} '{selector.checked}' is invalid: {result['error']}")
+            elif result["count"] == 0 and not selector.optional:
+                problems.append(f"{name} '{selector.checked}' matches nothing")
+        if problems:
+            raise RuntimeError(f"Broken selectors in {owner} on {path}: " + "; ".join(problems))
+
+        self._validated.add((owner, path))
+        self.logger.info(f"Validated {len(current)} selectors of {owner} on {path}")
@@ -4,8 +4,9 @@ and provides methods to interact with the login functionality of the
 application using Playwright's Page object.
 """
 
-from playwright.async_api import Page
-from pages.base_page import BasePage
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from pages.base_page import BasePage, Readiness
+from pages.locator_registry import Selector
 from utilities.logger import Logger
 
 
@@ -14,12 +15,11 @@ class LoginPage(BasePage):
     The LoginPage class is a page object model (POM) representing the login page.
     """
     logger = Logger(__name__)
-
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.username_input = "#user-name"
-        self.password_input = "#password"
-        self.login_button = "#login-button"
+    username_input = Selector("#user-name")
+    password_input = Selector("#password")
+    login_button = Selector("#login-button")
+    logged_in_url = "**/inventory.html"
+    readiness = Readiness("domcontentloaded", login_button)
 
     async def enter_username(self, username: str) -> None:
         """
@@ -29,7 +29,7 @@ class LoginPage(BasePage):
             username (str): The username to be entered into the username input field.
         """
         self.logger.info(f"Entering username: {username}")
-        await self.fill(self.username_input, username)
+        await self.fill(self.username_input, username, idempotent=True)
 
     async def enter_password(self, password: str) -> None:
         """
@@ -40,7 +40,7 @@ class LoginPage(BasePage):
 
         """
         self.logger.info("Entering password: [REDACTED]")
-        await self.fill(self.password_input, password)
+        await self.fill(self.password_input, password, idempotent=True)
 
     async def click_login_button(self) -> None:
         """
@@ -63,3 +63,20 @@ class LoginPage(BasePage):
         await self.enter_password(password)
         await self.click_login_button()
         self.logger.info("Login process completed")
+
+    async def is_logged_in(self, timeout: float = 5000) -> bool:
+        """
+        Waits for the redirect that follows a successful login.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in milliseconds. Defaults to 5000.
+
+        Returns:
+            bool: True if the user landed on the inventory page, False otherwise.
+        """
+        try:
+            await self.page.wait_for_url(self.logged_in_url, timeout=timeout)
+        except PlaywrightTimeoutError:
+            self.logger.warning("Login did not redirect to the inventory page")
+            return False
+        return True
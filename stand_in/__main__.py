@@ -0,0 +1,30 @@
+"""
+Runs the Swag Labs stand-in server in the foreground, e.g. for local debugging, benchmarks
+or load runs: `python -m stand_in --port 8765`.
+"""
+
+import argparse
+import threading
+
+from stand_in.server import StandInServer
+
+
+def main() -> None:
+    """
+    Parses the command line and serves until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="Serve the Swag Labs stand-in locally.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on.")
+    args = parser.parse_args()
+
+    server = StandInServer(args.host, args.port)
+    print(f"Serving Swag Labs stand-in on {server.start()} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
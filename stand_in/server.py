@@ -0,0 +1,78 @@
+"""
+This module provides the StandInServer class, a local stand-in for the Swag Labs site.
+It serves static copies of the login, inventory, cart and checkout pages with the same
+selectors as https://www.saucedemo.com/, so the suite can run offline at loopback latency.
+"""
+
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from utilities.logger import Logger
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+class StandInRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Serves the stand-in pages from the static directory and routes access logs to the
+    framework logger instead of stderr.
+    """
+    logger = Logger(__name__)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        self.logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class StandInServer:
+    """
+    A threaded HTTP server serving the Swag Labs stand-in on the loopback interface.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL of the running server, with a trailing slash like `config.URL`.
+
+        Returns:
+            str: The base URL.
+        """
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> str:
+        """
+        Starts serving in a background thread. Port 0 picks a free port.
+
+        Returns:
+            str: The base URL the server is listening on.
+        """
+        handler = partial(StandInRequestHandler, directory=STATIC_DIR)
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stand-in-server", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Stand-in server listening on {self.url}")
+        return self.url
+
+    def stop(self) -> None:
+        """
+        Stops the server and waits for the serving thread to exit.
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+        self.logger.info("Stand-in server stopped")
@@ -0,0 +1,289 @@
+/*
+ * Minimal stand-in for the Swag Labs storefront. It mirrors the markup, selectors and
+ * client-side state of https://www.saucedemo.com/ that the page objects rely on:
+ * the `session-username` cookie for the login session and the `cart-contents`
+ * localStorage entry holding the ids of the products in the cart.
+ */
+(function () {
+  "use strict";
+
+  var PASSWORD = "secret_sauce";
+  var USERS = ["standard_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"];
+  var LOCKED_OUT_USER = "locked_out_user";
+  var SESSION_COOKIE = "session-username";
+  var SESSION_SECONDS = 600;
+  var CART_KEY = "cart-contents";
+  var TAX_RATE = 0.08;
+
+  var PRODUCTS = [
+    { id: 4, slug: "sauce-labs-backpack", name: "Sauce Labs Backpack", price: 29.99,
+      desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection." },
+    { id: 0, slug: "sauce-labs-bike-light", name: "Sauce Labs Bike Light", price: 9.99,
+      desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included." },
+    { id: 1, slug: "sauce-labs-bolt-t-shirt", name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+      desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt." },
+    { id: 5, slug: "sauce-labs-fleece-jacket", name: "Sauce Labs Fleece Jacket", price: 49.99,
+      desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office." },
+    { id: 2, slug: "sauce-labs-onesie", name: "Sauce Labs Onesie", price: 7.99,
+      desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel." },
+    { id: 3, slug: "test.allthethings()-t-shirt-(red)", name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+      desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton." }
+  ];
+
+  var SORTERS = {
+    az: function (a, b) { return a.name.localeCompare(b.name); },
+    za: function (a, b) { return b.name.localeCompare(a.name); },
+    lohi: function (a, b) { return a.price - b.price; },
+    hilo: function (a, b) { return b.price - a.price; }
+  };
+
+  function getSessionUser() {
+    var match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+    return match ? decodeURIComponent(match[1]) : null;
+  }
+
+  function setSessionUser(username) {
+    document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) +
+      "; path=/; max-age=" + SESSION_SECONDS;
+  }
+
+  function getCart() {
+    try {
+      return JSON.parse(localStorage.getItem(CART_KEY)) || [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function setCart(ids) {
+    if (ids.length) {
+      localStorage.setItem(CART_KEY, JSON.stringify(ids));
+    } else {
+      localStorage.removeItem(CART_KEY);
+    }
+  }
+
+  function findProduct(id) {
+    for (var i = 0; i < PRODUCTS.length; i++) {
+      if (PRODUCTS[i].id === id) {
+        return PRODUCTS[i];
+      }
+    }
+    return null;
+  }
+
+  function formatPrice(value) {
+    return "$" + value.toFixed(2);
+  }
+
+  function element(tag, attributes, children) {
+    var node = document.createElement(tag);
+    Object.keys(attributes || {}).forEach(function (name) {
+      if (name === "text") {
+        node.textContent = attributes[name];
+      } else {
+        node.setAttribute(name, attributes[name]);
+      }
+    });
+    (children || []).forEach(function (child) {
+      node.appendChild(child);
+    });
+    return node;
+  }
+
+  function go(path) {
+    window.location.href = path;
+  }
+
+  function renderCartBadge() {
+    var link = document.querySelector(".shopping_cart_link");
+    var badge = link.querySelector(".shopping_cart_badge");
+    var count = getCart().length;
+    if (badge) {
+      link.removeChild(badge);
+    }
+    if (count) {
+      link.appendChild(element("span", { "class": "shopping_cart_badge", "data-test": "shopping-cart-badge", text: String(count) }));
+    }
+  }
+
+  function renderHeader() {
+    var header = document.getElementById("header_container");
+    if (!header) {
+      return;
+    }
+    header.insertBefore(element("div", { "class": "primary_header" }, [
+      element("div", { "class": "app_logo", text: "Swag Labs" }),
+      element("div", { id: "shopping_cart_container", "class": "shopping_cart_container" }, [
+        element("a", { "class": "shopping_cart_link", "data-test": "shopping-cart-link", href: "/cart.html", "aria-label": "Shopping cart" })
+      ])
+    ]), header.firstChild);
+    renderCartBadge();
+  }
+
+  function cartButton(product) {
+    var inCart = getCart().indexOf(product.id) !== -1;
+    var button = element("button", {
+      id: (inCart ? "remove-" : "add-to-cart-") + product.slug,
+      "class": "btn btn_small btn_inventory " + (inCart ? "btn_secondary" : "btn_primary"),
+      "data-test": (inCart ? "remove-" : "add-to-cart-") + product.slug,
+      name: (inCart ? "remove-" : "add-to-cart-") + product.slug,
+      text: inCart ? "Remove" : "Add to cart"
+    });
+    button.addEventListener("click", function () {
+      var cart = getCart().filter(function (id) { return id !== product.id; });
+      if (!inCart) {
+        cart.push(product.id);
+      }
+      setCart(cart);
+      button.parentNode.replaceChild(cartButton(product), button);
+      renderCartBadge();
+    });
+    return button;
+  }
+
+  function renderLogin() {
+    var form = document.getElementById("login_form");
+    var errorContainer = document.querySelector(".error-message-container");
+    var redirectError = new URLSearchParams(window.location.search).get("error");
+
+    function showError(message) {
+      errorContainer.classList.add("error");
+      errorContainer.innerHTML = "";
+      errorContainer.appendChild(element("h3", { "data-test": "error", text: "Epic sadface: " + message }));
+    }
+
+    if (redirectError) {
+      showError(redirectError);
+    }
+    form.addEventListener("submit", function (event) {
+      var username = document.getElementById("user-name").value;
+      var password = document.getElementById("password").value;
+      event.preventDefault();
+      if (!username) {
+        showError("Username is required");
+      } else if (!password) {
+        showError("Password is required");
+      } else if (username === LOCKED_OUT_USER && password === PASSWORD) {
+        showError("Sorry, this user has been locked out.");
+      } else if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+        showError("Username and password do not match any user in this service");
+      } else {
+        setSessionUser(username);
+        go("/inventory.html");
+      }
+    });
+  }
+
+  function renderInventory() {
+    var list = document.querySelector(".inventory_list");
+    var select = document.querySelector(".product_sort_container");
+
+    function renderItems() {
+      var products = PRODUCTS.slice().sort(SORTERS[select.value] || SORTERS.az);
+      list.innerHTML = "";
+      products.forEach(function (product) {
+        list.appendChild(element("div", { "class": "inventory_item", "data-test": "inventory-item" }, [
+          element("div", { "class": "inventory_item_description" }, [
+            element("div", { "class": "inventory_item_label" }, [
+              element("a", { id: "item_" + product.id + "_title_link", href: "#" }, [
+                element("div", { "class": "inventory_item_name", "data-test": "inventory-item-name", text: product.name })
+              ]),
+              element("div", { "class": "inventory_item_desc", "data-test": "inventory-item-desc", text: product.desc })
+            ]),
+            element("div", { "class": "pricebar" }, [
+              element("div", { "class": "inventory_item_price", "data-test": "inventory-item-price", text: formatPrice(product.price) }),
+              cartButton(product)
+            ])
+          ])
+        ]));
+      });
+    }
+
+    select.addEventListener("change", renderItems);
+    renderItems();
+  }
+
+  function renderCartItems(list) {
+    getCart().map(findProduct).filter(Boolean).forEach(function (product) {
+      list.appendChild(element("div", { "class": "cart_item", "data-test": "inventory-item" }, [
+        element("div", { "class": "cart_quantity", text: "1" }),
+        element("div", { "class": "cart_item_label" }, [
+          element("div", { "class": "inventory_item_name", "data-test": "inventory-item-name", text: product.name }),
+          element("div", { "class": "inventory_item_desc", text: product.desc }),
+          element("div", { "class": "inventory_item_price", "data-test": "inventory-item-price", text: formatPrice(product.price) })
+        ])
+      ]));
+    });
+  }
+
+  function renderCart() {
+    renderCartItems(document.querySelector(".cart_list"));
+    document.getElementById("continue-shopping").addEventListener("click", function () {
+      go("/inventory.html");
+    });
+    document.getElementById("checkout").addEventListener("click", function () {
+      go("/checkout-step-one.html");
+    });
+  }
+
+  function renderCheckoutInformation() {
+    var errorContainer = document.querySelector(".error-message-container");
+    document.getElementById("cancel").addEventListener("click", function () {
+      go("/cart.html");
+    });
+    document.getElementById("checkout_info_form").addEventListener("submit", function (event) {
+      var missing = [["first-name", "First Name"], ["last-name", "Last Name"], ["postal-code", "Postal Code"]]
+        .filter(function (field) { return !document.getElementById(field[0]).value; });
+      event.preventDefault();
+      if (missing.length) {
+        errorContainer.classList.add("error");
+        errorContainer.innerHTML = "";
+        errorContainer.appendChild(element("h3", { "data-test": "error", text: "Error: " + missing[0][1] + " is required" }));
+      } else {
+        go("/checkout-step-two.html");
+      }
+    });
+  }
+
+  function renderCheckoutOverview() {
+    var subtotal = getCart().map(findProduct).filter(Boolean)
+      .reduce(function (sum, product) { return sum + product.price; }, 0);
+    var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+    renderCartItems(document.querySelector(".cart_list"));
+    document.querySelector(".summary_subtotal_label").textContent = "Item total: " + formatPrice(subtotal);
+    document.querySelector(".summary_tax_label").textContent = "Tax: " + formatPrice(tax);
+    document.querySelector(".summary_total_label").textContent = "Total: " + formatPrice(subtotal + tax);
+    document.getElementById("cancel").addEventListener("click", function () {
+      go("/inventory.html");
+    });
+    document.getElementById("finish").addEventListener("click", function () {
+      setCart([]);
+      go("/checkout-complete.html");
+    });
+  }
+
+  function renderCheckoutComplete() {
+    document.getElementById("back-to-products").addEventListener("click", function () {
+      go("/inventory.html");
+    });
+  }
+
+  var PAGES = {
+    login: renderLogin,
+    inventory: renderInventory,
+    cart: renderCart,
+    "checkout-step-one": renderCheckoutInformation,
+    "checkout-step-two": renderCheckoutOverview,
+    "checkout-complete": renderCheckoutComplete
+  };
+
+  var page = document.body.getAttribute("data-page");
+  if (page !== "login" && !getSessionUser()) {
+    go("/?error=" + encodeURIComponent("You can only access '" + window.location.pathname +
+      "' when you are logged in."));
+    return;
+  }
+  renderHeader();
+  PAGES[page]();
+}());
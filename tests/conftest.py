@@ -1,49 +1,502 @@
 """
-Module for setting up browser and login page fixtures using pytest.
+Module for setting up browser pool, page and login page fixtures using pytest,
+and the hooks that configure parallel runs across xdist workers.
 """
 
+import json
+import os
+import shutil
+import sys
+from fnmatch import fnmatch
+
+import allure
 import pytest
 
-from drivers.browser_factory import BrowserFactory
+from drivers.browser_matrix import BrowserMatrix
+from drivers.browser_pool import BrowserPool
+from drivers.failure_capture import FailureCapture
+from drivers.har_cache import HarCache
+from drivers.resource_policy import ResourcePolicy
+from drivers.playwright_runtime import PlaywrightRuntime
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
+from pages.inventory_page import InventoryPage
 from pages.login_page import LoginPage
 from config import config
+from stand_in.server import StandInServer
+from utilities import utils
+from utilities.accessibility_scanner import AccessibilityScanner
+from utilities.artifact_sink import ArtifactSink
+from utilities.auth_state_cache import AuthStateCache
 from utilities.logger import Logger
+from utilities.step_retry import FlakinessLedger
+from utilities.step_timer import StepTimer
+from utilities.test_scheduler import HistoryScheduler
+from utilities.visual_diff import DiffOptions, VisualDiff
 
 logger = Logger(__name__)
+stand_in_server_key = pytest.StashKey[StandInServer]()
+phase_report_key = pytest.StashKey[dict[str, pytest.TestReport]]()
+worker_metrics = (StepTimer, FlakinessLedger, AccessibilityScanner, FailureCapture)
 
 
-@pytest.fixture(name="page")
-async def page_fixture():
+def pytest_configure(config):  # pylint: disable=redefined-outer-name
+    """
+    Registers the history-aware scheduler when `SCHEDULE_BY_HISTORY` is enabled.
+
+    Args:
+        config (pytest.Config): The pytest configuration.
+    """
+    HistoryScheduler.install(config)
+
+
+def pytest_xdist_auto_num_workers():
+    """
+    Lets `WORKERS` override the number of worker processes started by `-n auto`.
+
+    Returns:
+        int | None: The configured number of workers, or None to use one per CPU core.
+    """
+    return config.WORKERS or None
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrizes every test that uses the `page` fixture over the `MATRIX` cells.
+
+    Args:
+        metafunc (pytest.Metafunc): The test being collected.
+    """
+    if config.MATRIX and "page" in metafunc.fixturenames:
+        cells = BrowserMatrix.cells()
+        metafunc.parametrize("matrix_cell", cells, ids=[cell.id for cell in cells],
+                             indirect=True)
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item):
     """
-    Pytest fixture to initialize a browser instance and return a new page.
+    Keeps the report of every test phase on the test, so fixtures can tell in their teardown
+    whether the test failed.
+
+    Args:
+        item (pytest.Item): The test being reported.
+
+    Returns:
+        pytest.TestReport: The phase report.
+    """
+    report = yield
+    item.stash.setdefault(phase_report_key, {})[report.when] = report
+    return report
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """
+    Removes the per-worker metrics files of earlier runs and starts the Swag Labs stand-in
+    server from the controller process when `LOCAL_SERVER` is enabled, before any xdist
+    worker is spawned. Workers reach it through `config.URL`.
+
+    Args:
+        session (pytest.Session): The starting test session.
+    """
+    if hasattr(session.config, "workerinput"):
+        return
+    for metrics in worker_metrics:
+        utils.remove_worker_files(config.METRICS_DIR, metrics.metrics_file)
+    if not config.LOCAL_SERVER:
+        return
+
+    server = StandInServer(port=config.LOCAL_SERVER_PORT)
+    server.start()
+    session.config.stash[stand_in_server_key] = server
+
+
+def pytest_sessionfinish(session):
+    """
+    Merges the metrics files of the xdist workers, attaches the merged summaries to the
+    Allure report and writes the Allure environment once from the controller process, and
+    stops the stand-in server. Workers share the results directory, where their uniquely
+    named result files merge on their own.
+
+    Args:
+        session (pytest.Session): The finished test session.
+    """
+    VisualDiff.shutdown()
+    server = session.config.stash.get(stand_in_server_key, None)
+    if server is not None:
+        server.stop()
+    if hasattr(session.config, "workerinput"):
+        return
+
+    for metrics in worker_metrics:
+        summary = utils.merge_worker_metrics(config.METRICS_DIR, metrics.metrics_file,
+                                             metrics.summarize)
+        if summary:
+            allure.global_attach(json.dumps(summary, indent=2), name=metrics.metrics_title,
+                                 attachment_type=allure.attachment_type.JSON)
+            logger.info(f"Worker metrics merged into {metrics.metrics_file}.")
+
+    report_dir = session.config.getoption("allure_report_dir", None)
+    if not report_dir:
+        return
+
+    os.makedirs(report_dir, exist_ok=True)
+    cells = BrowserMatrix.cells()
+    environment = {
+        "Browser": ", ".join(dict.fromkeys(cell.browser for cell in cells)),
+        "Device": ", ".join(dict.fromkeys(cell.device for cell in cells)),
+        "Matrix": ", ".join(cell.id for cell in cells),
+        "Headless": config.HEADLESS,
+        "Launch profile": config.LAUNCH_PROFILE,
+        "URL": config.URL,
+        "Workers": session.config.getoption("numprocesses", None) or 1,
+    }
+    with open(os.path.join(report_dir, "environment.properties"), "w", encoding="utf-8") as file:
+        file.writelines(f"{key}={value}\n" for key, value in environment.items())
+
+
+@pytest.fixture(name="artifact_sink", scope="session")
+def artifact_sink_fixture(pytestconfig):
+    """
+    Pytest fixture providing the writer of Allure attachments. Attachments are stored once
+    per content, written off the event loop and capped in total size; the pending writes are
+    finished at the end of the session.
+
+    Args:
+        pytestconfig (pytest.Config): The pytest configuration.
 
     Yields:
-        page (playwright.async_api.Page): A new browser page object for use in tests.
+        artifact_sink (ArtifactSink): The session-wide artifact sink.
     """
-    logger.info("Initializing browser...")
-    try:
-        browser_instance = BrowserFactory.get_browser(
-            browser_type=config.BROWSER,
-            headless=config.HEADLESS,
-            mobile=config.MOBILE
-        )
-        browser = await browser_instance.launch_browser()
-        logger.info("Browser launched successfully.")
+    sink = ArtifactSink(pytestconfig)
+    yield sink
+    sink.close()
+
+
+def _attach_metrics(artifact_sink: ArtifactSink, metrics, summary: str) -> None:
+    # A worker's summary covers only its own tests; the controller attaches the merged one.
+    if utils.get_worker_id() == "master":
+        artifact_sink.attach(summary, metrics.metrics_title, allure.attachment_type.JSON)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def step_timing_summary(artifact_sink):
+    """
+    Pytest fixture that, when `STEP_TIMING` is enabled, writes the step latency summary of
+    the session to the metrics directory and attaches it to the Allure report.
+
+    Args:
+        artifact_sink (ArtifactSink): The session-wide artifact sink.
+    """
+    yield
+    if not StepTimer.enabled or not StepTimer.records:
+        return
+
+    _attach_metrics(artifact_sink, StepTimer, StepTimer.write_summary())
+    logger.info(f"Step timing summary written for {len(StepTimer.records)} steps.")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def flakiness_summary(artifact_sink):
+    """
+    Pytest fixture that writes the flakiness ledger of the session, the retried page-object
+    actions per selector, to the metrics directory and attaches it to the Allure report.
+
+    Args:
+        artifact_sink (ArtifactSink): The session-wide artifact sink.
+    """
+    yield
+    if not FlakinessLedger.records:
+        return
+
+    _attach_metrics(artifact_sink, FlakinessLedger, FlakinessLedger.write_summary())
+    logger.info(f"Flakiness ledger written for {len(FlakinessLedger.records)} failed attempts.")
+
+
+@pytest.fixture(scope="session")
+def accessibility_scanner(artifact_sink):
+    """
+    Pytest fixture providing the axe-core accessibility scanner. Contexts of the tests that
+    use it get axe-core injected through an init script. At the end of the session the scan
+    durations per page are written to the metrics directory and attached to the Allure report.
+
+    Args:
+        artifact_sink (ArtifactSink): The session-wide artifact sink.
+
+    Yields:
+        accessibility_scanner (AccessibilityScanner): The session-wide accessibility scanner.
+    """
+    scanner = AccessibilityScanner()
+    yield scanner
+    if not scanner.scans:
+        return
+
+    _attach_metrics(artifact_sink, scanner, scanner.write_summary())
+    logger.info(f"Accessibility scan summary written for {len(scanner.scans)} scans.")
+
+
+@pytest.fixture(name="playwright_runtime", scope="session")
+async def playwright_runtime_fixture():
+    """
+    Pytest fixture that owns the Playwright driver connection for the whole session and
+    stops it once every test has finished.
+
+    Yields:
+        playwright_runtime (PlaywrightRuntime): The runtime shared by all browser drivers.
+    """
+    runtime = PlaywrightRuntime.get_instance()
+    await runtime.start()
+    yield runtime
+    logger.info(f"Playwright runtime before shutdown: {runtime.stats()}")
+    await runtime.stop()
+    logger.info(f"Playwright runtime after shutdown: {runtime.stats()}")
+
+
+@pytest.fixture(name="browser_pool", scope="session")
+async def browser_pool_fixture(playwright_runtime):
+    """
+    Pytest fixture that owns the browsers for the whole session (or xdist worker). In matrix
+    mode the browsers of every cell are launched concurrently before the first test.
+
+    Args:
+        playwright_runtime (PlaywrightRuntime): The shared Playwright runtime, which is started
+                                                before and stopped after the pool.
+
+    Yields:
+        browser_pool (BrowserPool): A pool that launches each browser type once and hands out
+                                    fresh contexts.
+    """
+    pool = BrowserPool(headless=config.HEADLESS, mobile=config.MOBILE)
+    if config.MATRIX:
+        await pool.warm_up(BrowserMatrix.cells())
+    logger.info(f"Browser pool ready, Playwright runtime: {playwright_runtime.stats()}")
+    yield pool
+    await pool.close()
+
+
+@pytest.fixture(name="auth_state_cache", scope="session")
+def auth_state_cache_fixture(browser_pool):
+    """
+    Pytest fixture providing the session-wide cache of authenticated storage states.
+
+    Args:
+        browser_pool (BrowserPool): The session-wide browser pool.
+
+    Returns:
+        auth_state_cache (AuthStateCache): The cache used to seed authenticated contexts.
+    """
+    return AuthStateCache(browser_pool)
+
+
+@pytest.fixture(name="har_cache", scope="session")
+def har_cache_fixture():
+    """
+    Pytest fixture providing HAR recording or replay according to `HAR_MODE`.
+
+    Returns:
+        har_cache (HarCache): The session-wide HAR cache.
+    """
+    return HarCache()
+
+
+@pytest.fixture(name="failure_capture", scope="session")
+def failure_capture_fixture(artifact_sink):
+    """
+    Pytest fixture providing failure-only tracing and video capture according to
+    `FAILURE_CAPTURE`. At the end of the session the capture overhead per test is written to
+    the metrics directory and attached to the Allure report.
+
+    Args:
+        artifact_sink (ArtifactSink): The session-wide artifact sink.
+
+    Yields:
+        failure_capture (FailureCapture): The session-wide failure capture.
+    """
+    capture = FailureCapture()
+    yield capture
+    if not capture.overheads:
+        return
+
+    _attach_metrics(artifact_sink, capture, capture.write_summary())
+    logger.info(f"Failure capture summary written for {len(capture.overheads)} tests.")
+
+
+@pytest.fixture(name="resource_policy")
+def resource_policy_fixture(request):
+    """
+    Pytest fixture resolving the resource blocking policy for the test. Visual tests
+    (`test_*_visual`) always get the `none` policy so their snapshots stay faithful. Otherwise
+    an indirect fixture parameter wins over a `resource_policy` marker, which wins over the
+    `RESOURCE_POLICY` default. The marker takes either a preset name or `block_types` and
+    `block_urls` keyword arguments.
+
+    Args:
+        request (pytest.FixtureRequest): The requesting test context.
+
+    Returns:
+        resource_policy (ResourcePolicy): The policy to apply to the test's context.
+    """
+    if fnmatch(request.node.originalname, "test_*_visual"):
+        return ResourcePolicy.from_name("none")
+    if hasattr(request, "param"):
+        return ResourcePolicy.from_name(request.param)
+
+    marker = request.node.get_closest_marker("resource_policy")
+    if marker is None:
+        return ResourcePolicy.from_name(config.RESOURCE_POLICY)
+    if marker.args:
+        return ResourcePolicy.from_name(marker.args[0])
+    return ResourcePolicy("custom", marker.kwargs.get("block_types", ()),
+                          marker.kwargs.get("block_urls", ()))
 
-        context = await browser_instance.create_context(browser)
-        new_page = await context.new_page()
-        logger.info("New page created.")
 
-        yield new_page
+@pytest.fixture(name="matrix_cell")
+def matrix_cell_fixture(request):
+    """
+    Pytest fixture providing the browser × device cell the test runs in: the cell the test
+    is parametrized with in matrix mode, otherwise the configured browser and device.
+
+    Args:
+        request (pytest.FixtureRequest): The requesting test context.
+
+    Returns:
+        matrix_cell (MatrixCell): The browser and device of the test.
+    """
+    return getattr(request, "param", None) or BrowserMatrix.default_cell()
+
+
+@pytest.fixture(name="context_options")
+async def context_options_fixture(request, auth_state_cache, har_cache, failure_capture):
+    """
+    Pytest fixture providing the `new_context` options of the test. Tests that use the
+    `authenticated_page` or `seeded_cart_page` fixtures get a context seeded with the cached
+    storage state of the configured user. Depending on `HAR_MODE` and `FAILURE_CAPTURE`, the
+    context also records a HAR file named after the test or a video.
 
+    Args:
+        request (pytest.FixtureRequest): The requesting test context.
+        auth_state_cache (AuthStateCache): The session-wide authenticated state cache.
+        har_cache (HarCache): The session-wide HAR cache.
+        failure_capture (FailureCapture): The session-wide failure capture.
+
+    Returns:
+        context_options (dict): The keyword arguments for the context.
+    """
+    flow = request.node.nodeid
+    options = {**har_cache.context_options(flow), **failure_capture.context_options()}
+    if {"authenticated_page", "seeded_cart_page"} & set(request.fixturenames):
+        options["storage_state"] = await auth_state_cache.get_storage_state(
+            config.USER_USERNAME, config.USER_PASSWORD)
+    return options
+
+
+@pytest.fixture(name="browser_context")
+async def browser_context_fixture(browser_pool, context_options, matrix_cell):
+    """
+    Pytest fixture to create a fresh context in the pooled browser of the test's matrix cell,
+    which is also tagged on the Allure result, and to release it after the test.
+
+    Args:
+        browser_pool (BrowserPool): The session-wide browser pool.
+        context_options (dict): The keyword arguments for the context.
+        matrix_cell (MatrixCell): The browser and device the test runs in.
+
+    Yields:
+        browser_context (playwright.async_api.BrowserContext): The context of the test.
+    """
+    logger.info(f"Creating browser context for {matrix_cell.id}...")
+    allure.dynamic.tag(matrix_cell.id)
+    allure.dynamic.parameter("browser", matrix_cell.browser)
+    allure.dynamic.parameter("device", matrix_cell.device)
+    try:
+        context = await browser_pool.new_context(
+            matrix_cell.browser, device=matrix_cell.device, **context_options)
     except Exception as e:
         logger.error(f"An error occurred during browser setup: {str(e)}")
         raise
+    try:
+        yield context
     finally:
-        await new_page.close()
-        await context.close()
-        await browser.close()
-        logger.info("Browser closed.")
+        await browser_pool.release_context(context)
+        logger.info("Browser context closed.")
+
+
+@pytest.fixture(name="routed_context")
+async def routed_context_fixture(request, browser_context, har_cache, resource_policy):
+    """
+    Pytest fixture that routes the context's traffic: depending on `HAR_MODE`, it is recorded
+    to, or replayed from, a HAR file named after the test. The test's resource policy is
+    applied on top, so blocked requests never reach the HAR cache or the network. The
+    summaries of both are logged after the test.
+
+    Args:
+        request (pytest.FixtureRequest): The requesting test context.
+        browser_context (BrowserContext): The context of the test.
+        har_cache (HarCache): The session-wide HAR cache.
+        resource_policy (ResourcePolicy): The resource blocking policy for the test.
+
+    Yields:
+        routed_context (playwright.async_api.BrowserContext): The routed context.
+    """
+    flow = request.node.nodeid
+    har_replay = await har_cache.attach(browser_context, flow)
+    resource_blocker = await resource_policy.apply(browser_context)
+    yield browser_context
+    if har_replay is not None:
+        har_replay.log_summary()
+    if resource_blocker is not None:
+        resource_blocker.log_summary(flow)
+
+
+@pytest.fixture(name="captured_context")
+async def captured_context_fixture(request, routed_context, failure_capture, artifact_sink):
+    """
+    Pytest fixture that, depending on `FAILURE_CAPTURE`, traces and records the context. The
+    trace and video are kept and attached only if the test or its setup fails.
+
+    Args:
+        request (pytest.FixtureRequest): The requesting test context.
+        routed_context (BrowserContext): The routed context of the test.
+        failure_capture (FailureCapture): The session-wide failure capture.
+        artifact_sink (ArtifactSink): The session-wide artifact sink.
+
+    Yields:
+        captured_context (playwright.async_api.BrowserContext): The captured context.
+    """
+    capture = await failure_capture.attach(routed_context, request.node.nodeid)
+    yield routed_context
+    if capture is None:
+        return
+
+    reports = request.node.stash.get(phase_report_key, {}).values()
+    await capture.stop(failed=any(report.failed for report in reports))
+    await capture.flush()
+    failure_capture.record(capture)
+    for path in capture.saved:
+        await artifact_sink.attach_file(path, os.path.basename(path), path.rpartition(".")[2])
+
+
+@pytest.fixture(name="page")
+async def page_fixture(request, captured_context):
+    """
+    Pytest fixture to return a new page in the test's context. Tests that use the
+    `accessibility_scanner` fixture get axe-core injected into the context first. Pending
+    `load` timers of the page's navigations are cancelled after the test.
+
+    Args:
+        request (pytest.FixtureRequest): The requesting test context.
+        captured_context (BrowserContext): The routed and captured context of the test.
+
+    Yields:
+        page (playwright.async_api.Page): A new browser page object for use in tests.
+    """
+    if "accessibility_scanner" in request.fixturenames:
+        await request.getfixturevalue("accessibility_scanner").attach(captured_context)
+    new_page = await captured_context.new_page()
+    logger.info("New page created.")
+    yield new_page
+    await BasePage.cancel_load_timers(new_page)
 
 
 @pytest.fixture()
@@ -63,6 +516,8 @@ async def login_page(page):
         new_login_page = LoginPage(page)
         await new_login_page.navigate(config.URL)
         logger.info(f"Navigated to {config.URL}")
+        if config.VALIDATE_SELECTORS:
+            await new_login_page.validate_selectors()
         await new_login_page.login(config.USER_USERNAME, config.USER_PASSWORD)
         logger.info(f"User {config.USER_USERNAME} logged in successfully.")
 
@@ -70,3 +525,132 @@ async def login_page(page):
     except Exception as e:
         logger.error(f"An error occurred during login: {str(e)}")
         raise
+
+
+@pytest.fixture()
+async def authenticated_page(page, auth_state_cache):
+    """
+    Pytest fixture that opens the inventory page in a context seeded with the cached
+    storage state, skipping the login form. If the site rejects the cached state, the
+    entry is invalidated and the user logs in through the form once to refresh it.
+
+    Args:
+        page (playwright.async_api.Page): A browser page object from the `page` fixture.
+        auth_state_cache (AuthStateCache): The session-wide authenticated state cache.
+
+    Returns:
+        authenticated_page (InventoryPage): An instance of the `InventoryPage` class,
+                                            representing the logged-in state.
+    """
+    inventory_page = InventoryPage(page)
+    await inventory_page.open()
+    if await inventory_page.is_displayed():
+        logger.info(f"User {config.USER_USERNAME} restored from cached storage state.")
+    else:
+        await _refresh_login(page, auth_state_cache)
+    if config.VALIDATE_SELECTORS:
+        await inventory_page.validate_selectors()
+    return inventory_page
+
+
+@pytest.fixture()
+async def seeded_cart_page(request, page, auth_state_cache):
+    """
+    Pytest fixture that deep-links to the cart page of the cached authenticated user with
+    the cart already holding the items given as indirect parameter (empty by default), so
+    the setup takes a single navigation. If the site rejects the cached state, the user logs
+    in through the form once and the cart is opened again.
+
+    Args:
+        request (pytest.FixtureRequest): The requesting test context.
+        page (playwright.async_api.Page): A browser page object from the `page` fixture.
+        auth_state_cache (AuthStateCache): The session-wide authenticated state cache.
+
+    Returns:
+        seeded_cart_page (CartPage): The cart page showing the seeded items.
+    """
+    items = getattr(request, "param", None) or []
+    cart_page = CartPage(page)
+    await cart_page.open(items)
+    if await cart_page.is_displayed():
+        logger.info(f"Cart of {config.USER_USERNAME} opened with {items}.")
+    else:
+        await _refresh_login(page, auth_state_cache)
+        await cart_page.open(items)
+        if not await cart_page.is_displayed():
+            raise RuntimeError(f"Cart of {config.USER_USERNAME} not shown after logging in")
+    if config.VALIDATE_SELECTORS:
+        await cart_page.validate_selectors()
+    return cart_page
+
+
+async def _refresh_login(page, auth_state_cache) -> None:
+    auth_state_cache.invalidate(config.USER_USERNAME)
+    new_login_page = LoginPage(page)
+    await new_login_page.navigate(config.URL)
+    await new_login_page.login(config.USER_USERNAME, config.USER_PASSWORD)
+    if not await new_login_page.is_logged_in():
+        raise RuntimeError(f"Login failed for user {config.USER_USERNAME}")
+    auth_state_cache.store(config.USER_USERNAME, await page.context.storage_state())
+    logger.info(f"User {config.USER_USERNAME} logged in again and storage state refreshed.")
+
+
+@pytest.fixture()
+def assert_snapshot(pytestconfig, request, artifact_sink):
+    """
+    Pytest fixture overriding the one from pytest-playwright-visual with the same snapshot
+    layout and `--update-snapshots` option, backed by the process-pooled VisualDiff engine.
+    The returned comparison is a coroutine, so it must be awaited. The images of a mismatch
+    are attached to the Allure report.
+
+    Args:
+        pytestconfig (pytest.Config): The pytest configuration.
+        request (pytest.FixtureRequest): The requesting test context.
+        artifact_sink (ArtifactSink): The session-wide artifact sink.
+
+    Returns:
+        compare (Callable): An async function comparing a PNG screenshot with its snapshot.
+    """
+    test_name = f"{request.node.name}[{sys.platform}]"
+    test_dir = request.node.name.split("[", 1)[0]
+    # Same directory naming as pytest-playwright-visual (including its strip('.py') quirk),
+    # so the existing baselines keep working.
+    test_file_name = request.path.name.strip(".py")
+    snapshot_dir = request.path.parent / "snapshots" / test_file_name / test_dir
+    failures_dir = request.path.parent / "snapshot_tests_failures" / test_file_name / test_name
+
+    async def compare(img: bytes, *, threshold: float = 0.1, name: str = f"{test_name}.png",
+                      fail_fast: bool = False, ignore: list | None = None) -> None:
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        snapshot = snapshot_dir / name
+        if failures_dir.exists():
+            shutil.rmtree(failures_dir)
+        if pytestconfig.getoption("--update-snapshots"):
+            snapshot.write_bytes(img)
+            pytest.fail("--> Snapshots updated. Please review images")
+        if not snapshot.exists():
+            snapshot.write_bytes(img)
+            pytest.fail("--> New snapshot(s) created. Please review images")
+
+        options = DiffOptions(threshold, tuple(ignore or ()), fail_fast,
+                              str(failures_dir / f"Diff_{name}"))
+        result = await VisualDiff.compare(img, str(snapshot), options)
+        logger.info(f"Snapshot {name}: {result.mismatch} mismatched pixels, "
+                    f"hash distance {result.hash_distance}, {result.short_circuit or 'full diff'}")
+        if result.mismatch == 0:
+            return
+
+        failures_dir.mkdir(parents=True, exist_ok=True)
+        (failures_dir / f"Actual_{name}").write_bytes(img)
+        shutil.copyfile(snapshot, failures_dir / f"Expected_{name}")
+        for image in (f"Expected_{name}", f"Actual_{name}", f"Diff_{name}"):
+            if (failures_dir / image).exists():
+                await artifact_sink.attach_file(str(failures_dir / image), image, "png",
+                                                allure.attachment_type.PNG.mime_type)
+        regions = ", ".join(f"{count}px at ({region.x},{region.y})"
+                            for region, count in result.regions)
+        pytest.fail(f"--> Snapshots DO NOT match! {result.mismatch} pixels differ"
+                    f"{': ' + regions if regions else ''}"
+                    f"{' (' + result.short_circuit + ')' if result.short_circuit else ''}")
+
+    return compare
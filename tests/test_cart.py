@@ -7,13 +7,11 @@ import pytest
 import allure
 
 from playwright.async_api import Page
-from axe_playwright_python.async_playwright import Axe
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 from utilities.logger import Logger
 
 
-@pytest.mark.usefixtures("login_page")
 @allure.epic("E-commerce Application")
 class TestCart:
     """
@@ -23,7 +21,6 @@ class TestCart:
     inventory_page: InventoryPage = None
     cart_page: CartPage = None
     page: Page = None
-    axe: Axe = None
     logger: Logger = Logger(__name__)
 
     @pytest.fixture(autouse=True)
@@ -37,9 +34,9 @@ class TestCart:
         self.inventory_page = InventoryPage(page)
         self.cart_page = CartPage(page)
         self.page = page
-        self.axe = Axe()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("authenticated_page")
     @allure.story("Add items and proceed to checkout")
     @allure.description(
         "This test adds items to the cart, proceeds to checkout, and verifies successful checkout.")
@@ -64,30 +61,36 @@ class TestCart:
     @allure.description(
         "This test captures and compares the cart page screenshot for visual regression.")
     @allure.severity(allure.severity_level.NORMAL)
-    async def test_cart_page_visual(self, assert_snapshot):
+    async def test_cart_page_visual(self, assert_snapshot, seeded_cart_page):
         """
-        This test navigates to the shopping cart page and takes a screenshot 
+        This test opens the shopping cart page and takes a screenshot
         to compare with a stored visual snapshot.
 
         Args:
-            assert_snapshot (function): Function that compares screenshots for visual regression.
+            assert_snapshot (function): Async function that compares screenshots for visual
+                                        regression.
+            seeded_cart_page (CartPage): The cart page, opened directly with an empty cart.
         """
         self.logger.info("Starting test: test_cart_page_visual.")
-        await self.inventory_page.click_on_shopping_cart()
-        assert_snapshot(await self.page.screenshot())
+        await assert_snapshot(await seeded_cart_page.page.screenshot())
         self.logger.info("Ending test: test_cart_page_visual.")
 
     @pytest.mark.asyncio
+    @pytest.mark.resource_policy("none")
     @allure.story("Accessibility check for the cart page")
     @allure.description(
         "This test checks the cart page for accessibility violations using the Axe tool.")
     @allure.severity(allure.severity_level.NORMAL)
-    async def test_cart_page_not_have_detectable_accessibility_issues(self):
+    @pytest.mark.usefixtures("seeded_cart_page")
+    async def test_cart_page_not_have_detectable_accessibility_issues(
+            self, accessibility_scanner):
         """
         This test checks the cart page for accessibility violations using the Axe tool.
+
+        Args:
+            accessibility_scanner (AccessibilityScanner): The axe-core scanner with cached results.
         """
         self.logger.info("Starting test: test_cart_page_not_have_detectable_accessibility_issues.")
-        await self.inventory_page.click_on_shopping_cart()
-        results = await self.axe.run(self.page)
+        results = await accessibility_scanner.scan(self.page)
         assert results.violations_count == 0
         self.logger.info("Ending test: test_cart_page_not_have_detectable_accessibility_issues.")
@@ -7,13 +7,12 @@ import allure
 
 
 from playwright.async_api import Page
-from axe_playwright_python.async_playwright import Axe
 from pages.inventory_page import InventoryPage
 from config import config
 from utilities.logger import Logger
 
 
-@pytest.mark.usefixtures("login_page")
+@pytest.mark.usefixtures("authenticated_page")
 @allure.epic("E-commerce Application")
 class TestInventory:
     """
@@ -23,7 +22,6 @@ class TestInventory:
 
     inventory_page: InventoryPage = None
     page: Page = None
-    axe: Axe = None
     inventory_url: str = None
     logger: Logger = Logger(__name__)
 
@@ -37,7 +35,6 @@ class TestInventory:
         """
         self.inventory_page = InventoryPage(page)
         self.page = page
-        self.axe = Axe()
         self.inventory_url = f"{config.URL}/inventory.html"
 
     @pytest.mark.asyncio
@@ -92,25 +89,30 @@ class TestInventory:
         a previously saved snapshot for visual regression testing.
 
         Args:
-            assert_snapshot (function): A function used to assert and compare the 
+            assert_snapshot (function): An async function used to assert and compare the 
                                         current screenshot against the saved snapshot.
         """
         self.logger.info("Starting test: test_inventory_page_visual.")
-        assert_snapshot(await self.page.screenshot())
+        await assert_snapshot(await self.page.screenshot())
         self.logger.info("Ending test: test_inventory_page_visual.")
 
     @pytest.mark.asyncio
+    @pytest.mark.resource_policy("none")
     @allure.story("Accessibility test for inventory page")
     @allure.description(
         "This test checks the inventory page for any accessibility issues using the Axe tool.")
     @allure.severity(allure.severity_level.CRITICAL)
-    async def test_inventory_page_not_have_detectable_accessibility_issues(self):
+    async def test_inventory_page_not_have_detectable_accessibility_issues(
+            self, accessibility_scanner):
         """
         Test to check the inventory page for any accessibility issues using Axe.
+
+        Args:
+            accessibility_scanner (AccessibilityScanner): The axe-core scanner with cached results.
         """
         self.logger.info(
             "Starting test: test_inventory_page_not_have_detectable_accessibility_issues.")
-        results = await self.axe.run(self.page)
+        results = await accessibility_scanner.scan(self.page)
         assert results.violations_count == 0
         self.logger.info(
             "Ending test: test_inventory_page_not_have_detectable_accessibility_issues.")
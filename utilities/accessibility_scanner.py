@@ -0,0 +1,144 @@
+"""
+Module of the AccessibilityScanner class.
+
+axe-core is injected once per browser context through an init script, so every document of the
+context already has it when a scan starts. Scans can be scoped to a region of the page, and
+their results are cached by a fingerprint of the scanned DOM: scanning the same, unchanged page
+again only costs the fingerprint. The duration of every scan is recorded per page so the
+accessibility checks can be budgeted.
+"""
+import json
+import time
+from collections import OrderedDict, defaultdict
+from urllib.parse import urlsplit
+
+from axe_playwright_python.base import AXE_SCRIPT, AxeResults
+from playwright.async_api import BrowserContext, Page
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+DEFAULT_OPTIONS = {"resultTypes": ["violations"]}
+RESULT_CACHE_SIZE = 64
+
+FINGERPRINT_SCRIPT = """
+(selector) => {
+    const scope = selector ? document.querySelector(selector) : document.documentElement;
+    if (!scope) {
+        return null;
+    }
+    const source = [location.href, innerWidth, innerHeight, scope.outerHTML].join("|");
+    let hash = 0x811c9dc5;
+    for (let index = 0; index < source.length; index++) {
+        hash ^= source.charCodeAt(index);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return { fingerprint: `${(hash >>> 0).toString(16)}:${source.length}`,
+             injected: typeof window.axe !== "undefined" };
+}
+"""
+
+RUN_SCRIPT = "([selector, options]) => axe.run(selector || document, options)"
+
+
+class AccessibilityScanner:
+    """
+    Runs axe-core scans with per-context injection, region scoping and result caching.
+    """
+    logger = Logger(__name__)
+    metrics_file = "accessibility-scans.json"
+    metrics_title = "Accessibility scan summary"
+    _results: OrderedDict = OrderedDict()
+
+    def __init__(self, axe_script: str = AXE_SCRIPT):
+        self.axe_script = axe_script
+        self.scans: list[dict] = []
+
+    async def attach(self, context: BrowserContext) -> None:
+        """
+        Injects axe-core into every document of the context before its own scripts run.
+
+        Args:
+            context (BrowserContext): The context whose pages will be scanned.
+        """
+        await context.add_init_script(self.axe_script)
+
+    async def scan(self, page: Page, region: str | None = None,
+                   options: dict | None = None) -> AxeResults:
+        """
+        Runs axe-core against the page, or only the given region of it. Results are reused
+        while the scanned DOM is unchanged. Pages of contexts without the init script get
+        axe-core injected on demand.
+
+        Args:
+            page (Page): The page to scan.
+            region (str, optional): The CSS selector of the region to scan. Defaults to the
+                                    whole document.
+            options (dict, optional): The axe-core run options. Defaults to reporting
+                                      violations only.
+
+        Raises:
+            ValueError: If the region is not on the page.
+
+        Returns:
+            AxeResults: The scan results.
+        """
+        options = DEFAULT_OPTIONS if options is None else options
+        start = time.perf_counter()
+        state = await page.evaluate(FINGERPRINT_SCRIPT, region)
+        if state is None:
+            raise ValueError(f"Accessibility scan region not found: {region}")
+
+        key = (state["fingerprint"], region, json.dumps(options, sort_keys=True))
+        response = self._results.get(key)
+        cached = response is not None
+        if cached:
+            self._results.move_to_end(key)
+        else:
+            if not state["injected"]:
+                self.logger.debug(f"axe-core not injected in {page.url}, injecting it now")
+                await page.evaluate(self.axe_script)
+            response = await page.evaluate(RUN_SCRIPT, [region, options])
+            self._results[key] = response
+            if len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+
+        duration = (time.perf_counter() - start) * 1000
+        target = urlsplit(page.url).path or "/"
+        self.scans.append({"page": target, "region": region or "document",
+                           "cached": cached, "duration_ms": duration})
+        self.logger.info(f"Accessibility scan of {target} ({region or 'document'}) took "
+                         f"{duration:.1f} ms{' from cache' if cached else ''}, "
+                         f"{len(response['violations'])} violations")
+        return AxeResults(response)
+
+    @staticmethod
+    def summarize(scans: list[dict]) -> dict:
+        """
+        Summarizes scan durations per page and region.
+
+        Args:
+            scans (list[dict]): The scan records.
+
+        Returns:
+            dict: The scan count, the cache hits and the per-page distributions in milliseconds.
+        """
+        by_page = defaultdict(list)
+        for scan in scans:
+            by_page[f"{scan['page']} {scan['region']}"].append(scan["duration_ms"])
+        return {
+            "scans": len(scans),
+            "cache_hits": sum(scan["cached"] for scan in scans),
+            "by_page": {page: utils.summarize(durations) for page, durations in by_page.items()},
+        }
+
+    def write_summary(self) -> str:
+        """
+        Writes the summary of this process as JSON to the metrics directory.
+
+        Returns:
+            str: The summary as a JSON string.
+        """
+        return utils.write_metrics(config.METRICS_DIR, self.metrics_file,
+                                   self.summarize(self.scans), scans=self.scans)
@@ -0,0 +1,223 @@
+"""
+Module of the ArtifactSink class.
+
+Attachments are registered with the Allure result of the running test right away, but their
+files are written by a thread pool, off the event loop. Files are named after the SHA-256 of
+their content, so an artifact attached by many tests, devices or workers, such as a baseline
+screenshot, is stored once and referenced by every result. Large text attachments of types
+the Allure report cannot show inline are stored gzip-compressed; JSON, plain text and the
+other types Allure renders keep their type and stay uncompressed. Attachments that would take
+a worker past its share of the report size cap are dropped with a warning.
+
+Naming the files needs a private method of the Allure reporter, so the sink only writes them
+itself with the allure-python-commons version it was checked against. With any other version
+it falls back to the public `allure.attach` API, which writes every attachment synchronously
+and without deduplication.
+"""
+import asyncio
+import gzip
+import hashlib
+import os
+import shutil
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.metadata import version
+from typing import NamedTuple
+
+import allure
+import pytest
+
+from config import config
+from utilities.logger import Logger
+
+TEXT_TYPES = ("text/", "application/json", "application/xml", "application/x-yaml")
+RENDERED_TYPES = frozenset(attachment_type.mime_type for attachment_type in allure.attachment_type)
+HASH_CHUNK_SIZE = 1 << 20
+ALLURE_VERSION = tuple(int(part) for part in version("allure-python-commons").split(".")[:2])
+# The allure-python-commons release whose `AllureReporter._attach` the sink relies on.
+CONTENT_ADDRESSED_VERSION = (2, 16)
+
+
+class SinkLimits(NamedTuple):
+    """
+    The size limits of an artifact sink.
+    """
+    compress_bytes: int
+    budget: int | None
+
+
+class ArtifactSink:
+    """
+    Writes Allure attachments asynchronously, content-addressed and within a size budget.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, pytest_config: pytest.Config, writers: int = config.ARTIFACT_WRITERS,
+                 compress_bytes: int = config.ARTIFACT_COMPRESS_BYTES,
+                 max_mb: int = config.ARTIFACT_MAX_MB):
+        report_dir = pytest_config.getoption("allure_report_dir", None)
+        listener = pytest_config.pluginmanager.get_plugin("allure_listener")
+        self.report_dir = os.path.abspath(report_dir) if report_dir else None
+        self.reporter = listener.allure_logger if listener and report_dir else None
+        workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+        self.limits = SinkLimits(compress_bytes,
+                                 max_mb * 1024 * 1024 // workers if max_mb else None)
+        self.counts: Counter = Counter()
+        self._sources: set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=writers,
+                                            thread_name_prefix="artifact-sink")
+        if self.enabled and not self.content_addressed:
+            self.logger.warning(f"allure-python-commons {'.'.join(map(str, ALLURE_VERSION))} "
+                                "is not supported by the artifact sink, attaching "
+                                "synchronously through the public API")
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether Allure results are being written.
+        """
+        return self.reporter is not None
+
+    @property
+    def content_addressed(self) -> bool:
+        """
+        Whether attachments are deduplicated and written in the background.
+        """
+        return self.enabled and ALLURE_VERSION == CONTENT_ADDRESSED_VERSION
+
+    def attach(self, body: str | bytes, name: str,
+               attachment_type: allure.attachment_type = allure.attachment_type.TEXT) -> None:
+        """
+        Attaches data to the running test and writes it in the background.
+
+        Args:
+            body (str | bytes): The attachment content.
+            name (str): The name shown in the report.
+            attachment_type (allure.attachment_type, optional): The attachment type.
+                                                               Defaults to plain text.
+        """
+        if not self.enabled:
+            return
+        if not self.content_addressed:
+            allure.attach(body, name=name, attachment_type=attachment_type)
+            self.counts["attached"] += 1
+            return
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        digest = hashlib.sha256(data).hexdigest()
+        source = self._register(digest, len(data), name, attachment_type.mime_type,
+                                attachment_type.extension)
+        if source is not None:
+            self._submit(self._write_data, data, source)
+
+    async def attach_file(self, path: str, name: str, extension: str,
+                          mime_type: str | None = None) -> None:
+        """
+        Attaches a file to the running test. The file is hashed and copied in the
+        background, so a large video never blocks the event loop.
+
+        Args:
+            path (str): The file to attach.
+            name (str): The name shown in the report.
+            extension (str): The file extension, e.g. `zip` or `webm`.
+            mime_type (str, optional): The MIME type of the file. Defaults to none.
+        """
+        if not self.enabled:
+            return
+        if not self.content_addressed:
+            allure.attach.file(path, name=name, attachment_type=mime_type, extension=extension)
+            self.counts["attached"] += 1
+            return
+        digest = await asyncio.to_thread(self._hash_file, path)
+        source = self._register(digest, os.path.getsize(path), name, mime_type, extension)
+        if source is not None:
+            self._submit(self._write_file, path, source)
+
+    def close(self) -> None:
+        """
+        Waits for the pending writes and logs what the sink stored.
+        """
+        self._executor.shutdown(wait=True)
+        if self.counts["attached"]:
+            self.logger.info(
+                f"Artifact sink attached {self.counts['attached']} artifacts: "
+                f"{self.counts['deduplicated']} deduplicated, {self.counts['dropped']} dropped "
+                f"over the size cap, {self.counts['bytes_written']} bytes written")
+
+    def _register(self, digest: str, size: int, name: str, mime_type: str | None,
+                  extension: str) -> str | None:
+        compress = size >= self.limits.compress_bytes and mime_type is not None \
+            and mime_type.startswith(TEXT_TYPES) and mime_type not in RENDERED_TYPES
+        if compress:
+            mime_type, extension = "application/gzip", f"{extension}.gz"
+        source = f"{digest}-attachment.{extension}"
+
+        with self._lock:
+            new = source not in self._sources \
+                and not os.path.exists(os.path.join(self.report_dir, source))
+            budget = self.limits.budget
+            if new and budget is not None and self.counts["reserved"] + size > budget:
+                self.counts["dropped"] += 1
+                self.logger.warning(f"Attachment {name} ({size} bytes) dropped, the report "
+                                    f"size cap of {config.ARTIFACT_MAX_MB} MB is reached")
+                return None
+            if new:
+                self.counts["reserved"] += size
+            self._sources.add(source)
+            self.counts["attached"] += 1
+            self.counts["deduplicated"] += not new
+
+        # The reporter names attachment files `<prefix>-attachment.<extension>`; the digest
+        # as prefix points every result with this content at the same file. `_attach` is
+        # private API, only used with CONTENT_ADDRESSED_VERSION, and unlike `allure.attach`
+        # does not call the `report_attached_*` hooks.
+        self.reporter._attach(digest, name=name,  # pylint: disable=protected-access
+                              attachment_type=mime_type, extension=extension)
+        return source if new else None
+
+    def _submit(self, write, *args) -> None:
+        self._executor.submit(write, *args).add_done_callback(self._log_failure)
+
+    def _log_failure(self, future: Future) -> None:
+        exception = future.exception()
+        if exception is not None:
+            self.logger.warning(f"Failed to write an attachment: {str(exception)}")
+
+    def _write_data(self, data: bytes, source: str) -> None:
+        destination = os.path.join(self.report_dir, source)
+        if source.endswith(".gz"):
+            data = gzip.compress(data)
+        self._replace(destination, lambda file: file.write(data))
+
+    def _write_file(self, path: str, source: str) -> None:
+        destination = os.path.join(self.report_dir, source)
+        compress = source.endswith(".gz")
+
+        def copy(file):
+            with open(path, "rb") as original:
+                if not compress:
+                    shutil.copyfileobj(original, file)
+                    return
+                with gzip.GzipFile(fileobj=file, mode="wb") as compressed:
+                    shutil.copyfileobj(original, compressed)
+
+        self._replace(destination, copy)
+
+    def _replace(self, destination: str, write) -> None:
+        if os.path.exists(destination):
+            return
+        temporary = f"{destination}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as file:
+            write(file)
+        os.replace(temporary, destination)
+        with self._lock:
+            self.counts["bytes_written"] += os.path.getsize(destination)
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -0,0 +1,91 @@
+"""
+Module of AuthStateCache class.
+
+Logging in through the UI costs a navigation and several round-trips per test. The cache logs
+each user in once, keeps the resulting `storage_state` (cookies and local storage) and lets
+new contexts start already authenticated.
+"""
+import asyncio
+import time
+
+from drivers.browser_pool import BrowserPool
+from pages.login_page import LoginPage
+from config import config
+from utilities.logger import Logger
+
+
+class AuthStateCache:
+    """
+    Caches the authenticated storage state per user, with expiry and invalidation.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, browser_pool: BrowserPool, ttl: float = config.AUTH_STATE_TTL):
+        self.browser_pool = browser_pool
+        self.ttl = ttl
+        self._states: dict[str, tuple[float, dict]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get_storage_state(self, username: str, password: str) -> dict:
+        """
+        Returns the cached storage state for the user, logging in through the UI first
+        if there is no valid entry.
+
+        Args:
+            username (str): The username to log in with.
+            password (str): The password to log in with.
+
+        Raises:
+            RuntimeError: If the login does not succeed.
+
+        Returns:
+            dict: The storage state to seed new contexts with.
+        """
+        async with self._lock:
+            cached = self._states.get(username)
+            if cached is not None and time.time() < cached[0]:
+                self.logger.debug(f"Using cached storage state for user {username}")
+                return cached[1]
+
+            self.logger.info(f"No valid storage state for user {username}, logging in")
+            state = await self._login(username, password)
+            self.store(username, state)
+            return state
+
+    def store(self, username: str, state: dict) -> None:
+        """
+        Stores a storage state for the user. The entry expires after the configured TTL
+        or when the first session cookie in it expires, whichever comes first.
+
+        Args:
+            username (str): The user the storage state belongs to.
+            state (dict): The storage state captured with `BrowserContext.storage_state()`.
+        """
+        expires_at = time.time() + self.ttl
+        cookie_expiries = [cookie["expires"] for cookie in state.get("cookies", [])
+                           if cookie.get("expires", -1) > 0]
+        if cookie_expiries:
+            expires_at = min(expires_at, *cookie_expiries)
+        self._states[username] = (expires_at, state)
+
+    def invalidate(self, username: str) -> None:
+        """
+        Drops the cached storage state for the user, e.g. after the site rejected it.
+
+        Args:
+            username (str): The user whose storage state should be dropped.
+        """
+        if self._states.pop(username, None) is not None:
+            self.logger.warning(f"Invalidated cached storage state for user {username}")
+
+    async def _login(self, username: str, password: str) -> dict:
+        context = await self.browser_pool.new_context(config.BROWSER)
+        try:
+            login_page = LoginPage(await context.new_page())
+            await login_page.navigate(config.URL)
+            await login_page.login(username, password)
+            if not await login_page.is_logged_in():
+                raise RuntimeError(f"Login failed for user {username}")
+            return await context.storage_state()
+        finally:
+            await self.browser_pool.release_context(context)
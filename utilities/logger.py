@@ -1,12 +1,76 @@
 """
-Module of Logger class.
+Module of Logger class and the shared, queue-backed logging pipeline behind it.
 """
+import atexit
+import gzip
 import logging
+import os
+import queue
+import shutil
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from config import config
 from utilities import utils
 
 
+class LogPipeline:
+    """
+    The single logging pipeline of the process. Loggers only put records on a queue; a
+    background listener thread writes them to the rotating log file, so logging never does
+    disk I/O on the caller's thread (or the asyncio event loop). Rotated files are gzipped.
+    """
+    _handler: QueueHandler | None = None
+    _listener: QueueListener | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_handler(cls) -> QueueHandler:
+        """
+        Returns the queue handler shared by every logger, starting the pipeline on first use.
+
+        Returns:
+            QueueHandler: The handler that enqueues records for the background listener.
+        """
+        with cls._lock:
+            if cls._handler is None:
+                log_path = utils.get_log_path(config.LOG_NAME)
+                os.makedirs(os.path.dirname(log_path), exist_ok=True)
+
+                file_handler = RotatingFileHandler(
+                    log_path, maxBytes=config.LOG_MAX_BYTES,
+                    backupCount=config.LOG_BACKUP_COUNT, encoding="utf-8", delay=True)
+                file_handler.namer = lambda name: f"{name}.gz"
+                file_handler.rotator = cls._compress
+                file_handler.setFormatter(logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+                log_queue = queue.SimpleQueue()
+                cls._listener = QueueListener(log_queue, file_handler)
+                cls._listener.start()
+                atexit.register(cls.stop)
+                cls._handler = QueueHandler(log_queue)
+        return cls._handler
+
+    @classmethod
+    def stop(cls) -> None:
+        """
+        Flushes the queued records to disk and stops the background listener.
+        """
+        with cls._lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                for handler in cls._listener.handlers:
+                    handler.close()
+                cls._listener = None
+
+    @staticmethod
+    def _compress(source: str, dest: str) -> None:
+        with open(source, "rb") as source_file, gzip.open(dest, "wb") as dest_file:
+            shutil.copyfileobj(source_file, dest_file)
+        os.remove(source)
+
+
 class Logger:
     """
     A simple logging class that configures and provides various logging levels.
@@ -16,14 +80,9 @@ class Logger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(config.LOG_LEVEL)
 
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-        file_handler = logging.FileHandler(
-            f"{utils.get_root_path()}/logs/{config.LOG_NAME}")
-        file_handler.setFormatter(formatter)
-
-        self.logger.addHandler(file_handler)
+        handler = LogPipeline.get_handler()
+        if handler not in self.logger.handlers:
+            self.logger.addHandler(handler)
 
     def debug(self, message: str) -> None:
         """
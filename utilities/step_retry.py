@@ -0,0 +1,185 @@
+"""
+Module of the FlakinessLedger class and the retried_step decorator.
+
+Page-object actions called with `idempotent=True` are retried within the same browser context
+when Playwright times out or reports a transient error, such as a detached element or a
+navigation that destroyed the execution context. Each attempt has its own short timeout, with
+a bounded exponential backoff between attempts; other errors are raised at once. Every retry
+is recorded in the flakiness ledger, tagged with the running test, the page-object class, the
+method and the selector, so unstable steps can be ranked. When the retries are exhausted, or
+the context is gone, the action raises `FlakyStepError` and the test fails. Other calls run
+once, with Playwright's default timeout.
+"""
+import asyncio
+import contextvars
+import functools
+
+from playwright.async_api import Error, TimeoutError as PlaywrightTimeoutError
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+TRANSIENT_ERRORS = (
+    "Execution context was destroyed",
+    "is not attached to the DOM",
+    "Element is detached",
+    "net::ERR_ABORTED",
+    "net::ERR_CONNECTION_RESET",
+    "net::ERR_CONNECTION_REFUSED",
+    "net::ERR_NETWORK_CHANGED",
+)
+
+_attempt_timeout: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "attempt_timeout", default=None)
+
+
+class FlakyStepError(RuntimeError):
+    """
+    Raised when a page-object action still fails after its in-context retries.
+    """
+
+    def __init__(self, page_object: str, method: str, target: str, attempts: int,
+                 error: Exception):
+        message = str(error).strip().splitlines()[0] if str(error).strip() else repr(error)
+        super().__init__(
+            f"{page_object}.{method}({target}) failed after {attempts} attempt(s): {message}")
+        self.page_object = page_object
+        self.method = method
+        self.target = target
+        self.attempts = attempts
+
+
+class FlakinessLedger:
+    """
+    Collects the retries of page-object actions for the current process and summarizes them.
+    """
+    logger = Logger(__name__)
+    metrics_file = "flakiness-ledger.json"
+    metrics_title = "Flakiness ledger"
+    records: list[dict] = []
+
+    @classmethod
+    def record(cls, step: dict, attempt: int, error: Exception, retried: bool) -> None:
+        """
+        Records a failed attempt of an action.
+
+        Args:
+            step (dict): The step record of the action, see `utils.step_record`.
+            attempt (int): The number of the failed attempt, starting at 1.
+            error (Exception): The error of the attempt.
+            retried (bool): Whether another attempt follows.
+        """
+        cls.records.append({**step, "attempt": attempt, "error": type(error).__name__,
+                            "retried": retried})
+
+    @staticmethod
+    def summarize(attempts: list[dict]) -> dict:
+        """
+        Summarizes failed attempts per selector, most unstable first.
+
+        Args:
+            attempts (list[dict]): The records of the failed attempts.
+
+        Returns:
+            dict: The number of failed attempts, and per selector the failed attempts, how
+                  many of them were retried, how many exhausted the retries and the tests
+                  they happened in.
+        """
+        by_target: dict[str, dict] = {}
+        for record in attempts:
+            entry = by_target.setdefault(f"{record['method']} {record['target']}", {
+                "page_object": record["page_object"], "failures": 0, "retried": 0,
+                "exhausted": 0, "tests": []})
+            entry["failures"] += 1
+            entry["retried" if record["retried"] else "exhausted"] += 1
+            if record["test"] not in entry["tests"]:
+                entry["tests"].append(record["test"])
+        return {
+            "failed_attempts": len(attempts),
+            "by_selector": dict(sorted(by_target.items(),
+                                       key=lambda item: item[1]["failures"], reverse=True)),
+        }
+
+    @classmethod
+    def write_summary(cls) -> str:
+        """
+        Writes the summary of this process as JSON to the metrics directory.
+
+        Returns:
+            str: The summary as a JSON string.
+        """
+        return utils.write_metrics(config.METRICS_DIR, cls.metrics_file,
+                                   cls.summarize(cls.records), attempts=cls.records)
+
+
+def attempt_timeout() -> float | None:
+    """
+    Returns the timeout of the running attempt of a retried action.
+
+    Returns:
+        float | None: The timeout in milliseconds, or None for Playwright's default outside
+                      retried calls.
+    """
+    return _attempt_timeout.get()
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Checks whether a Playwright error may go away when the action is tried again.
+
+    Args:
+        error (Exception): The error of an attempt.
+
+    Returns:
+        bool: True for timeouts and the known transient errors, False otherwise.
+    """
+    message = str(error)
+    return isinstance(error, PlaywrightTimeoutError) \
+        or any(marker in message for marker in TRANSIENT_ERRORS)
+
+
+def retried_step(method):
+    """
+    Decorates an async page-object action so that calls passing `idempotent=True` are retried
+    within the same context when an attempt times out or fails transiently; other errors are
+    raised at once. The decorator takes the `idempotent` keyword off before calling the
+    method, and calls without it, like clicks that toggle state, run once. The first
+    positional argument is taken as the selector.
+
+    Args:
+        method: The async method to retry.
+
+    Returns:
+        The wrapped method.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, idempotent: bool = False, **kwargs):
+        if not config.STEP_RETRIES or not idempotent:
+            return await method(self, *args, **kwargs)
+
+        page_object = type(self).__name__
+        target = args[0] if args and isinstance(args[0], str) else f"<{method.__name__}>"
+        step = utils.step_record(page_object, method.__name__, target)
+        attempts = config.STEP_RETRIES + 1
+        for attempt in range(1, attempts + 1):
+            token = _attempt_timeout.set(config.STEP_ATTEMPT_TIMEOUT)
+            try:
+                return await method(self, *args, **kwargs)
+            except Error as e:
+                if not is_transient(e):
+                    raise
+                retry = attempt < attempts and not self.page.is_closed()
+                FlakinessLedger.record(step, attempt, e, retry)
+                if not retry:
+                    raise FlakyStepError(page_object, method.__name__, target, attempt,
+                                         e) from e
+            finally:
+                _attempt_timeout.reset(token)
+            backoff = min(config.STEP_RETRY_BACKOFF * 2 ** (attempt - 1),
+                          config.STEP_RETRY_MAX_BACKOFF)
+            FlakinessLedger.logger.warning(
+                f"{page_object}.{method.__name__}({target}) attempt {attempt} failed, "
+                f"retrying in {backoff} ms")
+            await asyncio.sleep(backoff / 1000)
+    return wrapper
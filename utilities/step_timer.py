@@ -0,0 +1,148 @@
+"""
+Module of StepTimer class and the timed_step decorator.
+
+When `STEP_TIMING` is enabled, every decorated page-object action records its duration tagged
+with the running test, the page-object class, the method and the selector (or URL). Navigations
+also record when the page object's readiness strategy was met and when the full `load` event
+fired, so the time saved by not waiting for `load` can be reported per page. At the end of the
+run the records are summarized into p50/p95/max per selector and per page object; the
+controller of a distributed run summarizes the records of all workers together.
+"""
+import functools
+import os
+import time
+from collections import defaultdict
+
+from config import config
+from utilities import utils
+
+
+class StepTimer:
+    """
+    Collects step durations for the current process and summarizes them.
+    """
+    enabled = config.STEP_TIMING
+    metrics_file = "step-timings.json"
+    metrics_title = "Step timing summary"
+    records: list[dict] = []
+    navigations: list[dict] = []
+
+    @classmethod
+    def record(cls, page_object: str, method: str, target: str, duration: float) -> None:
+        """
+        Records the duration of a single step.
+
+        Args:
+            page_object (str): The page-object class that ran the step.
+            method (str): The page-object method.
+            target (str): The selector or URL the step acted on.
+            duration (float): The duration in milliseconds.
+        """
+        cls.records.append(utils.step_record(page_object, method, target, duration_ms=duration))
+
+    @classmethod
+    def record_navigation(cls, page_object: str, url: str, strategy: str, ready: float,
+                          load: float) -> None:
+        """
+        Records when a navigation was ready and when its `load` event fired.
+
+        Args:
+            page_object (str): The page-object class that navigated.
+            url (str): The URL navigated to.
+            strategy (str): The readiness strategy that was honored.
+            ready (float): Milliseconds from the navigation start until the page was ready.
+            load (float): Milliseconds from the navigation start until the end of `load`.
+        """
+        cls.navigations.append({
+            "test": os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0],
+            "page_object": page_object,
+            "url": url,
+            "strategy": strategy,
+            "ready_ms": ready,
+            "load_ms": load,
+            "saved_ms": load - ready,
+        })
+
+    @staticmethod
+    def summarize(steps: list[dict], navigations: list[dict]) -> dict:
+        """
+        Summarizes step records per selector and per page object, slowest first.
+
+        Args:
+            steps (list[dict]): The step records.
+            navigations (list[dict]): The navigation records.
+
+        Returns:
+            dict: The step count, the per-selector and per-page-object distributions in
+                  milliseconds, the ten slowest steps and the time saved by readiness
+                  strategies per page object.
+        """
+        by_target = defaultdict(list)
+        by_page_object = defaultdict(list)
+        for record in steps:
+            by_target[f"{record['method']} {record['target']}"].append(record["duration_ms"])
+            by_page_object[record["page_object"]].append(record["duration_ms"])
+
+        def ranked(groups: dict) -> dict:
+            summaries = {key: utils.summarize(values) for key, values in groups.items()}
+            return dict(sorted(summaries.items(), key=lambda item: item[1]["p95"], reverse=True))
+
+        by_navigation = defaultdict(list)
+        for navigation in navigations:
+            by_navigation[f"{navigation['page_object']} ({navigation['strategy']})"].append(
+                navigation)
+        navigation_summary = {
+            key: {"count": len(navigations),
+                  "ready_p50": utils.percentile([n["ready_ms"] for n in navigations], 50),
+                  "load_p50": utils.percentile([n["load_ms"] for n in navigations], 50),
+                  "saved_p50": utils.percentile([n["saved_ms"] for n in navigations], 50),
+                  "saved_total": sum(n["saved_ms"] for n in navigations)}
+            for key, navigations in by_navigation.items()
+        }
+
+        return {
+            "steps": len(steps),
+            "by_selector": ranked(by_target),
+            "by_page_object": ranked(by_page_object),
+            "slowest": sorted(steps, key=lambda record: record["duration_ms"],
+                              reverse=True)[:10],
+            "navigation_readiness": navigation_summary,
+        }
+
+    @classmethod
+    def write_summary(cls) -> str:
+        """
+        Writes the summary of this process as JSON to the metrics directory.
+
+        Returns:
+            str: The summary as a JSON string.
+        """
+        return utils.write_metrics(config.METRICS_DIR, cls.metrics_file,
+                                   cls.summarize(cls.records, cls.navigations),
+                                   steps=cls.records, navigations=cls.navigations)
+
+
+def timed_step(method):
+    """
+    Decorates an async page-object action so its duration is recorded by StepTimer
+    when step timing is enabled. The first positional argument is taken as the selector.
+
+    Args:
+        method: The async method to time.
+
+    Returns:
+        The wrapped method.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if not StepTimer.enabled:
+            return await method(self, *args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            target = args[0] if args and isinstance(args[0], str) else f"<{method.__name__}>"
+            StepTimer.record(type(self).__name__, method.__name__, target,
+                             (time.perf_counter() - start) * 1000)
+    return wrapper
@@ -0,0 +1,253 @@
+"""
+Module of the HistoryScheduler pytest plugin.
+
+Every run records the duration of each test and the setup state it needs (the login, inventory
+or seeded cart fixtures it uses and its browser × device cell) in the pytest cache. The next run
+uses that history to order tests: tests that need the same state are grouped together, large
+groups are split into chunks of at most one worker's fair share, and chunks run longest first.
+Only the order of the items changes, never their node ids. Under `--dist worksteal` every
+worker starts on a contiguous slice of that order, so it runs tests of the same state back to
+back with the cell's browser running and the user's storage state cached, and an idle worker
+steals from the end of a busy worker's queue, where the shortest tests are. The terminal
+summary compares the makespan expected from the history with the one achieved.
+"""
+import heapq
+import time
+from collections import defaultdict
+
+import pytest
+
+from config import config
+from utilities import utils
+
+HISTORY_KEY = "swag_labs/test_history"
+STATE_PROPERTY = "schedule_state"
+STATE_FIXTURES = ("login_page", "authenticated_page", "seeded_cart_page")
+DEFAULT_DURATION = 1.0
+
+
+class HistoryScheduler:
+    """
+    Orders tests by recorded duration and setup state, and reports the makespan.
+    """
+
+    def __init__(self, pytest_config: pytest.Config):
+        self.config = pytest_config
+        self.history: dict[str, dict] = pytest_config.cache.get(HISTORY_KEY, {})
+        self.results: dict[str, dict] = defaultdict(
+            lambda: {"duration": 0.0, "outcome": None, "state": None})
+        self.worker_busy: dict[str, float] = defaultdict(float)
+        self.expected: float | None = None
+        self.workers = 1
+        self.span: tuple[float, float] | None = None
+
+    @classmethod
+    def install(cls, pytest_config: pytest.Config) -> None:
+        """
+        Registers the scheduler as a plugin when `SCHEDULE_BY_HISTORY` is enabled and the
+        pytest cache, which holds the history, is available.
+
+        Args:
+            pytest_config (pytest.Config): The pytest configuration.
+        """
+        if config.SCHEDULE_BY_HISTORY and hasattr(pytest_config, "cache"):
+            pytest_config.pluginmanager.register(cls(pytest_config), "history_scheduler")
+
+    @staticmethod
+    def state_of(item: pytest.Item) -> str:
+        """
+        Describes the setup state a test needs: its state fixtures, their parameters and its
+        matrix cell.
+
+        Args:
+            item (pytest.Item): The collected test.
+
+        Returns:
+            str: The state key, `stateless` for tests that need none.
+        """
+        params = getattr(item, "callspec", None)
+        parts = []
+        for name in STATE_FIXTURES + ("matrix_cell",):
+            if name not in item.fixturenames:
+                continue
+            value = params.params.get(name) if params else None
+            if name == "matrix_cell" and value is not None:
+                parts.append(value.id)
+            elif name != "matrix_cell":
+                parts.append(name if value is None else f"{name}={value}")
+        return "+".join(parts) or "stateless"
+
+    def estimate(self, nodeid: str) -> float:
+        """
+        Returns the expected duration of a test from its history. Tests without history
+        are expected to take the average of the known ones.
+
+        Args:
+            nodeid (str): The node id of the test.
+
+        Returns:
+            float: The expected duration in seconds.
+        """
+        entry = self.history.get(nodeid)
+        if entry is not None:
+            return entry["duration"]
+        known = [entry["duration"] for entry in self.history.values()]
+        return sum(known) / len(known) if known else DEFAULT_DURATION
+
+    def plan(self, states: dict[str, str], workers: int) -> list[tuple[str, list[str]]]:
+        """
+        Groups the tests by state, splits groups longer than a worker's fair share and
+        orders the chunks, and the tests within them, longest first.
+
+        Args:
+            states (dict[str, str]): The state key of every node id, in collection order.
+            workers (int): The number of workers the tests run on.
+
+        Returns:
+            list[tuple[str, list[str]]]: The chunk names and their node ids, in run order.
+        """
+        by_state = defaultdict(list)
+        for nodeid, state in states.items():
+            by_state[state].append(nodeid)
+        share = sum(self.estimate(nodeid) for nodeid in states) / max(workers, 1)
+
+        chunks = []
+        for state, nodeids in by_state.items():
+            nodeids.sort(key=self.estimate, reverse=True)
+            chunk, load = [], 0.0
+            for nodeid in nodeids:
+                if chunk and load + self.estimate(nodeid) > share:
+                    chunks.append((f"{state}#{len(chunks)}", chunk))
+                    chunk, load = [], 0.0
+                chunk.append(nodeid)
+                load += self.estimate(nodeid)
+            chunks.append((f"{state}#{len(chunks)}", chunk))
+        chunks.sort(key=lambda named: sum(map(self.estimate, named[1])), reverse=True)
+        return chunks
+
+    def expected_makespan(self, chunks: list[list[str]], workers: int) -> float:
+        """
+        Simulates handing the chunks, in order, to whichever worker is free first.
+
+        Args:
+            chunks (list[list[str]]): The node ids of every chunk, in run order.
+            workers (int): The number of workers.
+
+        Returns:
+            float: The expected wall time of the tests in seconds.
+        """
+        loads = [0.0] * max(workers, 1)
+        for chunk in chunks:
+            heapq.heapreplace(loads, loads[0] + sum(map(self.estimate, chunk)))
+        return max(loads)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config,  # pylint: disable=redefined-outer-name
+                                      items: list[pytest.Item]):
+        """
+        Reorders the collected tests by the plan and records every test's state in its user
+        properties, which travel with its reports to the controller.
+
+        Args:
+            config (pytest.Config): The pytest configuration.
+            items (list[pytest.Item]): The collected tests, reordered in place.
+        """
+        workerinput = getattr(config, "workerinput", None)
+        self.workers = workerinput["workercount"] if workerinput else 1
+        states = {item.nodeid: self.state_of(item) for item in items}
+        chunks = self.plan(states, self.workers)
+
+        position = {nodeid: index for index, (_, nodeids) in enumerate(chunks)
+                    for nodeid in nodeids}
+        rank = {nodeid: index for _, nodeids in chunks for index, nodeid in enumerate(nodeids)}
+        items.sort(key=lambda item: (position[item.nodeid], rank[item.nodeid]))
+        for item in items:
+            item.user_properties.append((STATE_PROPERTY, states[item.nodeid]))
+        if workerinput is None:
+            self.expected = self.expected_makespan([nodeids for _, nodeids in chunks], 1)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node,  # pylint: disable=unused-argument
+                                              ids: list[str]):
+        """
+        Computes the expected makespan on the controller from the node ids a worker
+        collected and the states the history recorded for them.
+
+        Args:
+            node: The xdist worker that finished collecting.
+            ids (list[str]): The collected node ids.
+        """
+        if self.expected is not None:
+            return
+        self.workers = int(self.config.getoption("numprocesses", None) or 1)
+        states = {nodeid: self.history.get(nodeid, {}).get("state", nodeid) for nodeid in ids}
+        chunks = self.plan(states, self.workers)
+        self.expected = self.expected_makespan([nodeids for _, nodeids in chunks], self.workers)
+
+    def pytest_runtest_logstart(self, nodeid, location):  # pylint: disable=unused-argument
+        """
+        Marks when the first test started.
+
+        Args:
+            nodeid (str): The node id of the starting test.
+            location (tuple): The file, line and name of the starting test.
+        """
+        if self.span is None:
+            now = time.perf_counter()
+            self.span = (now, now)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport):
+        """
+        Adds up the duration of every test phase per test and per worker.
+
+        Args:
+            report (pytest.TestReport): The report of a test phase.
+        """
+        result = self.results[report.nodeid]
+        result["state"] = dict(report.user_properties).get(STATE_PROPERTY, result["state"])
+        result["duration"] += report.duration
+        node = getattr(report, "node", None)
+        self.worker_busy[node.gateway.id if node else utils.get_worker_id()] += report.duration
+        if result["outcome"] is None and (report.when == "call" or report.outcome != "passed"):
+            result["outcome"] = report.outcome
+        if self.span is not None:
+            self.span = (self.span[0], time.perf_counter())
+
+    def pytest_sessionfinish(self, session: pytest.Session):
+        """
+        Stores the durations and states of the tests that ran, from the controller only.
+
+        Args:
+            session (pytest.Session): The finished test session.
+        """
+        if hasattr(session.config, "workerinput"):
+            return
+        for nodeid, result in self.results.items():
+            if result["outcome"] == "skipped":
+                continue
+            previous = self.history.get(nodeid)
+            self.history[nodeid] = {
+                "duration": result["duration"] if previous is None
+                else (previous["duration"] + result["duration"]) / 2,
+                "state": result["state"] or (previous["state"] if previous else "unknown"),
+            }
+        session.config.cache.set(HISTORY_KEY, self.history)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """
+        Shows the expected and achieved makespan.
+
+        Args:
+            terminalreporter: The terminal reporter.
+        """
+        if self.span is None:
+            return
+        terminalreporter.write_sep("-", "history-aware scheduling")
+        achieved = self.span[1] - self.span[0]
+        expected = "n/a" if self.expected is None else f"{self.expected:.1f} s"
+        terminalreporter.write_line(
+            f"{len(self.results)} tests on {self.workers} worker(s): expected makespan "
+            f"{expected} from history, achieved {achieved:.1f} s")
+        busiest = max(self.worker_busy.items(), key=lambda entry: entry[1])
+        terminalreporter.write_line(
+            f"busiest worker {busiest[0]}: {busiest[1]:.1f} s of test time")
@@ -1,7 +1,12 @@
 """
 Module of all utilities for the project.
 """
+import glob
+import json
+import math
 import os
+import re
+from typing import Callable
 
 
 def get_root_path() -> str:
@@ -15,3 +20,189 @@ def get_root_path() -> str:
     root_path = os.path.dirname(dir_path)
 
     return root_path
+
+
+def get_worker_id() -> str:
+    """
+    Get the id of the pytest-xdist worker running the current process.
+
+    Returns:
+        str: The worker id (e.g. 'gw0'), or 'master' when tests are not distributed.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def get_worker_file_path(directory: str, file_name: str) -> str:
+    """
+    Get the path of a per-process output file under a project directory. Each xdist worker
+    gets its own file (e.g. 'log_file.gw0.log') so parallel runs do not clobber each other.
+
+    Args:
+        directory (str): The directory, relative to the project root.
+        file_name (str): The file name used when tests are not distributed.
+
+    Returns:
+        str: The absolute path of the file.
+    """
+    worker_id = get_worker_id()
+    if worker_id != "master":
+        name, extension = os.path.splitext(file_name)
+        file_name = f"{name}.{worker_id}{extension}"
+
+    return os.path.join(get_root_path(), directory, file_name)
+
+
+def step_record(page_object: str, method: str, target: str, **fields) -> dict:
+    """
+    Get the record of a page-object step, tagged with the running test.
+
+    Args:
+        page_object (str): The page-object class that ran the step.
+        method (str): The page-object method.
+        target (str): The selector or URL the step acted on.
+        **fields: Further fields of the record.
+
+    Returns:
+        dict: The step record.
+    """
+    return {
+        "test": os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0],
+        "page_object": page_object,
+        "method": method,
+        "target": target,
+        **fields,
+    }
+
+
+def get_worker_file_paths(directory: str, file_name: str) -> list[str]:
+    """
+    Get the paths of the per-worker files that xdist workers wrote for a file name.
+
+    Args:
+        directory (str): The directory, relative to the project root.
+        file_name (str): The file name used when tests are not distributed.
+
+    Returns:
+        list[str]: The absolute paths of the existing worker files, in worker order.
+    """
+    name, extension = os.path.splitext(file_name)
+    worker_file = re.compile(rf"{re.escape(name)}\.gw(\d+){re.escape(extension)}")
+    paths = {}
+    for path in glob.glob(os.path.join(get_root_path(), directory, f"{name}.gw*{extension}")):
+        match = worker_file.fullmatch(os.path.basename(path))
+        if match:
+            paths[int(match.group(1))] = path
+    return [paths[worker] for worker in sorted(paths)]
+
+
+def remove_worker_files(directory: str, file_name: str) -> None:
+    """
+    Remove the per-worker files left behind for a file name by an earlier run.
+
+    Args:
+        directory (str): The directory, relative to the project root.
+        file_name (str): The file name used when tests are not distributed.
+    """
+    for path in get_worker_file_paths(directory, file_name):
+        os.remove(path)
+
+
+def write_metrics(directory: str, file_name: str, summary: dict, **records: list) -> str:
+    """
+    Write a run summary as JSON to the metrics file of the current process. The raw records
+    are stored alongside, so the controller of a distributed run can merge the workers'
+    files with `merge_worker_metrics`.
+
+    Args:
+        directory (str): The metrics directory, relative to the project root.
+        file_name (str): The file name used when tests are not distributed.
+        summary (dict): The summary of the records of this process.
+        **records (list): The raw records the summary was built from, by kind.
+
+    Returns:
+        str: The summary as a JSON string.
+    """
+    path = get_worker_file_path(directory, file_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"worker": get_worker_id(), **summary, "records": records}, file, indent=2)
+    return json.dumps(summary, indent=2)
+
+
+def merge_worker_metrics(directory: str, file_name: str,
+                         summarizer: Callable[..., dict]) -> dict | None:
+    """
+    Merge the metrics files of the xdist workers into the file of the whole run. The records
+    of all workers are summarized together, since percentiles cannot be combined.
+
+    Args:
+        directory (str): The metrics directory, relative to the project root.
+        file_name (str): The file name of the whole run.
+        summarizer (Callable[..., dict]): Builds a summary from the records, by kind.
+
+    Returns:
+        dict | None: The merged summary, or None when no worker wrote the file.
+    """
+    workers, records = [], {}
+    for path in get_worker_file_paths(directory, file_name):
+        with open(path, encoding="utf-8") as file:
+            metrics = json.load(file)
+        workers.append(metrics["worker"])
+        for kind, values in metrics["records"].items():
+            records.setdefault(kind, []).extend(values)
+    if not workers:
+        return None
+
+    summary = {"workers": workers, **summarizer(**records)}
+    with open(os.path.join(get_root_path(), directory, file_name), "w",
+              encoding="utf-8") as file:
+        json.dump(summary, file, indent=2)
+    return summary
+
+
+def get_log_path(log_name: str) -> str:
+    """
+    Get the path of the log file for the current process.
+
+    Args:
+        log_name (str): The configured log file name.
+
+    Returns:
+        str: The absolute path of the log file.
+    """
+    return get_worker_file_path("logs", log_name)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Get a percentile of a list of values, interpolating linearly between closest ranks.
+
+    Args:
+        values (list[float]): The values, in any order. Must not be empty.
+        pct (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The requested percentile.
+    """
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values: list[float]) -> dict:
+    """
+    Get the count, p50, p95 and max of a list of durations.
+
+    Args:
+        values (list[float]): The durations. Must not be empty.
+
+    Returns:
+        dict: The distribution summary.
+    """
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values),
+    }
@@ -0,0 +1,268 @@
+"""
+Module of the visual snapshot comparison engine.
+
+Comparisons run in a process pool so decoding and diffing PNGs never stalls the event loop.
+Each worker process keeps an in-memory cache of decoded baselines. Byte-identical images pass
+without decoding. Other images get a vectorized per-pixel YIQ color delta, the metric used by
+pixelmatch, and pixels that pixelmatch's anti-aliasing detection would skip are not counted.
+Ignore masks are honored and mismatches are reported per region (tile). The distance between
+difference hashes of the downsampled images is reported too; a fail-fast comparison reports a
+mismatch from a large hash distance alone, without diffing pixels.
+"""
+import asyncio
+import hashlib
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import NamedTuple
+
+import numpy as np
+from PIL import Image
+
+from config import config
+
+MAX_YIQ_DELTA = 35215
+Y_WEIGHTS = (0.29889531, 0.58662247, 0.11448223)
+I_WEIGHTS = (0.59597799, -0.27417610, -0.32180189)
+Q_WEIGHTS = (0.21147017, -0.52261711, 0.31114694)
+HASH_SIZE = 8
+NEIGHBORS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy)
+BASELINE_CACHE_SIZE = 32
+
+_baselines: OrderedDict = OrderedDict()
+
+
+class Region(NamedTuple):
+    """
+    A rectangular area of an image, in pixels.
+    """
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class DiffOptions(NamedTuple):
+    """
+    How a screenshot is compared: the per-pixel color difference tolerance, between 0 and 1
+    as in pixelmatch, the areas excluded from the comparison, whether a large hash distance
+    alone reports a mismatch, and where to write a diff image when the images differ.
+    """
+    threshold: float = 0.1
+    ignore: tuple[Region, ...] = ()
+    fail_fast: bool = False
+    diff_path: str | None = None
+
+
+class DiffResult(NamedTuple):
+    """
+    The outcome of a snapshot comparison.
+    """
+    mismatch: int
+    hash_distance: int
+    regions: list[tuple[Region, int]]
+    short_circuit: str | None = None
+
+
+class VisualDiff:
+    """
+    Compares screenshots with baseline images in a shared process pool.
+    """
+    _executor: ProcessPoolExecutor | None = None
+
+    @classmethod
+    async def compare(cls, actual: bytes, baseline_path: str,
+                      options: DiffOptions = DiffOptions()) -> DiffResult:
+        """
+        Compares a screenshot with a baseline image without blocking the event loop.
+
+        Args:
+            actual (bytes): The PNG screenshot.
+            baseline_path (str): The path of the baseline PNG.
+            options (DiffOptions, optional): How to compare. Defaults to a 0.1 threshold, no
+                                             ignored areas, no fail-fast and no diff image.
+
+        Returns:
+            DiffResult: The number of mismatched pixels and where they are.
+        """
+        if cls._executor is None:
+            # Forking a process that runs Playwright's and the logging pipeline's threads can
+            # copy a held lock into the child and deadlock it, so the workers are spawned.
+            cls._executor = ProcessPoolExecutor(
+                max_workers=config.VISUAL_DIFF_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"))
+        return await asyncio.get_running_loop().run_in_executor(
+            cls._executor, compare_images, actual, baseline_path, options)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Stops the process pool.
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown()
+            cls._executor = None
+
+
+def compare_images(actual: bytes, baseline_path: str, options: DiffOptions) -> DiffResult:
+    """
+    Compares a PNG screenshot with a baseline PNG. Runs inside a pool worker process.
+
+    Args:
+        actual (bytes): The PNG screenshot.
+        baseline_path (str): The path of the baseline PNG.
+        options (DiffOptions): How to compare.
+
+    Returns:
+        DiffResult: The number of mismatched pixels and where they are.
+    """
+    digest, expected, expected_hash = _load_baseline(baseline_path)
+    if hashlib.sha256(actual).hexdigest() == digest:
+        return DiffResult(0, 0, [], "identical bytes")
+
+    pixels = _decode(actual)
+    if pixels.shape != expected.shape:
+        return DiffResult(pixels.shape[0] * pixels.shape[1], HASH_SIZE * HASH_SIZE,
+                          [], f"size {pixels.shape[1]}x{pixels.shape[0]} != "
+                              f"{expected.shape[1]}x{expected.shape[0]}")
+
+    hash_distance = int(np.count_nonzero(_difference_hash(pixels) != expected_hash))
+    if options.fail_fast and hash_distance > config.VISUAL_DIFF_HASH_DISTANCE:
+        return DiffResult(pixels.shape[0] * pixels.shape[1], hash_distance, [],
+                          f"hash distance {hash_distance}")
+
+    mask = _color_delta(pixels, expected) > MAX_YIQ_DELTA * options.threshold ** 2
+    for region in options.ignore:
+        mask[region.y:region.y + region.height, region.x:region.x + region.width] = False
+    if mask.any():
+        rows, columns = np.nonzero(mask)
+        antialiased = (_antialiased(pixels, expected, rows, columns)
+                       | _antialiased(expected, pixels, rows, columns))
+        mask[rows[antialiased], columns[antialiased]] = False
+
+    mismatch = int(np.count_nonzero(mask))
+    if mismatch and options.diff_path:
+        _write_diff(expected, mask, options.diff_path)
+    return DiffResult(mismatch, hash_distance, _mismatched_regions(mask) if mismatch else [])
+
+
+def _load_baseline(path: str) -> tuple[str, np.ndarray, np.ndarray]:
+    mtime = os.path.getmtime(path)
+    cached = _baselines.get(path)
+    if cached is not None and cached[0] == mtime:
+        _baselines.move_to_end(path)
+        return cached[1]
+
+    with open(path, "rb") as file:
+        data = file.read()
+    pixels = _decode(data)
+    entry = (hashlib.sha256(data).hexdigest(), pixels, _difference_hash(pixels))
+    _baselines[path] = (mtime, entry)
+    if len(_baselines) > BASELINE_CACHE_SIZE:
+        _baselines.popitem(last=False)
+    return entry
+
+
+def _decode(data: bytes) -> np.ndarray:
+    with Image.open(BytesIO(data)) as image:
+        return np.asarray(image.convert("RGBA"), dtype=np.float32)
+
+
+def _difference_hash(pixels: np.ndarray) -> np.ndarray:
+    gray = Image.fromarray(pixels.astype(np.uint8), "RGBA").convert("L")
+    small = np.asarray(gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BILINEAR),
+                       dtype=np.int16)
+    return small[:, 1:] > small[:, :-1]
+
+
+def _blend(pixels: np.ndarray) -> np.ndarray:
+    alpha = pixels[..., 3:4] / 255
+    return 255 + (pixels[..., :3] - 255) * alpha
+
+
+def _color_delta(actual: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    actual_rgb, expected_rgb = _blend(actual), _blend(expected)
+    delta_y = _yiq(actual_rgb, Y_WEIGHTS) - _yiq(expected_rgb, Y_WEIGHTS)
+    delta_i = _yiq(actual_rgb, I_WEIGHTS) - _yiq(expected_rgb, I_WEIGHTS)
+    delta_q = _yiq(actual_rgb, Q_WEIGHTS) - _yiq(expected_rgb, Q_WEIGHTS)
+    return 0.5053 * delta_y ** 2 + 0.299 * delta_i ** 2 + 0.1957 * delta_q ** 2
+
+
+def _yiq(rgb: np.ndarray, weights: tuple[float, float, float]) -> np.ndarray:
+    return rgb[..., 0] * weights[0] + rgb[..., 1] * weights[1] + rgb[..., 2] * weights[2]
+
+
+def _antialiased(pixels: np.ndarray, other: np.ndarray, rows: np.ndarray,
+                 columns: np.ndarray) -> np.ndarray:
+    # pixelmatch's check, vectorized over the given pixels: a pixel is anti-aliased when at
+    # most two of its neighbours share its brightness and its darkest or brightest neighbour
+    # lies in a flat area of both images.
+    brightness = _yiq(_blend(pixels), Y_WEIGHTS)
+    center = brightness[rows, columns]
+    deltas = np.stack([np.where(inside, center - brightness[y, x], np.nan)
+                       for y, x, inside in _neighbors(pixels.shape, rows, columns)])
+    zeroes = _on_edge(pixels.shape, rows, columns) + np.count_nonzero(deltas == 0, axis=0)
+    deltas = np.nan_to_num(deltas)
+    darkest, brightest = deltas.argmin(axis=0), deltas.argmax(axis=0)
+    pixel = np.arange(len(rows))
+    antialiased = (zeroes <= 2) & (deltas[darkest, pixel] < 0) & (deltas[brightest, pixel] > 0)
+
+    return antialiased & (_in_flat_area(pixels, other, rows, columns, darkest)
+                          | _in_flat_area(pixels, other, rows, columns, brightest))
+
+
+def _in_flat_area(pixels: np.ndarray, other: np.ndarray, rows: np.ndarray, columns: np.ndarray,
+                  neighbor: np.ndarray) -> np.ndarray:
+    offsets = np.array(NEIGHBORS)
+    y = np.clip(rows + offsets[neighbor, 1], 0, pixels.shape[0] - 1)
+    x = np.clip(columns + offsets[neighbor, 0], 0, pixels.shape[1] - 1)
+    return _has_many_siblings(pixels, y, x) & _has_many_siblings(other, y, x)
+
+
+def _has_many_siblings(pixels: np.ndarray, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    center = pixels[rows, columns]
+    siblings = _on_edge(pixels.shape, rows, columns)
+    for y, x, inside in _neighbors(pixels.shape, rows, columns):
+        siblings += inside & np.all(pixels[y, x] == center, axis=-1)
+    return siblings > 2
+
+
+def _neighbors(shape: tuple, rows: np.ndarray, columns: np.ndarray):
+    # The clipped coordinates of each of the eight neighbours in pixelmatch's order, and
+    # whether they lie inside the image.
+    height, width = shape[:2]
+    for dx, dy in NEIGHBORS:
+        y, x = rows + dy, columns + dx
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        yield np.clip(y, 0, height - 1), np.clip(x, 0, width - 1), inside
+
+
+def _on_edge(shape: tuple, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    height, width = shape[:2]
+    return ((columns == 0) | (columns == width - 1) | (rows == 0)
+            | (rows == height - 1)).astype(np.int32)
+
+
+def _mismatched_regions(mask: np.ndarray, limit: int = 10) -> list[tuple[Region, int]]:
+    tile = config.VISUAL_DIFF_TILE_SIZE
+    height, width = mask.shape
+    padded = np.zeros((-(-height // tile) * tile, -(-width // tile) * tile), dtype=np.int32)
+    padded[:height, :width] = mask
+    tiles_down, tiles_across = padded.shape[0] // tile, padded.shape[1] // tile
+    counts = padded.reshape((tiles_down, tile, tiles_across, tile)).sum(axis=(1, 3))
+    rows, columns = np.nonzero(counts)
+    order = np.argsort(counts[rows, columns])[::-1][:limit]
+    return [(Region(int(columns[i]) * tile, int(rows[i]) * tile,
+                    min(tile, width - int(columns[i]) * tile),
+                    min(tile, height - int(rows[i]) * tile)),
+             int(counts[rows[i], columns[i]])) for i in order]
+
+
+def _write_diff(expected: np.ndarray, mask: np.ndarray, path: str) -> None:
+    gray = expected[..., :3].mean(axis=2, keepdims=True) * 0.1 + 229
+    diff = np.repeat(gray, 3, axis=2)
+    diff[mask] = (255, 0, 0)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Image.fromarray(diff.astype(np.uint8), "RGB").save(path)